@@ -1,12 +1,19 @@
 """Binder"""
 
-from typing import Callable, NamedTuple, Optional, Union
+from typing import Any, Callable, NamedTuple, Optional, Set, Union
 
-from pyviews.core.binding import Binding, BindingError
+from pyviews.core.binding import BindableRecord, Binding, BindingError
+from pyviews.core.expression import Expression
 from pyviews.core.rendering import InstanceNode, Node, Setter
 from pyviews.core.xml import XmlAttr
 
 
+class ExpressionResult(NamedTuple):
+    """Expression value with bindable keys read during execution"""
+    value: Any
+    records: Set[BindableRecord]
+
+
 class BindingContext(dict):
     """Used as binding arguments passed to binder and rule step"""
 
@@ -28,6 +35,24 @@ class BindingContext(dict):
     def expression_body(self, value: str):
         self['expression_body'] = value
 
+    @property
+    def expression(self) -> Optional[Expression]:
+        """Compiled expression body"""
+        return self.get('expression', None)
+
+    @expression.setter
+    def expression(self, value: Expression):
+        self['expression'] = value
+
+    @property
+    def expression_result(self) -> Optional[ExpressionResult]:
+        """Result of already executed expression"""
+        return self.get('expression_result', None)
+
+    @expression_result.setter
+    def expression_result(self, value: ExpressionResult):
+        self['expression_result'] = value
+
     @property
     def setter(self) -> Setter:
         """Setter"""
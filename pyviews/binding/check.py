@@ -0,0 +1,114 @@
+"""Dirty checking binding"""
+
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+from injectool import resolve
+
+from pyviews.binding.binder import BindingContext
+from pyviews.core.binding import Binding, BindingCallback, BindingError, batch
+from pyviews.core.comparators import equal
+from pyviews.core.error import PyViewsError, error_handling
+from pyviews.core.expression import Expression, evaluate
+from pyviews.core.rendering import NodeGlobals
+
+_NOT_SET = object()
+
+
+class DigestScheduler:
+    """Checks registered bindings for changes on digest() call or on every tick"""
+
+    def __init__(self):
+        self._bindings: Dict['CheckBinding', None] = {}
+        self._schedule: Optional[Callable[[Callable[[], None]], Any]] = None
+        self._tick_id: int = 0
+
+    def __len__(self):
+        return len(self._bindings)
+
+    def add(self, binding: 'CheckBinding'):
+        """Registers binding"""
+        self._bindings[binding] = None
+
+    def remove(self, binding: 'CheckBinding'):
+        """Removes binding"""
+        self._bindings.pop(binding, None)
+
+    def digest(self) -> int:
+        """Evaluates registered bindings and calls callbacks for changed results. Returns count of changed"""
+        changed = 0
+        with batch():
+            for binding in tuple(self._bindings):
+                if binding in self._bindings and binding.check():
+                    changed += 1
+        return changed
+
+    def start(self, schedule: Callable[[Callable[[], None]], Any]):
+        """
+        Runs digest on every tick.
+        schedule is called with callback that should be called on next tick, like lambda tick: root.after(100, tick)
+        """
+        self._tick_id += 1
+        self._schedule = schedule
+        schedule(partial(self._tick, self._tick_id))
+
+    def stop(self):
+        """Stops running digest on ticks"""
+        self._tick_id += 1
+        self._schedule = None
+
+    def _tick(self, tick_id: int):
+        if tick_id != self._tick_id:
+            return
+        try:
+            self.digest()
+        finally:
+            if tick_id == self._tick_id:
+                self._schedule(partial(self._tick, tick_id))
+
+
+class CheckBinding(Binding):
+    """Binds target to expression result. Result is checked for changes by digest scheduler"""
+
+    def __init__(
+        self, callback: BindingCallback, expression: Expression, expr_vars: NodeGlobals, scheduler: DigestScheduler
+    ):
+        super().__init__()
+        self._callback: BindingCallback = callback
+        self._expression: Expression = expression
+        self._vars: NodeGlobals = expr_vars
+        self._scheduler: DigestScheduler = scheduler
+        self._value: Any = _NOT_SET
+
+    def bind(self):
+        self.destroy()
+        self._value = _NOT_SET
+        self.check()
+        self._scheduler.add(self)
+
+    def check(self) -> bool:
+        """Evaluates expression and calls callback if result is changed"""
+        with error_handling(BindingError, self._add_error_info):
+            value = evaluate(self._expression, self._vars)
+            if self._value is not _NOT_SET and equal(value, self._value):
+                return False
+            self._value = value
+            self._callback(value)
+            return True
+
+    def _add_error_info(self, error: PyViewsError):
+        error.add_info('Binding', self)
+        error.add_info('Expression', self._expression.code)
+        error.add_info('Callback', self._callback)
+
+    def destroy(self):
+        self._scheduler.remove(self)
+
+
+def bind_check(context: BindingContext) -> CheckBinding:
+    """Binds setter to expression result that is checked for changes by digest scheduler"""
+    expr = context.expression if context.expression else Expression(context.expression_body)
+    callback = partial(context.setter, context.node, context.xml_attr.name)
+    binding = CheckBinding(callback, expr, context.node.node_globals, resolve(DigestScheduler))
+    binding.bind()
+    return binding
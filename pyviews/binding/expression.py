@@ -1,12 +1,17 @@
 """Expression binding"""
 
+import builtins
+from collections import Counter
 from functools import partial
-from typing import Any, Callable, List, Set, Union
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
-from pyviews.binding.binder import BindingContext
-from pyviews.core.binding import Bindable, BindableRecord, Binding, BindingCallback, BindingError, recording
+from pyviews.binding.binder import BindingContext, ExpressionResult
+from pyviews.core.binding import (Bindable, BindableRecord, Binding, BindingCallback, BindingError, get_versions,
+                                  recording)
 from pyviews.core.error import PyViewsError, error_handling
-from pyviews.core.expression import Expression, execute
+from pyviews.core.expression import Expression, ExpressionError, ExpressionPath, evaluate, execute
+from pyviews.core.path import KeySubscription, PathObserver, get_path_records, is_plain_read
 from pyviews.core.rendering import NodeGlobals
 
 
@@ -19,15 +24,37 @@ class ExpressionBinding(Binding):
         self._expression: Expression = expression
         self._destroy_functions: List[Callable] = []
         self._vars: NodeGlobals = expr_vars
+        self._records: Tuple[BindableRecord, ...] = ()
+        self._versions: Optional[Tuple[int, ...]] = None
 
     def bind(self, execute_callback = True):
         self.destroy()
-        with recording() as records:
-            value = execute(self._expression, self._vars)
+        records = self._get_static_records()
+        if records is None:
+            with recording() as records:
+                value = execute(self._expression, self._vars)
+        else:
+            value = evaluate(self._expression, self._vars)
+        self._apply(ExpressionResult(value, records), execute_callback, get_versions(records))
+
+    def bind_result(self, result: ExpressionResult, execute_callback = True):
+        """Applies binding using value and records of already executed expression"""
+        self.destroy()
+        self._apply(result, execute_callback)
+
+    def _apply(self, result: ExpressionResult, execute_callback: bool, versions: Optional[Tuple[int, ...]] = None):
+        self._records = tuple(result.records)
+        self._versions = versions
         with error_handling(BindingError, self._add_error_info):
-            self._create_dependencies(records)
+            self._create_dependencies(result.records)
         if execute_callback:
-            self._callback(value)
+            self._callback(result.value)
+
+    def _get_static_records(self) -> Optional[Set[BindableRecord]]:
+        paths = self._expression.paths
+        if paths is None:
+            return None
+        return get_path_records(self._vars, paths)
 
     def _create_dependencies(self, records: Set[BindableRecord]):
         for record in records:
@@ -35,8 +62,7 @@ class ExpressionBinding(Binding):
 
     def _subscribe_for_changes(self, inst: Bindable, key: str):
         try:
-            inst.observe(key, self._update_callback)
-            self._destroy_functions.append(partial(inst.release, key, self._update_callback))
+            self._destroy_functions.append(inst.observe(key, self._update_callback).release)
         except KeyError:
             pass
 
@@ -44,7 +70,7 @@ class ExpressionBinding(Binding):
         with error_handling(BindingError, self._add_error_info):
             if isinstance(new_val, Bindable) or isinstance(old_val, Bindable):
                 self.bind()
-            else:
+            elif self._versions != get_versions(self._records):
                 self._execute_callback()
 
     def _add_error_info(self, error: PyViewsError):
@@ -53,7 +79,9 @@ class ExpressionBinding(Binding):
         error.add_info('Callback', self._callback)
 
     def _execute_callback(self):
-        value = execute(self._expression, self._vars)
+        versions = get_versions(self._records)
+        value = evaluate(self._expression, self._vars)
+        self._versions = versions
         self._callback(value)
 
     def destroy(self):
@@ -62,15 +90,116 @@ class ExpressionBinding(Binding):
         self._destroy_functions = []
 
 
-def bind_setter_to_expression(context: BindingContext) -> Binding:
-    """Binds callback to expression result changes"""
-    expr = Expression(context.expression_body)
+class _DynamicRead(Exception):
+    pass
+
+
+class PathBinding(ExpressionBinding):
+    """
+    Binds target to value of attribute and item path like "vm.user.name".
+    Reads value by getters without evaluation and subscribes to every path key.
+    Path keys after changed one are resubscribed on change
+    """
+
+    def __init__(self, callback: BindingCallback, expression: Expression, expr_vars: NodeGlobals):
+        super().__init__(callback, expression, expr_vars)
+        self._observer = _ExpressionPathObserver(self, expr_vars, expression.path)
+
+    def bind(self, execute_callback = True):
+        self.destroy()
+        try:
+            value = self._observer.observe()
+        except _DynamicRead:
+            self.destroy()
+            super().bind(execute_callback)
+            return
+        if execute_callback:
+            self._callback(value)
+
+    def destroy(self):
+        self._observer.release()
+        super().destroy()
+
+
+class _ExpressionPathObserver(PathObserver):
+    """Path observer that reads only plain path keys and raises expression errors"""
+
+    def __init__(self, binding: PathBinding, expr_vars: NodeGlobals, path: ExpressionPath):
+        super().__init__(expr_vars, path, self._path_changed)
+        self._binding: PathBinding = binding
+
+    def _path_changed(self, value: Any, _):
+        self._binding._callback(value) # pylint: disable=protected-access
+
+    def _subscribe_key(self, index: int, inst: Any) -> Optional[KeySubscription]:
+        if not is_plain_read(inst, self._path[index]):
+            raise _DynamicRead()
+        return super()._subscribe_key(index, inst)
+
+    def _read(self, index: int, inst: Any) -> Any:
+        # pylint: disable=protected-access
+        try:
+            return self._getters[index](inst)
+        except BaseException as exc:
+            if index == 0 and isinstance(exc, KeyError) and self._path[0].key in builtins.__dict__:
+                return builtins.__dict__[self._path[0].key]
+            error = ExpressionError('Error occurred in expression execution', self._binding._expression.code)
+            error.cause_error = exc
+            raise error from exc
+
+    def _key_changed(self, index: int, *args):
+        # pylint: disable=protected-access
+        with error_handling(BindingError, self._binding._add_error_info):
+            try:
+                super()._key_changed(index, *args)
+            except _DynamicRead:
+                self._binding.bind()
+
+
+_ELIDED_BINDINGS: Counter = Counter()
+
+
+def bind_setter_to_expression(context: BindingContext) -> Optional[Binding]:
+    """Binds callback to expression result changes. Calls setter once if expression has no reactive inputs"""
+    expr = context.expression if context.expression else Expression(context.expression_body)
     callback = partial(context.setter, context.node, context.xml_attr.name)
-    binding = ExpressionBinding(callback, expr, context.node.node_globals)
-    binding.bind()
+    result = context.expression_result
+    if _is_constant(expr, context.node.node_globals):
+        callback(result.value if result else evaluate(expr, context.node.node_globals))
+        _ELIDED_BINDINGS[context.node.xml_node.view_info.view] += 1
+        return None
+    binding_type = ExpressionBinding if expr.path is None else PathBinding
+    binding = binding_type(callback, expr, context.node.node_globals)
+    if result is None or binding_type is PathBinding:
+        binding.bind()
+    else:
+        binding.bind_result(result)
     return binding
 
 
+def _is_constant(expression: Expression, node_globals: NodeGlobals) -> bool:
+    """Returns true if expression reads only constants and modules"""
+    if expression.paths is None:
+        return False
+    records = get_path_records(node_globals, expression.paths)
+    if records is None:
+        return False
+    return all(
+        record.bindable is node_globals and isinstance(dict.get(node_globals, record.key), ModuleType)
+        for record in records
+    )
+
+
+def get_elided_bindings() -> Dict[str, int]:
+    """Returns count of bindings that are not created for constant expressions by view name"""
+    return dict(_ELIDED_BINDINGS)
+
+
+def reset_elided_bindings():
+    """Resets count of bindings that are not created for constant expressions"""
+    _ELIDED_BINDINGS.clear()
+
+
 def get_expression_callback(expression: Union[str, Expression], expr_vars: NodeGlobals) -> BindingCallback:
     """Returns callback that sets value to property expression"""
     if isinstance(expression, Expression):
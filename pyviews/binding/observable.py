@@ -1,7 +1,10 @@
 """Observable binding"""
 
-from pyviews.core.binding import Bindable, Binding, BindingCallback, BindingError
+from typing import Any, Optional
+
+from pyviews.core.binding import Bindable, Binding, BindingCallback, BindingError, Subscription
 from pyviews.core.error import PyViewsError, error_handling
+from pyviews.core.path import PathObserver, parse_path
 
 
 class ObservableBinding(Binding):
@@ -12,10 +15,11 @@ class ObservableBinding(Binding):
         self._callback = callback
         self._observable = observable
         self._property = observable_property
+        self._subscription: Optional[Subscription] = None
 
     def bind(self):
         self.destroy()
-        self._observable.observe(self._property, self._execute_callback)
+        self._subscription = self._observable.observe(self._property, self._execute_callback)
         self._execute_callback(getattr(self._observable, self._property), None)
 
     def _execute_callback(self, value, _):
@@ -29,4 +33,33 @@ class ObservableBinding(Binding):
         error.add_info('Binding callback', self._callback)
 
     def destroy(self):
-        self._observable.release(self._property, self._execute_callback)
+        if self._subscription is not None:
+            self._subscription.release()
+            self._subscription = None
+
+
+class ObservablePathBinding(Binding):
+    """Binds to value of attribute and item path like "selection.owner.name". Changed path suffix is resubscribed"""
+
+    def __init__(self, callback: BindingCallback, root: Any, path: str):
+        super().__init__()
+        self._callback = callback
+        self._root = root
+        self._path = path
+        self._observer = PathObserver(root, parse_path(path), self._execute_callback)
+
+    def bind(self):
+        self._execute_callback(self._observer.observe(), None)
+
+    def _execute_callback(self, value, _):
+        with error_handling(BindingError, self._add_error_info):
+            self._callback(value)
+
+    def _add_error_info(self, error: PyViewsError):
+        error.add_info('Binding', self)
+        error.add_info('Binding root', self._root)
+        error.add_info('Binding path', self._path)
+        error.add_info('Binding callback', self._callback)
+
+    def destroy(self):
+        self._observer.release()
@@ -1,10 +1,14 @@
 """Once binding"""
 
 from pyviews.binding.binder import BindingContext
-from pyviews.core.expression import execute
+from pyviews.core.expression import Expression, evaluate
 
 
 def run_once(context: BindingContext):
     """Calls setter with expression value"""
-    value = execute(context.expression_body, context.node.node_globals)
+    if context.expression_result is not None:
+        value = context.expression_result.value
+    else:
+        expression = context.expression if context.expression else Expression(context.expression_body)
+        value = evaluate(expression, context.node.node_globals)
     context.setter(context.node, context.xml_attr.name, value)
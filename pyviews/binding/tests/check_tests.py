@@ -0,0 +1,148 @@
+from dataclasses import dataclass
+from unittest.mock import Mock, call
+
+from injectool import add_singleton
+from pytest import fixture, mark, raises
+
+from pyviews.binding.binder import BindingContext
+from pyviews.binding.check import CheckBinding, DigestScheduler, bind_check
+from pyviews.core.binding import BindableEntity
+from pyviews.core.expression import Expression, ExpressionError
+from pyviews.core.rendering import NodeGlobals
+from pyviews.core.xml import XmlAttr
+
+
+@dataclass
+class Row:
+    name: str
+    amount: int
+
+
+@fixture
+def check_binding_fixture(request):
+    request.cls.row = Row('row', 1)
+    request.cls.callback = Mock()
+    request.cls.scheduler = DigestScheduler()
+    request.cls.binding = CheckBinding(request.cls.callback, Expression('row.amount * 2'),
+                                       NodeGlobals({'row': request.cls.row}), request.cls.scheduler)
+    request.cls.binding.bind()
+
+
+@mark.usefixtures('check_binding_fixture')
+class CheckBindingTests:
+    """CheckBinding tests"""
+
+    row: Row
+    callback: Mock
+    scheduler: DigestScheduler
+    binding: CheckBinding
+
+    def test_bind(self):
+        """bind() should call callback and register binding"""
+        assert self.callback.call_args_list == [call(2)]
+        assert len(self.scheduler) == 1
+
+    def test_digest_changed(self):
+        """digest() should call callback if expression result is changed"""
+        self.row.amount = 2
+
+        changed = self.scheduler.digest()
+
+        assert changed == 1
+        assert self.callback.call_args_list == [call(2), call(4)]
+
+    def test_digest_not_changed(self):
+        """digest() should not call callback if expression result is not changed"""
+        self.row.name = 'new name'
+
+        changed = self.scheduler.digest()
+
+        assert changed == 0
+        assert self.callback.call_args_list == [call(2)]
+
+    def test_destroy(self):
+        """destroy() should remove binding from scheduler"""
+        self.binding.destroy()
+        self.row.amount = 2
+
+        self.scheduler.digest()
+
+        assert len(self.scheduler) == 0
+        assert self.callback.call_args_list == [call(2)]
+
+    def test_raises_error(self):
+        """digest() should raise error if expression fails"""
+        self.row.amount = None
+
+        with raises(ExpressionError):
+            self.scheduler.digest()
+
+
+class DigestSchedulerTests:
+    """DigestScheduler tests"""
+
+    @staticmethod
+    def test_batches_changes():
+        """digest() should notify bindable changes made by callbacks after all bindings are checked"""
+        row, target, callback = Row('row', 1), BindableEntity(), Mock()
+        target.amount, target.double = 0, 0
+        target.observe('amount', lambda *_: callback(target.amount, target.double))
+        scheduler = DigestScheduler()
+        node_globals = NodeGlobals({'row': row})
+        CheckBinding(lambda value: setattr(target, 'amount', value), Expression('row.amount'), node_globals,
+                     scheduler).bind()
+        CheckBinding(lambda value: setattr(target, 'double', value), Expression('row.amount * 2'), node_globals,
+                     scheduler).bind()
+        row.amount = 2
+
+        scheduler.digest()
+
+        assert callback.call_args_list == [call(1, 0), call(2, 4)]
+
+    @staticmethod
+    def test_ticks():
+        """start() should run digest on every tick until stop() is called"""
+        scheduler, ticks, callback = DigestScheduler(), [], Mock()
+        row = Row('row', 1)
+        CheckBinding(callback, Expression('row.amount'), NodeGlobals({'row': row}), scheduler).bind()
+
+        scheduler.start(ticks.append)
+        row.amount = 2
+        ticks.pop()()
+        row.amount = 3
+        scheduler.stop()
+        ticks.pop()()
+
+        assert callback.call_args_list == [call(1), call(2)]
+        assert not ticks
+
+    @staticmethod
+    def test_restart():
+        """start() should stop previous ticks"""
+        scheduler, ticks = DigestScheduler(), []
+
+        scheduler.start(ticks.append)
+        scheduler.start(ticks.append)
+        ticks.pop(0)()
+
+        assert len(ticks) == 1
+
+
+@mark.usefixtures('container_fixture')
+def test_bind_check():
+    """bind_check() should create binding registered in digest scheduler"""
+    scheduler, setter = DigestScheduler(), Mock()
+    add_singleton(DigestScheduler, scheduler)
+    node = Mock(node_globals = NodeGlobals({'row': Row('row', 1)}))
+    xml_attr = XmlAttr('name')
+
+    binding = bind_check(BindingContext({
+        'node': node,
+        'expression_body': 'row.name',
+        'setter': setter,
+        'xml_attr': xml_attr
+    })) # yapf: disable
+
+    assert isinstance(binding, CheckBinding)
+    assert len(scheduler) == 1
+    assert setter.call_args == call(node, xml_attr.name, 'row')
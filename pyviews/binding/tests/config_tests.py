@@ -2,6 +2,7 @@ from injectool import resolve
 from pytest import mark
 
 from pyviews.binding.binder import Binder
+from pyviews.binding.check import DigestScheduler
 from pyviews.binding.config import use_binding
 
 
@@ -14,6 +15,7 @@ class UseBindingTests:
         use_binding()
 
         assert isinstance(resolve(Binder), Binder)
+        assert isinstance(resolve(DigestScheduler), DigestScheduler)
 
     @staticmethod
     def test_registers_passed_binder():
@@ -36,3 +38,4 @@ class UseBindingTests:
         assert 'oneway' in binder._rules
         assert 'inline' in binder._rules
         assert 'inject' in binder._rules
+        assert 'check' in binder._rules
@@ -1,14 +1,18 @@
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
 
 from pytest import fixture, mark
 
+from pyviews.binding import expression as expression_module
 from pyviews.binding.binder import BindingContext
-from pyviews.binding.expression import ExpressionBinding, bind_setter_to_expression, get_expression_callback
+from pyviews.binding.expression import (ExpressionBinding, PathBinding, bind_setter_to_expression,
+                                        get_elided_bindings, get_expression_callback, reset_elided_bindings)
 from pyviews.binding.tests.common import InnerViewModel, ParentViewModel
-from pyviews.core.binding import BindableDict
+from pyviews.core.binding import BindableDict, BindableEntity, batch, observable, use_comparator
+from pyviews.core.comparators import always_changed
 from pyviews.core.expression import Expression, execute
+from pyviews.core.error import ViewInfo
 from pyviews.core.rendering import NodeGlobals
-from pyviews.core.xml import XmlAttr
+from pyviews.core.xml import XmlAttr, XmlNode
 
 
 @fixture
@@ -143,6 +147,250 @@ class ExpressionBindingTests:
         assert not self.callback.called
 
 
+class PropertyViewModel(BindableEntity):
+
+    def __init__(self, inner_vm):
+        super().__init__()
+        self.inner_vm = inner_vm
+
+    @property
+    def inner_value(self):
+        return self.inner_vm.int_value
+
+
+@mark.usefixtures('expression_binding_fixture')
+class ExpressionBindingDependenciesTests:
+    """ExpressionBinding dependencies tests"""
+
+    callback: Mock
+
+    @mark.parametrize('source', ['vm.int_value', 'vm.int_value + 1', '(vm.int_value, vm.str_value)'])
+    def test_static_dependencies(self, source):
+        """bind() should subscribe to expression paths without recording"""
+        global_vars = NodeGlobals({'vm': InnerViewModel(0, '')})
+        binding = ExpressionBinding(self.callback, Expression(source), global_vars)
+        with patch(expression_module.__name__ + '.recording') as recording_mock:
+            binding.bind()
+
+            global_vars['vm'].int_value = 3
+
+        assert not recording_mock.called
+        assert self.callback.call_args == call(execute(Expression(source), global_vars))
+
+    @mark.parametrize('source, expected', [
+        ('f"{vm.user}"', ['first', '']),
+        ('"yes" if vm.user else "no"', ['yes', 'no'])
+    ]) # yapf: disable
+    def test_records_custom_value_reads(self, source, expected):
+        """bind() should record dependencies read by custom methods of path value like __str__ or __bool__"""
+        view_model = UserViewModel(User('first'))
+        ExpressionBinding(self.callback, Expression(source), NodeGlobals({'vm': view_model})).bind()
+
+        view_model.user.name = ''
+
+        assert self.callback.call_args_list == [call(value) for value in expected]
+
+    def test_entity_undeclared_dependencies(self):
+        """bind() should subscribe to undeclared attribute of entity with declared properties"""
+        view_model = CountViewModel(1)
+        ExpressionBinding(self.callback, Expression('str(vm.count)'), NodeGlobals({'vm': view_model})).bind()
+
+        view_model.count = 2
+
+        assert self.callback.call_args_list == [call('1'), call('2')]
+
+    def test_skips_unchanged_dependencies(self):
+        """callback should not be called if dependency versions are not changed since last evaluation"""
+        view_model = InnerViewModel(0, '')
+        view_model.observe('int_value', lambda *_: setattr(view_model, 'str_value', 'changed'))
+        expression = Expression('(vm.int_value, vm.str_value)')
+        ExpressionBinding(self.callback, expression, NodeGlobals({'vm': view_model})).bind()
+
+        view_model.int_value = 1
+
+        assert self.callback.call_args_list == [call((0, '')), call((1, 'changed'))]
+
+    def test_batch(self):
+        """callback should be called once for changes made in batch"""
+        view_model = InnerViewModel(0, '')
+        expression = Expression('(vm.int_value, vm.str_value)')
+        ExpressionBinding(self.callback, expression, NodeGlobals({'vm': view_model})).bind()
+
+        with batch():
+            view_model.int_value = 1
+            view_model.str_value = 'one'
+            view_model.int_value = 2
+
+        assert self.callback.call_args_list == [call((0, '')), call((2, 'one'))]
+
+    def test_dynamic_dependencies(self):
+        """bind() should record dependencies if expression path reads property"""
+        global_vars = NodeGlobals({'vm': PropertyViewModel(InnerViewModel(0, ''))})
+        binding = ExpressionBinding(self.callback, Expression('vm.inner_value'), global_vars)
+        binding.bind()
+
+        global_vars['vm'].inner_vm.int_value = 3
+
+        assert self.callback.call_args == call(3)
+
+
+class User(BindableEntity):
+
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+
+    def __str__(self):
+        return self.name
+
+    def __bool__(self):
+        return bool(self.name)
+
+
+class UserViewModel(BindableEntity):
+
+    def __init__(self, user):
+        super().__init__()
+        self.user = user
+
+
+class CountViewModel(BindableEntity):
+
+    title = observable()
+
+    def __init__(self, count):
+        super().__init__()
+        self.count = count
+
+
+@use_comparator(always_changed, 'rows')
+class RowsViewModel(BindableEntity):
+
+    def __init__(self, rows):
+        super().__init__()
+        self.rows = rows
+
+
+class ValueViewModel(BindableEntity):
+
+    def __init__(self, inner_value):
+        super().__init__()
+        self.inner_value = inner_value
+
+
+@mark.usefixtures('expression_binding_fixture')
+class PathBindingTests:
+    """PathBinding tests"""
+
+    callback: Mock
+
+    def _bind(self, source: str, global_vars: NodeGlobals) -> PathBinding:
+        binding = PathBinding(self.callback, Expression(source), global_vars)
+        binding.bind()
+        return binding
+
+    @mark.parametrize('source, global_dict, expected', [
+        ('vm', {'vm': 1}, 1),
+        ('vm.int_value', {'vm': InnerViewModel(2, '')}, 2),
+        ('vm.inner_vm.str_value', {'vm': ParentViewModel(0, InnerViewModel(0, 'value'))}, 'value'),
+        ("vms[0].int_value", {'vms': [InnerViewModel(3, '')]}, 3),
+        ("vms['key'].int_value", {'vms': BindableDict({'key': InnerViewModel(4, '')})}, 4),
+        ('str', {}, str)
+    ]) # yapf: disable
+    def test_initialize_target(self, source: str, global_dict: dict, expected):
+        """bind() should call callback with path value"""
+        self._bind(source, NodeGlobals(global_dict))
+
+        assert self.callback.call_args == call(expected)
+
+    def test_same_value_changed(self):
+        """callback should be called if key comparator treats assigned same value as changed"""
+        rows = [1]
+        view_model = RowsViewModel(rows)
+        self._bind('vm.rows', NodeGlobals({'vm': view_model}))
+
+        view_model.rows = rows
+
+        assert self.callback.call_args_list == [call(rows), call(rows)]
+
+    @mark.parametrize('source, global_dict, change, expected', [
+        ('vm', {'vm': 1}, lambda gl: gl.__setitem__('vm', 2), 2),
+        ('vm.int_value', {'vm': InnerViewModel(0, '')}, lambda gl: setattr(gl['vm'], 'int_value', 3), 3),
+        ('vm.inner_vm.int_value', {'vm': ParentViewModel(0, InnerViewModel(0, ''))},
+         lambda gl: setattr(gl['vm'], 'inner_vm', InnerViewModel(5, 'updated')), 5),
+        ('vm.inner_vm.str_value', {'vm': ParentViewModel(0, InnerViewModel(0, ''))},
+         lambda gl: setattr(gl['vm'].inner_vm, 'str_value', 'asdf'), 'asdf'),
+        ('vms[0].int_value', {'vms': [InnerViewModel(0, '')]},
+         lambda gl: setattr(gl['vms'][0], 'int_value', 3), 3),
+        ("vms['key'].int_value", {'vms': BindableDict({'key': InnerViewModel(0, '')})},
+         lambda gl: gl['vms'].__setitem__('key', InnerViewModel(6, '')), 6)
+    ]) # yapf: disable
+    def test_path_changed(self, source: str, global_dict: dict, change, expected):
+        """callback should be called with new value after path key is changed"""
+        global_vars = NodeGlobals(global_dict)
+        self._bind(source, global_vars)
+
+        change(global_vars)
+
+        assert self.callback.call_args_list[1:] == [call(expected)]
+
+    def test_resubscribes_changed_path(self):
+        """should subscribe to new instance and release previous instance after path key is changed"""
+        old_inner, new_inner = InnerViewModel(0, ''), InnerViewModel(1, '')
+        global_vars = NodeGlobals({'vm': ParentViewModel(0, old_inner)})
+        self._bind('vm.inner_vm.int_value', global_vars)
+        global_vars['vm'].inner_vm = new_inner
+        self.callback.reset_mock()
+
+        old_inner.int_value = 5
+        new_inner.int_value = 6
+
+        assert self.callback.call_args_list == [call(6)]
+
+    def test_skips_unchanged_path(self):
+        """callback should not be called if path versions are not changed since last read"""
+        old_inner, new_inner = InnerViewModel(0, ''), InnerViewModel(1, '')
+        global_vars = NodeGlobals({'vm': ParentViewModel(0, old_inner)})
+        old_inner.observe('int_value', lambda *_: setattr(global_vars['vm'], 'inner_vm', new_inner))
+        self._bind('vm.inner_vm.int_value', global_vars)
+
+        old_inner.int_value = 5
+
+        assert self.callback.call_args_list == [call(0), call(1)]
+
+    def test_destroy(self):
+        """destroy() should release all path keys"""
+        global_vars = NodeGlobals({'vm': ParentViewModel(0, InnerViewModel(0, ''))})
+        binding = self._bind('vm.inner_vm.int_value', global_vars)
+        self.callback.reset_mock()
+
+        binding.destroy()
+        global_vars['vm'].inner_vm.int_value = 2
+        global_vars['vm'].inner_vm = InnerViewModel(3, '')
+        global_vars['vm'] = ParentViewModel(0, InnerViewModel(4, ''))
+
+        assert not self.callback.called
+
+    def test_dynamic_read(self):
+        """should record dependencies if path reads property"""
+        global_vars = NodeGlobals({'vm': PropertyViewModel(InnerViewModel(0, ''))})
+        self._bind('vm.inner_value', global_vars)
+
+        global_vars['vm'].inner_vm.int_value = 3
+
+        assert self.callback.call_args == call(3)
+
+    def test_dynamic_read_after_change(self):
+        """should record dependencies if changed path reads property"""
+        global_vars = NodeGlobals({'vm': ParentViewModel(0, ValueViewModel(0))})
+        self._bind('vm.inner_vm.inner_value', global_vars)
+        global_vars['vm'].inner_vm = PropertyViewModel(InnerViewModel(1, ''))
+
+        global_vars['vm'].inner_vm.inner_vm.int_value = 3
+
+        assert self.callback.call_args_list[1:] == [call(1), call(3)]
+
+
 @fixture
 def binding_context_fixture(request):
     setter, xml_attr = Mock(), XmlAttr('name')
@@ -173,12 +421,64 @@ class BindSetterToExpressionTests:
 
         assert self.context.setter.call_args == call(self.context.node, self.context.xml_attr.name, 2)
 
-    def test_returns_binding(self):
+    @mark.parametrize('body, binding_type', [
+        ('value', PathBinding),
+        ('value.real', PathBinding),
+        ('value + 1', ExpressionBinding),
+        ('str(value)', ExpressionBinding)
+    ]) # yapf: disable
+    def test_returns_binding(self, body, binding_type):
         """should return expression binding"""
+        self.context.node = Mock(node_globals = NodeGlobals({'value': 1}))
+        self.context.expression_body = body
+
+        actual = bind_setter_to_expression(self.context)
+
+        assert isinstance(actual, binding_type)
+
+    @mark.parametrize('body, node_globals, value', [
+        ('1+1', {}, 2),
+        ("'left'", {}, 'left'),
+        ('None', {}, None),
+        ('(1, [2])', {}, (1, [2])),
+        ('os.sep', {'os': __import__('os')}, __import__('os').sep),
+    ]) # yapf: disable
+    def test_constant_expression(self, body, node_globals, value):
+        """should call setter once and not create binding for expression without reactive inputs"""
+        self.context.node = Mock(node_globals = NodeGlobals(node_globals))
+        self.context.expression_body = body
+
+        actual = bind_setter_to_expression(self.context)
+
+        assert actual is None
+        assert self.context.setter.call_args == call(self.context.node, self.context.xml_attr.name, value)
+
+    @mark.parametrize('body, node_globals', [
+        ('value', {'value': 1}),
+        ('vm.int_value', {'vm': InnerViewModel(1, '')}),
+        ('str(1)', {}),
+    ]) # yapf: disable
+    def test_not_constant_expression(self, body, node_globals):
+        """should create binding for expression with reactive inputs"""
+        self.context.node = Mock(node_globals = NodeGlobals(node_globals))
+        self.context.expression_body = body
+
         actual = bind_setter_to_expression(self.context)
 
         assert isinstance(actual, ExpressionBinding)
 
+    def test_counts_elided_bindings(self):
+        """should count not created bindings by view"""
+        reset_elided_bindings()
+        xml_node = XmlNode('', '', view_info = ViewInfo('view', 1))
+        self.context.node = Mock(node_globals = NodeGlobals(), xml_node = xml_node)
+
+        bind_setter_to_expression(self.context)
+        bind_setter_to_expression(self.context)
+
+        assert get_elided_bindings() == {'view': 2}
+        reset_elided_bindings()
+
 @mark.parametrize('node_globals, expression, value, is_updated', [
     ({}, 'key', 2, lambda g: g['key'] == 2),
     ({'vm': ParentViewModel(1, None)}, 'vm.int_value', 2, lambda g: g['vm'].int_value == 2),
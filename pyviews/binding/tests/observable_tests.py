@@ -1,9 +1,10 @@
 from functools import partial
+from unittest.mock import Mock, call
 
 from pytest import fixture, mark
 
-from pyviews.binding.observable import ObservableBinding
-from pyviews.binding.tests.common import InnerViewModel
+from pyviews.binding.observable import ObservableBinding, ObservablePathBinding
+from pyviews.binding.tests.common import InnerViewModel, ParentViewModel
 
 
 @fixture
@@ -48,3 +49,32 @@ class ObservableBindingTests:
         self.inst.int_value = self.inst.int_value + 2
 
         assert self.target_inst.int_value == old_value
+
+
+class ObservablePathBindingTests:
+    """ObservablePathBinding tests"""
+
+    @staticmethod
+    def test_binding():
+        """callback should be called with path value on bind() call and after path is changed"""
+        root, callback = ParentViewModel(0, InnerViewModel(1, '')), Mock()
+        binding = ObservablePathBinding(callback, root, 'inner_vm.int_value')
+
+        binding.bind()
+        root.inner_vm = InnerViewModel(2, '')
+        root.inner_vm.int_value = 3
+
+        assert callback.call_args_list == [call(1), call(2), call(3)]
+
+    @staticmethod
+    def test_destroy():
+        """destroy() should stop handling path changes"""
+        root, callback = ParentViewModel(0, InnerViewModel(1, '')), Mock()
+        binding = ObservablePathBinding(callback, root, 'inner_vm.int_value')
+        binding.bind()
+
+        binding.destroy()
+        root.inner_vm.int_value = 2
+        root.inner_vm = InnerViewModel(3, '')
+
+        assert callback.call_args_list == [call(1)]
@@ -2,7 +2,7 @@ from typing import Any, List, NamedTuple, Optional, Union
 
 from pyviews.binding.expression import ExpressionBinding
 from pyviews.core.binding import Binding
-from pyviews.core.expression import Expression, execute, is_expression, parse_expression
+from pyviews.core.expression import Expression, execute, parse_attr_value
 from pyviews.core.rendering import Node, NodeGlobals, RenderingContext, Setter
 from pyviews.core.xml import XmlNode
 from pyviews.pipes import get_setter
@@ -44,9 +44,10 @@ def get_binding_pipeline() -> RenderingPipeline:
 def apply_attributes(node: BindingNode, _: RenderingContext):
     """Rendering pipe: records attributes to bind"""
     for attr in node.xml_node.attrs:
+        binding = attr.binding if attr.binding is not None else parse_attr_value(attr.value)
         value = attr.value.strip() if attr.value else ''
-        if is_expression(value):
-            value = Expression(parse_expression(value)[1])
+        if binding.binding_type is not None:
+            value = binding.expression if binding.expression is not None else Expression(binding.body)
         if attr.name == 'when_changed':
             node.when_changed = value
         elif attr.name == 'when_true':
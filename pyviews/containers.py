@@ -1,7 +1,9 @@
 """Contains methods for node setups creation"""
-from typing import Any, Optional
+from typing import Any, List, Optional
 
-from pyviews.core.binding import Bindable
+from pyviews.core.binding import Bindable, Subscription, observable
+from pyviews.core.comparators import identical
+from pyviews.core.lists import BindableList, ListAction, ListChange
 from pyviews.core.rendering import Node, NodeGlobals, RenderingContext
 from pyviews.core.xml import XmlNode
 from pyviews.pipes import apply_attributes, render_children
@@ -26,21 +28,11 @@ def render_container_children(node, context: RenderingContext):
 class View(Container, Bindable):
     """Loads xml from another file"""
 
+    name: Optional[str] = observable()
+
     def __init__(self, xml_node: XmlNode, node_globals: Optional[NodeGlobals] = None):
         Bindable.__init__(self)
         Container.__init__(self, xml_node, node_globals = node_globals)
-        self._name: Optional[str] = None
-
-    @property
-    def name(self) -> Optional[str]:
-        """Returns view name"""
-        return self._name
-
-    @name.setter
-    def name(self, value: Optional[str]):
-        old_name = self._name
-        self._name = value
-        self._notify('name', value, old_name)
 
 
 def get_view_pipeline() -> RenderingPipeline:
@@ -71,21 +63,19 @@ def _rerender_view(node: View, context: RenderingContext):
 class For(Container, Bindable):
     """Renders children for every item in items collection"""
 
+    items: list = observable(comparator = identical)
+
     def __init__(self, xml_node: XmlNode, node_globals: Optional[NodeGlobals] = None):
         Bindable.__init__(self)
         Container.__init__(self, xml_node, node_globals = node_globals)
-        self._items = []
-
-    @property
-    def items(self):
-        """Returns items"""
-        return self._items
+        self.items = []
+        self._items_subscription: Optional[Subscription] = None
 
-    @items.setter
-    def items(self, value):
-        old_items = self._items
-        self._items = value
-        self._notify('items', value, old_items)
+    def destroy(self):
+        if self._items_subscription is not None:
+            self._items_subscription.release()
+            self._items_subscription = None
+        super().destroy()
 
 
 def get_for_pipeline() -> RenderingPipeline:
@@ -101,12 +91,17 @@ def render_for_items(node: For, context: RenderingContext):
 
 
 def _render_for_children(node: For, items: list, context: RenderingContext, index_shift = 0):
+    for child in _render_items(node, items, context, index_shift):
+        node.add_child(child)
+
+
+def _render_items(node: For, items: list, context: RenderingContext, index_shift = 0) -> List[Node]:
     item_xml_nodes = node.xml_node.children
-    for index, item in enumerate(items):
-        for xml_node in item_xml_nodes:
-            child_context = _get_for_child_args(xml_node, index + index_shift, item, node, context)
-            child = render(child_context)
-            node.add_child(child)
+    return [
+        render(_get_for_child_args(xml_node, index + index_shift, item, node, context))
+        for index, item in enumerate(items)
+        for xml_node in item_xml_nodes
+    ]
 
 
 def _get_for_child_args(xml_node: XmlNode, index: int, item: Any, parent_node: For, context: RenderingContext):
@@ -118,11 +113,62 @@ def _get_for_child_args(xml_node: XmlNode, index: int, item: Any, parent_node: F
 
 
 def rerender_on_items_change(node: For, context: RenderingContext):
-    """Subscribes to items change and updates children"""
+    """Subscribes to items change and updates children. Changes of BindableList items update only changed children"""
     node.observe('items', lambda *_: _on_items_changed(node, context))
+    _observe_list_changes(node, context)
+
+
+def _observe_list_changes(node: For, context: RenderingContext):
+    # pylint: disable=protected-access
+    if node._items_subscription is not None:
+        node._items_subscription.release()
+        node._items_subscription = None
+    if isinstance(node.items, BindableList):
+        node._items_subscription = node.items.observe_changes(lambda change: _on_list_changed(node, change, context))
+
+
+def _on_list_changed(node: For, change: ListChange, context: RenderingContext):
+    size = len(node.xml_node.children)
+    if size == 0:
+        return
+    if change.action == ListAction.MOVE:
+        _move_children(node, change.index, change.new_index, size)
+    elif change.action == ListAction.REPLACE:
+        _update_items(node, change.index, change.items, size)
+    else:
+        _replace_children(node, change, size, context)
+
+
+def _move_children(node: For, index: int, new_index: int, size: int):
+    moved = node.children[index * size:(index + 1) * size]
+    del node.children[index * size:(index + 1) * size]
+    node.children[new_index * size:new_index * size] = moved
+    _update_indexes(node, min(index, new_index), max(index, new_index) + 1, size)
+
+
+def _update_items(node: For, start: int, items: tuple, size: int):
+    for index, item in enumerate(items, start):
+        for child in node.children[index * size:(index + 1) * size]:
+            child.node_globals['item'] = item
+
+
+def _replace_children(node: For, change: ListChange, size: int, context: RenderingContext):
+    start, end = change.index * size, (change.index + len(change.old_items)) * size
+    for child in node.children[start:end]:
+        child.destroy()
+    node.children[start:end] = _render_items(node, change.items, context, change.index)
+    if len(change.items) != len(change.old_items):
+        _update_indexes(node, change.index + len(change.items), len(node.children) // size, size)
+
+
+def _update_indexes(node: For, start: int, end: int, size: int):
+    for index in range(start, end):
+        for child in node.children[index * size:(index + 1) * size]:
+            child.node_globals['index'] = index
 
 
 def _on_items_changed(node: For, context: RenderingContext):
+    _observe_list_changes(node, context)
     _destroy_overflow(node)
     _update_existing(node)
     _create_not_existing(node, context)
@@ -165,21 +211,11 @@ def _create_not_existing(node: For, context: RenderingContext):
 class If(Container, Bindable):
     """Renders children if condition is True"""
 
+    condition: bool = observable(False)
+
     def __init__(self, xml_node: XmlNode, node_globals: Optional[NodeGlobals] = None):
         Bindable.__init__(self)
         Container.__init__(self, xml_node, node_globals = node_globals)
-        self._condition = False
-
-    @property
-    def condition(self):
-        """Returns condition"""
-        return self._condition
-
-    @condition.setter
-    def condition(self, value):
-        old_condition = self._condition
-        self._condition = value
-        self._notify('condition', value, old_condition)
 
 
 def get_if_pipeline() -> RenderingPipeline:
@@ -4,8 +4,15 @@ from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import Any, Callable, Generator, Optional, Set, Union
-
+from functools import wraps
+from inspect import ismethod, unwrap
+from threading import Lock, RLock, get_ident
+from types import MappingProxyType, MemberDescriptorType
+from typing import (AbstractSet, Any, Callable, ClassVar, ContextManager, Dict, FrozenSet, Generator, Iterable,
+                    Iterator, List, Mapping, NamedTuple, Optional, Set, Tuple, Type, TypeVar, Union)
+from weakref import WeakMethod, ref
+
+from pyviews.core.comparators import Comparator, equal
 from pyviews.core.error import PyViewsError, ViewInfo
 
 
@@ -33,6 +40,8 @@ class Binding(ABC):
 
 @dataclass
 class BindableRecord:
+    __slots__ = ('bindable', 'key')
+
     bindable: 'Bindable'
     key: str
 
@@ -43,13 +52,49 @@ class BindableRecord:
         return hash((id(self.bindable), self.key))
 
 
-_CONTEXT_VAR: ContextVar[Set[BindableRecord]] = ContextVar('recording')
+class Records(AbstractSet[BindableRecord]):
+    """
+    Set of recorded bindable reads. Reads are stored by bindable id and key without creating records.
+    BindableRecord items are created on iteration
+    """
+
+    __slots__ = ('_items',)
+
+    def __init__(self):
+        self._items: Dict[Tuple[int, Any], 'Bindable'] = {}
+
+    def add(self, inst: 'Bindable', key: Any):
+        """Records read of bindable key"""
+        self._items[(id(inst), key)] = inst
+
+    def __contains__(self, record: Any) -> bool:
+        if not isinstance(record, BindableRecord):
+            return False
+        return self._items.get((id(record.bindable), record.key), None) is record.bindable
+
+    def __iter__(self) -> Iterator[BindableRecord]:
+        for (_, key), inst in self._items.items():
+            yield BindableRecord(inst, key)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self):
+        return f'Records({set(self)})'
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[BindableRecord]) -> Set[BindableRecord]:
+        """Results of set operations are plain sets of records"""
+        return set(it)
+
+
+_CONTEXT_VAR: ContextVar[Optional[Records]] = ContextVar('recording')
 
 
 @contextmanager
-def recording() -> Generator[Set[BindableRecord], None, None]:
-    """Stores rendering context to context var"""
-    records_set = set()
+def recording() -> Generator[Records, None, None]:
+    """Records bindable reads"""
+    records_set = Records()
     token = _CONTEXT_VAR.set(records_set)
     try:
         yield records_set
@@ -57,60 +102,722 @@ def recording() -> Generator[Set[BindableRecord], None, None]:
         _CONTEXT_VAR.reset(token)
 
 
-class Bindable:
-    """Base class for observable entities"""
+class BatchRecording:
+    """Records bindable reads to separate set for every batch item"""
+
+    def __init__(self):
+        self._records: List[Records] = []
+
+    @property
+    def records(self) -> List[Records]:
+        """Recorded sets in order of next() calls"""
+        return self._records
+
+    def next(self, *_):
+        """Starts recording to new set"""
+        records_set = Records()
+        self._records.append(records_set)
+        _CONTEXT_VAR.set(records_set)
+
+
+@contextmanager
+def batch_recording() -> Generator[BatchRecording, None, None]:
+    """Records bindable reads to separate sets. New set is started by BatchRecording.next() call"""
+    token = _CONTEXT_VAR.set(None)
+    try:
+        yield BatchRecording()
+    finally:
+        _CONTEXT_VAR.reset(token)
+
+
+_COLLECTED = object()
+
+
+class WeakCallback:
+    """Calls callback by weak reference. Bound methods are referenced by WeakMethod"""
+
+    __slots__ = ('_ref',)
+
+    def __init__(self, callback: Callable):
+        self._ref = WeakMethod(callback) if ismethod(callback) else ref(callback)
+
+    @property
+    def callback(self) -> Optional[Callable]:
+        """Referenced callback. None if it is garbage collected"""
+        return self._ref()
+
+    def __call__(self, *args):
+        callback = self._ref()
+        if callback is None:
+            return _COLLECTED
+        return callback(*args)
+
+    def __eq__(self, other):
+        if isinstance(other, WeakCallback):
+            return self._ref == other._ref
+        return self._ref() == other
+
+
+def _is_collected(callback: Callable) -> bool:
+    return isinstance(callback, WeakCallback) and callback.callback is None
+
+
+class _AllKeys:
+
+    def __repr__(self):
+        return '<all keys>'
+
+
+ALL_KEYS = _AllKeys()
+"""Key of BindableDict.observe_all() and BindableList.observe_changes() subscribers in subscribers stats"""
+
+
+class SubscribersStats(NamedTuple):
+    """Subscribers count of bindable key"""
+    live: int
+    collected: int
+
+
+_SUBSCRIBERS_LOCK = RLock()
+_EMPTY: Mapping = MappingProxyType({})
+
+
+class Subscription:
+    """Handle of subscription to bindable changes"""
+
+    __slots__ = ('_subscribers', 'callback')
+
+    def __init__(self, subscribers: 'Subscribers', callback: Callable):
+        self._subscribers: Optional[Subscribers] = subscribers
+        self.callback: Callable = callback
+
+    @property
+    def is_active(self) -> bool:
+        """Returns true if subscription is not released"""
+        return self._subscribers is not None
+
+    def release(self):
+        """Releases subscription"""
+        if self._subscribers is not None:
+            self._subscribers.remove(self)
+            self._subscribers = None
+
+
+class Subscribers:
+    """Subscribers of bindable key. Dispatch iterates immutable snapshot that is rebuilt after changes"""
+
+    __slots__ = ('_subscriptions', '_snapshot')
+
+    def __init__(self):
+        self._subscriptions: Dict[Subscription, Callable] = {}
+        self._snapshot: Optional[Tuple[Callable, ...]] = ()
+
+    @property
+    def snapshot(self) -> Tuple[Callable, ...]:
+        """Current callbacks"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            with _SUBSCRIBERS_LOCK:
+                snapshot = self._snapshot = tuple(self._subscriptions.values())
+        return snapshot
+
+    def add(self, callback: Callable) -> Subscription:
+        """Adds callback"""
+        subscription = Subscription(self, callback)
+        with _SUBSCRIBERS_LOCK:
+            self._subscriptions[subscription] = callback
+            self._snapshot = None
+        return subscription
+
+    def remove(self, subscription: Subscription):
+        """Removes subscription"""
+        with _SUBSCRIBERS_LOCK:
+            if self._subscriptions.pop(subscription, None) is not None:
+                self._snapshot = None
+
+    def remove_callback(self, callback: Callable):
+        """Removes all subscriptions of callback"""
+        self._remove_where(lambda subscriber: subscriber == callback)
+
+    def remove_collected(self) -> int:
+        """Removes garbage collected weak subscribers. Returns count of removed ones"""
+        return self._remove_where(_is_collected)
+
+    def _remove_where(self, predicate: Callable[[Callable], bool]) -> int:
+        with _SUBSCRIBERS_LOCK:
+            items = list(self._subscriptions.items())
+        removed = [subscription for subscription, callback in items if predicate(callback)]
+        for subscription in removed:
+            subscription.release()
+        return len(removed)
+
+    def __len__(self):
+        return len(self._subscriptions)
+
+
+class Batch:
+    """Pending change notifications merged by bindable key"""
 
     def __init__(self):
-        self._callbacks = {}
+        self._changes: Dict[Tuple[int, Any], List] = {}
+
+    def add(self, inst: 'Bindable', key: Any, value: Any, old_value: Any):
+        """Adds change. Keeps first old value for repeated changes of the same key"""
+        try:
+            self._changes[(id(inst), key)][2] = value
+        except KeyError:
+            self._changes[(id(inst), key)] = [inst, key, value, old_value]
+
+    def __len__(self):
+        return len(self._changes)
+
+    def dispatch(self):
+        """Notifies about changes with final value not equal to first old value"""
+        changes, self._changes = self._changes, {}
+        dispatcher = _DISPATCHER
+        if dispatcher is not None and not dispatcher.is_ui_thread():
+            for inst, key, value, old_value in changes.values():
+                dispatcher.add(inst, key, value, old_value)
+            return
+        for inst, key, value, old_value in changes.values():
+            # pylint: disable=protected-access
+            if inst._is_changed(key, value, old_value):
+                inst._dispatch(key, value, old_value)
+
+
+_BATCH_VAR: ContextVar[Optional[Batch]] = ContextVar('batch')
+
+
+@contextmanager
+def batch() -> Generator[Batch, None, None]:
+    """
+    Defers change notifications until the end of with block.
+    Every changed bindable key is notified once with first old value and last value.
+    Nested batches are dispatched by outer one
+    """
+    current_batch = _BATCH_VAR.get(None)
+    if current_batch is not None:
+        yield current_batch
+        return
+    current_batch = Batch()
+    token = _BATCH_VAR.set(current_batch)
+    try:
+        yield current_batch
+    finally:
+        _BATCH_VAR.reset(token)
+        current_batch.dispatch()
+
+
+class Dispatcher:
+    """
+    Delivers change notifications made in other threads on UI thread.
+    Changes are merged by bindable key and delivered by callback scheduled on UI thread
+    """
+
+    def __init__(self, schedule: Callable[[Callable[[], None]], Any], thread_id: Optional[int] = None):
+        self._schedule: Callable[[Callable[[], None]], Any] = schedule
+        self._thread_id: int = get_ident() if thread_id is None else thread_id
+        self._lock = Lock()
+        self._pending: Batch = Batch()
+        self._scheduled: bool = False
+
+    @property
+    def pending(self) -> int:
+        """Count of changes waiting for delivery"""
+        return len(self._pending)
+
+    def is_ui_thread(self) -> bool:
+        """Returns true if called from UI thread"""
+        return get_ident() == self._thread_id
+
+    def add(self, inst: 'Bindable', key: Any, value: Any, old_value: Any):
+        """Adds change and schedules delivery if it is not scheduled"""
+        with self._lock:
+            self._pending.add(inst, key, value, old_value)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._schedule(self.drain)
+
+    def drain(self):
+        """Delivers pending changes. Should be called on UI thread"""
+        with self._lock:
+            pending, self._pending = self._pending, Batch()
+            self._scheduled = False
+        pending.dispatch()
+
+
+_DISPATCHER: Optional[Dispatcher] = None
+
+
+def use_dispatcher(schedule: Callable[[Callable[[], None]], Any], thread_id: Optional[int] = None) -> Dispatcher:
+    """
+    Delivers changes made in other threads on UI thread.
+    schedule is called from other threads with callback that should be called on UI thread,
+    like tkinter after(), wx.CallAfter() or asyncio loop.call_soon_threadsafe().
+    Current thread is UI thread if thread id is not passed
+    """
+    global _DISPATCHER # pylint: disable=global-statement
+    _DISPATCHER = Dispatcher(schedule, thread_id)
+    return _DISPATCHER
+
+
+def get_dispatcher() -> Optional[Dispatcher]:
+    """Returns used dispatcher"""
+    return _DISPATCHER
+
+
+def reset_dispatcher():
+    """Stops using dispatcher. Changes are notified on calling thread"""
+    global _DISPATCHER # pylint: disable=global-statement
+    _DISPATCHER = None
+
+
+class Bindable:
+    """
+    Base class for observable entities.
+    Records reads of all public attributes. Subclasses that declare observable() properties record only them,
+    unless they notify about changes of undeclared attributes like BindableEntity.
+    Subscribers and versions are allocated on first use
+    """
+
+    _observes_undeclared: bool = False
+    _comparator: Comparator = staticmethod(equal)
+    _comparators: Dict[Any, Comparator] = {}
+    _callbacks: Mapping[Any, Subscribers] = _EMPTY
+    _versions: Mapping[Any, int] = _EMPTY
+    _collected: Mapping[Any, int] = _EMPTY
+    _all_callbacks: Optional[Subscribers] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if '__getattribute__' not in vars(cls) and not cls._observes_undeclared and _has_bindable_properties(cls):
+            cls.__getattribute__ = object.__getattribute__
+        _resolve_comparator(cls)
 
     def __getattribute__(self, name: str):
         bindable_recording = _CONTEXT_VAR.get(None)
         if bindable_recording is not None and not name.startswith('_'):
-            bindable_recording.add(BindableRecord(self, name))
+            bindable_recording.add(self, name)
         return super().__getattribute__(name)
 
-    def observe(self, key: str, callback: Callable[[Any, Any], None]):
-        """Subscribes to key changes"""
+    def observe(self, key: str, callback: Callable[[Any, Any], None], weak: bool = False) -> Subscription:
+        """
+        Subscribes to key changes. Returned subscription can be released in constant time.
+        Weak subscription is removed after callback is garbage collected
+        """
         if key not in self._callbacks:
-            self._add_key(key)
-        self._callbacks[key].append(callback)
+            with _SUBSCRIBERS_LOCK:
+                if key not in self._callbacks:
+                    self._add_key(key)
+        return self._callbacks[key].add(WeakCallback(callback) if weak else callback)
+
+    def _add_all_callback(self, callback: Callable, weak: bool) -> Subscription:
+        if self._all_callbacks is None:
+            with _SUBSCRIBERS_LOCK:
+                if self._all_callbacks is None:
+                    self._all_callbacks = Subscribers()
+        return self._all_callbacks.add(WeakCallback(callback) if weak else callback)
+
+    def _notify_all_callbacks(self, *args):
+        if self._all_callbacks is not None:
+            self._call_subscribers(ALL_KEYS, self._all_callbacks, *args)
+
+    def _release_all_callback(self, callback: Callable):
+        if self._all_callbacks is not None:
+            self._all_callbacks.remove_callback(callback)
 
     def _add_key(self, key):
-        self._callbacks[key] = []
+        if self._callbacks is _EMPTY:
+            self._callbacks = {}
+        self._callbacks[key] = Subscribers()
+
+    def get_version(self, key: str) -> int:
+        """Returns key version. Version is increased on every key change"""
+        return self._versions.get(key, 0)
+
+    @staticmethod
+    def batch() -> ContextManager['Batch']:
+        """Defers change notifications until the end of with block"""
+        return batch()
+
+    def _is_changed(self, key: Any, value: Any, old_value: Any) -> bool:
+        """Replaced in subclasses by function that uses comparators resolved for class"""
+        return not self._comparators.get(key, self._comparator)(value, old_value)
 
     def _notify(self, key: str, value, old_value):
-        if value == old_value:
+        if not self._is_changed(key, value, old_value):
             return
+        versions = self._versions
+        if versions is _EMPTY:
+            versions = self._versions = {}
+        versions[key] = versions.get(key, 0) + 1
+        if _DISPATCHER is None and _BATCH_VAR.get(None) is None:
+            self._dispatch(key, value, old_value)
+        else:
+            self._deliver(key, value, old_value)
+
+    def _deliver(self, key: str, value, old_value):
+        current_batch = _BATCH_VAR.get(None)
+        if current_batch is not None:
+            current_batch.add(self, key, value, old_value)
+        elif _DISPATCHER is not None and not _DISPATCHER.is_ui_thread():
+            _DISPATCHER.add(self, key, value, old_value)
+        else:
+            self._dispatch(key, value, old_value)
+
+    def _dispatch(self, key: str, value, old_value):
+        subscribers = self._callbacks.get(key, None)
+        if subscribers is not None:
+            self._call_subscribers(key, subscribers, value, old_value)
+
+    def _call_subscribers(self, key: Any, subscribers: Subscribers, *args):
+        collected = False
+        for callback in subscribers.snapshot:
+            if callback(*args) is _COLLECTED:
+                collected = True
+        if collected:
+            if self._collected is _EMPTY:
+                self._collected = {}
+            self._collected[key] = self._collected.get(key, 0) + subscribers.remove_collected()
+
+    def release(self, key: str, callback: Callable[[Any, Any], None]):
+        """Releases callback from key changes. Subscription.release() should be preferred, it doesn't search callback"""
         try:
-            for callback in self._callbacks[key].copy():
-                callback(value, old_value)
+            self._callbacks[key].remove_callback(callback)
         except KeyError:
             pass
 
-    def release(self, key: str, callback: Callable[[Any, Any], None]):
-        """Releases callback from key changes"""
+
+class BindableProperty:
+    """Descriptor that records reads and notifies about changes of bindable property"""
+
+    def __init__(self, default: Any = None, comparator: Optional[Comparator] = None):
+        self._default: Any = default
+        self._comparator: Optional[Comparator] = comparator
+        self._name: Optional[str] = None
+
+    @property
+    def name(self) -> Optional[str]:
+        """Property name"""
+        return self._name
+
+    def __set_name__(self, owner: type, name: str):
+        self._name = name
+        if self._comparator is not None:
+            use_comparator(self._comparator, name)(owner)
+
+    def __get__(self, inst: Optional[Bindable], owner: type) -> Any:
+        if inst is None:
+            return self
+        bindable_recording = _CONTEXT_VAR.get(None)
+        if bindable_recording is not None:
+            bindable_recording.add(inst, self._name)
+        return inst.__dict__.get(self._name, self._default)
+
+    def __set__(self, inst: Bindable, value: Any):
+        old_value = inst.__dict__.get(self._name, self._default)
+        inst.__dict__[self._name] = value
+        inst._notify(self._name, value, old_value) # pylint: disable=protected-access
+
+
+def observable(default: Any = None, comparator: Optional[Comparator] = None) -> Any:
+    """
+    Declares bindable property. Default value is shared between instances.
+    Classes with declared properties use default attribute access and record only reads of declared properties,
+    except BindableEntity subclasses
+    """
+    return BindableProperty(default, comparator)
+
+
+BindableType = TypeVar('BindableType', bound = type)
+
+
+def use_comparator(comparator: Comparator, *keys: Any) -> Callable[[BindableType], BindableType]:
+    """
+    Class decorator that sets comparator used to detect changes of passed keys.
+    Sets default comparator of class if keys are not passed
+    """
+
+    def _decorate(bindable_type: BindableType) -> BindableType:
+        if keys:
+            comparators = getattr(bindable_type, '_comparators', {})
+            bindable_type._comparators = {**comparators, **{key: comparator for key in keys}}
+        else:
+            bindable_type._comparator = staticmethod(comparator)
+        if issubclass(bindable_type, Bindable):
+            _resolve_comparator(bindable_type)
+        return bindable_type
+
+    return _decorate
+
+
+def _resolve_comparator(bindable_type: Type[Bindable]):
+    """Sets _is_changed that calls class comparators without reading them on every change"""
+    comparator, comparators = bindable_type._comparator, bindable_type._comparators
+
+    if comparators:
+
+        def _is_changed(_, key: Any, value: Any, old_value: Any) -> bool:
+            return not comparators.get(key, comparator)(value, old_value)
+    else:
+
+        def _is_changed(_, __, value: Any, old_value: Any) -> bool:
+            return not comparator(value, old_value)
+
+    bindable_type._is_changed = _is_changed
+
+
+class BindableField(property):
+    """Slotted field of class created by bindable(). Records reads and notifies about changes"""
+
+    def __init__(self, name: str, slot: MemberDescriptorType):
+        get_value, set_value = slot.__get__, slot.__set__
+
+        def _get(inst: Bindable) -> Any:
+            bindable_recording = _CONTEXT_VAR.get(None)
+            if bindable_recording is not None:
+                bindable_recording.add(inst, name)
+            return get_value(inst)
+
+        def _set(inst: Bindable, value: Any):
+            # pylint: disable=protected-access
+            old_value = get_value(inst)
+            set_value(inst, value)
+            if not inst._is_changed(name, value, old_value):
+                return
+            versions = inst._versions
+            if versions is _EMPTY:
+                versions = inst._versions = {}
+            versions[name] = versions.get(name, 0) + 1
+            inst._deliver(name, value, old_value)
+
+        super().__init__(_get, _set)
+        self.name: str = name
+        self.slot: MemberDescriptorType = slot
+
+
+_BINDABLE_DESCRIPTORS = (BindableProperty, BindableField)
+_INTERNAL_SLOTS = ('_callbacks', '_versions', '_collected')
+_NO_DEFAULT = object()
+
+
+def bindable(cls: BindableType) -> BindableType:
+    """
+    Class decorator that creates slotted bindable class from annotated fields.
+    Generates __init__ with fields as arguments if class doesn't define it.
+    Field comparator can be passed with observable() default. Subscribers are allocated on first observe() call
+    """
+    fields, own_fields = dict(getattr(cls, '__bindable_fields__', {})), []
+    namespace = {key: value for key, value in vars(cls).items() if key not in ('__dict__', '__weakref__')}
+    for name, annotation in vars(cls).get('__annotations__', {}).items():
+        if _is_class_var(annotation):
+            continue
+        default = namespace.pop(name, _NO_DEFAULT)
+        if isinstance(default, BindableProperty):
+            default = default._default # pylint: disable=protected-access
+        fields[name] = default
+        own_fields.append(name)
+
+    bases = cls.__bases__ if issubclass(cls, Bindable) else (*(b for b in cls.__bases__ if b is not object), Bindable)
+    inherited_slots = {slot for base in bases for klass in base.__mro__ for slot in _get_slots(klass)}
+    slots = [*own_fields, *(slot for slot in _INTERNAL_SLOTS if slot not in inherited_slots)]
+    if not any(base.__weakrefoffset__ for base in bases):
+        slots.append('__weakref__')
+    namespace.update({'__slots__': tuple(slots), '__getattribute__': object.__getattribute__,
+                      '__bindable_fields__': fields})
+
+    bindable_type = type(cls)(cls.__name__, bases, namespace)
+    _replace_class_cells(namespace, cls, bindable_type)
+    for name in own_fields:
+        setattr(bindable_type, name, BindableField(name, vars(bindable_type)[name]))
+    if issubclass(bindable_type, BindableEntity):
+        bindable_type._bindable_names = _get_bindable_names(bindable_type)
+    bindable_type.__init__ = _create_init(bindable_type, fields, namespace.get('__init__', None))
+    return bindable_type
+
+
+def _replace_class_cells(namespace: Dict[str, Any], cls: type, bindable_type: type):
+    """Makes super() and __class__ in methods refer to created class, like dataclass with slots does"""
+    for value in namespace.values():
+        if isinstance(value, (classmethod, staticmethod)):
+            functions = (value.__func__,)
+        elif isinstance(value, property):
+            functions = (value.fget, value.fset, value.fdel)
+        else:
+            functions = (value,)
+        for function in functions:
+            function = unwrap(function) if callable(function) else function
+            code, closure = getattr(function, '__code__', None), getattr(function, '__closure__', None)
+            if code is None or not closure or '__class__' not in code.co_freevars:
+                continue
+            cell = closure[code.co_freevars.index('__class__')]
+            if cell.cell_contents is cls:
+                cell.cell_contents = bindable_type
+
+
+def _is_class_var(annotation: Any) -> bool:
+    if isinstance(annotation, str):
+        return annotation.startswith(('ClassVar', 'typing.ClassVar'))
+    return annotation is ClassVar or getattr(annotation, '__origin__', None) is ClassVar
+
+
+def _get_slots(cls: type) -> Tuple[str, ...]:
+    slots = vars(cls).get('__slots__', ())
+    return (slots,) if isinstance(slots, str) else tuple(slots)
+
+
+def _create_init(bindable_type: type, fields: Dict[str, Any], init: Optional[Callable]) -> Callable:
+    setters = {name: getattr(bindable_type, name).slot.__set__ for name in fields}
+    if init is not None:
+
+        @wraps(init)
+        def _init(self, *args, **kwargs):
+            self._callbacks = self._versions = self._collected = _EMPTY
+            for name, default in fields.items():
+                setters[name](self, None if default is _NO_DEFAULT else default)
+            init(self, *args, **kwargs)
+
+        return _init
+
+    params, body, scope = [], ['    self._callbacks = self._versions = self._collected = _EMPTY'], {'_EMPTY': _EMPTY}
+    for i, (name, default) in enumerate(fields.items()):
+        if default is _NO_DEFAULT:
+            if len(params) != i or any('=' in param for param in params):
+                raise TypeError(f"non-default field '{name}' follows default field")
+            params.append(name)
+        else:
+            scope[f'_default_{i}'] = default
+            params.append(f'{name} = _default_{i}')
+        scope[f'_set_{i}'] = setters[name]
+        body.append(f'    _set_{i}(self, {name})')
+    exec('\n'.join([f'def __init__(self, {", ".join(params)}):', *body]), scope) # pylint: disable=exec-used
+    generated = scope['__init__']
+    generated.__qualname__ = f'{bindable_type.__qualname__}.__init__'
+    return generated
+
+
+class ComputedProperty:
+    """Descriptor that caches value computed from bindable keys and notifies about its changes"""
+
+    def __init__(self, compute: Callable[[Any], Any]):
+        self._compute: Callable[[Any], Any] = compute
+        self._name: str = compute.__name__
+        self.__doc__ = compute.__doc__
+
+    @property
+    def name(self) -> str:
+        """Property name"""
+        return self._name
+
+    def __set_name__(self, owner: type, name: str):
+        self._name = name
+
+    def __get__(self, inst: Optional[Bindable], owner: type) -> Any:
+        if inst is None:
+            return self
+        bindable_recording = _CONTEXT_VAR.get(None)
+        if bindable_recording is not None:
+            bindable_recording.add(inst, self._name)
         try:
-            self._callbacks[key] = [c for c in self._callbacks[key] if c != callback]
-        except (KeyError, ValueError):
-            pass
+            value = inst.__dict__[self._name]
+        except KeyError:
+            value = inst.__dict__.setdefault(self._name, _ComputedValue(inst, self._name, self._compute))
+        if not value.is_valid:
+            value.update()
+        return value.value
+
+    def __set__(self, inst: Bindable, value: Any):
+        raise AttributeError(f"can't set computed property '{self._name}'")
+
+
+class _ComputedValue:
+
+    def __init__(self, inst: Bindable, key: str, compute: Callable[[Any], Any]):
+        self._inst: Bindable = inst
+        self._key: str = key
+        self._compute: Callable[[Any], Any] = compute
+        self._subscriptions: List[Subscription] = []
+        self._records: Tuple[BindableRecord, ...] = ()
+        self._versions: Tuple[int, ...] = ()
+        self.value: Any = None
+        self.is_valid: bool = False
+
+    def update(self):
+        with recording() as records:
+            value = self._compute(self._inst)
+        with recording():
+            self._records = tuple(records)
+            self._versions = get_versions(self._records)
+            for subscription in self._subscriptions:
+                subscription.release()
+            self._subscriptions = []
+            for record in records:
+                try:
+                    self._subscriptions.append(record.bindable.observe(record.key, self._changed, weak = True))
+                except KeyError:
+                    pass
+        self.value, self.is_valid = value, True
+
+    def _changed(self, *_):
+        # pylint: disable=protected-access
+        if self.is_valid and self._versions == get_versions(self._records):
+            return
+        if not self._inst._callbacks.get(self._key, None):
+            self.is_valid = False
+            return
+        old_value = self.value
+        self.update()
+        self._inst._notify(self._key, self.value, old_value)
+
+
+def computed(compute: Callable[[Any], Any]) -> Any:
+    """
+    Declares property computed from bindable keys read by function.
+    Value is cached and computed again only after read key is changed.
+    Observers are notified if computed value is changed
+    """
+    return ComputedProperty(compute)
+
+
+def _has_bindable_properties(cls: type) -> bool:
+    return any(isinstance(value, _BINDABLE_DESCRIPTORS) for base in cls.__mro__ for value in vars(base).values())
+
+
+def _is_bindable_property(cls: type, key: str) -> bool:
+    return isinstance(getattr(cls, key, None), (*_BINDABLE_DESCRIPTORS, ComputedProperty))
+
+
+def _get_bindable_names(cls: type) -> FrozenSet[str]:
+    keys = {key for base in cls.__mro__ for key in vars(base)}
+    return frozenset(key for key in keys if _is_bindable_property(cls, key))
 
 
 class BindableEntity(Bindable):
-    """Bindable general object"""
+    """Bindable general object. Reads of all public attributes are recorded"""
+
+    _observes_undeclared: bool = True
+    _bindable_names: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._bindable_names = _get_bindable_names(cls)
 
     def __setattr__(self, key, value):
-        if key in self.__dict__:
+        if key in type(self)._bindable_names:
+            Bindable.__setattr__(self, key, value)
+        elif key in self.__dict__:
             old_val = getattr(self, key, None)
             Bindable.__setattr__(self, key, value)
             self._notify(key, value, old_val)
         else:
             Bindable.__setattr__(self, key, value)
 
-    def observe(self, key, callback: Callable[[Any, Any], None]):
-        """Subscribes to key changes"""
-        if key not in self.__dict__ and key not in self._callbacks:
+    def observe(self, key, callback: Callable[[Any, Any], None], weak: bool = False) -> Subscription:
+        """Subscribes to key changes. Weak subscription is removed after callback is garbage collected"""
+        if key not in self.__dict__ and key not in self._callbacks and key not in type(self)._bindable_names:
             raise KeyError('Entity ' + str(self) + "doesn't have attribute" + key)
-        super().observe(key, callback)
+        return super().observe(key, callback, weak)
 
 
 class BindableDict(dict, Bindable):
@@ -120,8 +827,6 @@ class BindableDict(dict, Bindable):
             dict.__init__(self, source)
         else:
             dict.__init__(self)
-        Bindable.__init__(self)
-        self._all_callbacks = []
 
     def __getattribute__(self, name: str):
         return object.__getattribute__(self, name)
@@ -129,7 +834,7 @@ class BindableDict(dict, Bindable):
     def __getitem__(self, key: Any):
         bindable_recording = _CONTEXT_VAR.get(None)
         if bindable_recording is not None:
-            bindable_recording.add(BindableRecord(self, key))
+            bindable_recording.add(self, key)
         return dict.__getitem__(self, key)
 
     def __setitem__(self, key: Any, value: Any):
@@ -148,7 +853,7 @@ class BindableDict(dict, Bindable):
     def get(self, key: Any, default: Any = None) -> Any:
         bindable_recording = _CONTEXT_VAR.get(None)
         if bindable_recording is not None:
-            bindable_recording.add(BindableRecord(self, key))
+            bindable_recording.add(self, key)
         return super().get(key, default)
 
     def pop(self, key: Any, default: Any = None) -> None:
@@ -159,20 +864,38 @@ class BindableDict(dict, Bindable):
             value = default
         return value
 
-    def observe_all(self, callback: Callable[[str, Any, Any], None]):
-        """Subscribes to all keys changes"""
-        self._all_callbacks.append(callback)
+    def observe_all(self, callback: Callable[[str, Any, Any], None], weak: bool = False) -> Subscription:
+        """Subscribes to all keys changes. Weak subscription is removed after callback is garbage collected"""
+        return self._add_all_callback(callback, weak)
 
-    def _notify(self, key: str, value: Any, old_value: Any):
-        super()._notify(key, value, old_value)
+    def _dispatch(self, key: str, value: Any, old_value: Any):
+        super()._dispatch(key, value, old_value)
         self._notify_all(key, value, old_value)
 
     def _notify_all(self, key: str, value, old_value):
-        if self._all_callbacks is None:
-            self._all_callbacks = []
-        for callback in self._all_callbacks.copy():
-            callback(key, value, old_value)
+        self._notify_all_callbacks(key, value, old_value)
 
     def release_all(self, callback: Callable[[str, Any, Any], None]):
         """Releases callback from all keys changes"""
-        self._all_callbacks = [c for c in self._all_callbacks if c != callback]
+        self._release_all_callback(callback)
+
+
+def get_subscribers_stats(inst: Bindable) -> Dict[Any, SubscribersStats]:
+    """Returns count of live and garbage collected subscribers by key"""
+    # pylint: disable=protected-access
+    subscribers = dict(object.__getattribute__(inst, '_callbacks'))
+    all_callbacks = object.__getattribute__(inst, '_all_callbacks')
+    if all_callbacks is not None:
+        subscribers[ALL_KEYS] = all_callbacks
+    removed = object.__getattribute__(inst, '_collected')
+    stats = {}
+    for key in {*subscribers, *removed}:
+        callbacks = subscribers[key].snapshot if key in subscribers else ()
+        collected = sum(1 for callback in callbacks if _is_collected(callback))
+        stats[key] = SubscribersStats(len(callbacks) - collected, removed.get(key, 0) + collected)
+    return stats
+
+
+def get_versions(records: Iterable[BindableRecord]) -> Tuple[int, ...]:
+    """Returns versions of recorded bindable keys"""
+    return tuple(record.bindable.get_version(record.key) for record in records)
@@ -0,0 +1,115 @@
+"""Bindable binary buffer"""
+
+from contextlib import contextmanager
+from typing import Any, Callable, Generator, NamedTuple, Optional, Union
+
+from pyviews.core.binding import _CONTEXT_VAR, Bindable, BindingError, Subscription
+from pyviews.core.comparators import Comparator, always_changed
+
+
+class BufferChange(NamedTuple):
+    """Written range of buffer"""
+    start: int
+    stop: int
+
+
+BufferSource = Union[int, bytes, bytearray, memoryview]
+_READONLY_VIEWS = hasattr(memoryview, 'toreadonly') # python >= 3.8
+
+
+class BindableBuffer(Bindable):
+    """
+    Binary buffer that notifies about written ranges without comparing and copying data.
+    Subscribers of "view" key get read-only view of buffer.
+    Ranges written in batch are merged to range that contains them
+    """
+
+    _comparator: Comparator = staticmethod(always_changed)
+
+    def __init__(self, source: BufferSource = 0):
+        super().__init__()
+        if not _READONLY_VIEWS:
+            raise BindingError('BindableBuffer requires python 3.8 or later')
+        self._data: Union[bytearray, memoryview] = _get_buffer_data(source)
+        self._view: memoryview = memoryview(self._data).toreadonly()
+        self._written: Optional[BufferChange] = None
+
+    def __getattribute__(self, name: str):
+        return object.__getattribute__(self, name)
+
+    def __len__(self):
+        return len(self._view)
+
+    @property
+    def view(self) -> memoryview:
+        """Read-only view of buffer"""
+        bindable_recording = _CONTEXT_VAR.get(None)
+        if bindable_recording is not None:
+            bindable_recording.add(self, 'view')
+        return self._view
+
+    @property
+    def version(self) -> int:
+        """Increased on every write"""
+        return self.get_version('view')
+
+    def observe_changes(self, callback: Callable[[BufferChange], None], weak: bool = False) -> Subscription:
+        """Subscribes to written ranges. Weak subscription is removed after callback is garbage collected"""
+        return self._add_all_callback(callback, weak)
+
+    def release_changes(self, callback: Callable[[BufferChange], None]):
+        """Releases callback from written ranges"""
+        self._release_all_callback(callback)
+
+    def write(self, data: Union[bytes, bytearray, memoryview], offset: int = 0):
+        """Copies data to buffer from offset"""
+        stop = offset + len(data)
+        memoryview(self._data)[offset:stop] = data
+        self.notify_written(offset, stop)
+
+    @contextmanager
+    def writable(self, start: int = 0, stop: Optional[int] = None) -> Generator[memoryview, None, None]:
+        """Returns writable view of range. Range is notified as written at the end of with block"""
+        start, stop, _ = slice(start, stop).indices(len(self))
+        try:
+            with memoryview(self._data)[start:stop] as view:
+                yield view
+        finally:
+            self.notify_written(start, stop)
+
+    def replace(self, source: BufferSource):
+        """Replaces buffer data. Bytearray and writable memoryview are used without copy"""
+        self._data = _get_buffer_data(source)
+        self._view = memoryview(self._data).toreadonly()
+        self.notify_written(0, len(self._view))
+
+    def detach(self):
+        """Replaces data with empty buffer and releases views of previous data. Read-only views become unusable"""
+        data, view = self._data, self._view
+        self.replace(bytearray())
+        view.release()
+        if isinstance(data, memoryview):
+            data.release()
+
+    def notify_written(self, start: int, stop: int):
+        """Notifies about range written to wrapped data directly"""
+        written = self._written
+        self._written = BufferChange(start, stop) if written is None \
+            else BufferChange(min(written.start, start), max(written.stop, stop))
+        self._notify('view', self._view, self._view)
+
+    def _dispatch(self, key: str, value: Any, old_value: Any):
+        written, self._written = self._written, None
+        super()._dispatch(key, self._view, self._view)
+        if written is not None:
+            length = len(self._view)
+            change = BufferChange(min(written.start, length), min(written.stop, length))
+            self._notify_all_callbacks(change)
+
+
+def _get_buffer_data(source: BufferSource) -> Union[bytearray, memoryview]:
+    if isinstance(source, bytearray):
+        return source
+    if isinstance(source, memoryview) and not source.readonly:
+        return source.cast('B')
+    return bytearray(source)
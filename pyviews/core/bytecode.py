@@ -0,0 +1,112 @@
+"""Persistent cache for compiled expressions"""
+
+import atexit
+from hashlib import sha256
+from importlib.util import MAGIC_NUMBER
+from marshal import dumps, loads
+from os import makedirs, replace
+from os.path import dirname, join
+from sys import implementation
+from threading import RLock
+from types import CodeType
+from typing import Dict, Optional, Tuple
+
+BytecodeKey = Tuple[str, str]
+
+
+class BytecodeCache:
+    """Stores compiled expressions to file"""
+
+    def __init__(self, path: str):
+        self._path: str = path
+        self._lock = RLock()
+        self._items: Dict[BytecodeKey, CodeType] = {}
+        self._changed: bool = False
+        self._loaded: bool = False
+
+    @property
+    def path(self) -> str:
+        """Cache file path"""
+        return self._path
+
+    def get(self, code: str, compile_mode: str) -> Optional[CodeType]:
+        """Returns compiled code stored in cache"""
+        with self._lock:
+            if not self._loaded:
+                self.load()
+            return self._items.get(_get_key(code, compile_mode))
+
+    def add(self, code: str, compile_mode: str, compiled: CodeType):
+        """Adds compiled code to cache. Stored to file on save() call"""
+        with self._lock:
+            if not self._loaded:
+                self.load()
+            self._items[_get_key(code, compile_mode)] = compiled
+            self._changed = True
+
+    def load(self):
+        """Loads compiled expressions from file"""
+        with self._lock:
+            self._load()
+
+    def _load(self):
+        self._loaded = True
+        try:
+            with open(self._path, 'rb') as cache_file:
+                data = cache_file.read()
+        except OSError:
+            return
+        if data[:len(MAGIC_NUMBER)] != MAGIC_NUMBER:
+            return
+        try:
+            items = loads(data[len(MAGIC_NUMBER):])
+        except (EOFError, ValueError, TypeError):
+            return
+        if isinstance(items, dict):
+            self._items = {**items, **self._items}
+
+    def save(self):
+        """Writes compiled expressions to file if there are new ones"""
+        with self._lock:
+            self._save()
+
+    def _save(self):
+        if not self._changed:
+            return
+        makedirs(dirname(self._path) or '.', exist_ok = True)
+        temp_path = f'{self._path}.tmp'
+        with open(temp_path, 'wb') as cache_file:
+            cache_file.write(MAGIC_NUMBER)
+            cache_file.write(dumps(self._items))
+        replace(temp_path, self._path)
+        self._changed = False
+
+    def clear(self):
+        """Removes all stored items. File is overwritten on save() call"""
+        with self._lock:
+            self._items = {}
+            self._loaded = True
+            self._changed = True
+
+
+def _get_key(code: str, compile_mode: str) -> BytecodeKey:
+    return sha256(code.encode('utf-8')).hexdigest(), compile_mode
+
+
+_BYTECODE_CACHE: Optional[BytecodeCache] = None
+
+
+def use_bytecode_cache(folder: str, save_on_exit: bool = True) -> BytecodeCache:
+    """Enables persistent cache for compiled expressions"""
+    global _BYTECODE_CACHE # pylint: disable=global-statement
+    if _BYTECODE_CACHE is not None:
+        atexit.unregister(_BYTECODE_CACHE.save)
+    _BYTECODE_CACHE = BytecodeCache(join(folder, f'expressions.{implementation.cache_tag}.pyc'))
+    if save_on_exit:
+        atexit.register(_BYTECODE_CACHE.save)
+    return _BYTECODE_CACHE
+
+
+def get_bytecode_cache() -> Optional[BytecodeCache]:
+    """Returns persistent cache for compiled expressions if it is used"""
+    return _BYTECODE_CACHE
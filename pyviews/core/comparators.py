@@ -0,0 +1,50 @@
+"""Change detection for bindable values"""
+
+from typing import Any, Callable
+
+Comparator = Callable[[Any, Any], bool]
+"""Returns true if value is not changed comparing to old value"""
+
+
+def equal(value: Any, old_value: Any) -> bool:
+    """Compares values by equality. Array-like values are compared by identity"""
+    if value is old_value:
+        return True
+    try:
+        result = value == old_value
+        if result is True or result is False:
+            return result
+        if not (_is_array(value) or _is_array(old_value)):
+            return bool(result)
+    except (ValueError, TypeError):
+        pass
+    return False
+
+
+def _is_array(value: Any) -> bool:
+    value_type = type(value)
+    return hasattr(value_type, '__array__') or hasattr(value_type, '__array_interface__')
+
+
+def identical(value: Any, old_value: Any) -> bool:
+    """Compares values by identity"""
+    return value is old_value
+
+
+def always_changed(*_) -> bool:
+    """Treats every assignment as change"""
+    return False
+
+
+def compare_by(get_key: Callable[[Any], Any]) -> Comparator:
+    """Returns comparator that compares keys of values, like version or revision of value"""
+
+    def _compare(value: Any, old_value: Any) -> bool:
+        if value is old_value:
+            return True
+        try:
+            return get_key(value) == get_key(old_value)
+        except (AttributeError, LookupError, TypeError):
+            return False
+
+    return _compare
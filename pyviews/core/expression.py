@@ -1,16 +1,21 @@
 """Expression errors"""
 
-from collections import namedtuple
+import ast
+import builtins
+from collections import OrderedDict, namedtuple
+from dis import get_instructions
+from functools import lru_cache
 from re import compile as compile_regex
-from types import CodeType
-from typing import Any, Dict, Generator, Optional, Union
+from sys import getsizeof, version_info
+from threading import RLock
+from types import CodeType, FunctionType
+from typing import Any, Callable, Generator, List, NamedTuple, Optional, Sequence, Tuple, Union
 
 from injectool import dependency
 
+from pyviews.core.bytecode import get_bytecode_cache
 from pyviews.core.error import PyViewsError, error_handling
 
-_COMPILATION_CACHE: Dict[str, CodeType] = {}
-
 
 class ExpressionError(PyViewsError):
     """Error for failed expression"""
@@ -32,24 +37,168 @@ class ExpressionError(PyViewsError):
         yield self._format_info('Expression', self.expression if self.expression else '')
 
 
+class CacheStats(NamedTuple):
+    """Compilation cache counters"""
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+    memory: int
+
+
+CacheKey = Tuple[str, str]
+
+
+class CompilationCache:
+    """Thread safe LRU cache for compiled expressions"""
+
+    def __init__(self, max_size: int = 2048):
+        self._lock = RLock()
+        self._items: OrderedDict = OrderedDict()
+        self._sizes = {}
+        self._max_size: int = max_size
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._memory: int = 0
+
+    @property
+    def max_size(self) -> int:
+        """Max count of cached expressions"""
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int):
+        with self._lock:
+            self._max_size = value
+            self._evict()
+
+    def get(self, code: str, compile_mode: str) -> Optional[CodeType]:
+        """Returns cached compiled code"""
+        key = (code, compile_mode)
+        with self._lock:
+            try:
+                compiled = self._items[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._items.move_to_end(key)
+            self._hits += 1
+            return compiled
+
+    def add(self, code: str, compile_mode: str, compiled: CodeType):
+        """Stores compiled code"""
+        key = (code, compile_mode)
+        size = getsizeof(code) + _get_code_size(compiled)
+        with self._lock:
+            if key in self._items:
+                self._remove(key)
+            self._items[key] = compiled
+            self._sizes[key] = size
+            self._memory += size
+            self._evict()
+
+    def _evict(self):
+        while len(self._items) > max(self._max_size, 0):
+            key = next(iter(self._items))
+            self._remove(key)
+            self._evictions += 1
+
+    def _remove(self, key: CacheKey):
+        del self._items[key]
+        self._memory -= self._sizes.pop(key)
+
+    def clear(self):
+        """Removes all cached items and resets counters"""
+        with self._lock:
+            self._items.clear()
+            self._sizes.clear()
+            self._hits = self._misses = self._evictions = self._memory = 0
+
+    def stats(self) -> CacheStats:
+        """Returns cache counters"""
+        with self._lock:
+            return CacheStats(len(self._items), self._max_size, self._hits, self._misses, self._evictions,
+                              self._memory)
+
+
+def _get_code_size(compiled: CodeType) -> int:
+    """Returns approximate memory size of code object"""
+    size = getsizeof(compiled) + getsizeof(compiled.co_code)
+    for const in compiled.co_consts:
+        if isinstance(const, CodeType):
+            size += _get_code_size(const)
+    return size
+
+
+_COMPILATION_CACHE = CompilationCache()
+
+
+def get_compilation_cache() -> CompilationCache:
+    """Returns cache used for expressions compilation"""
+    return _COMPILATION_CACHE
+
+
+def _get_cached(code: str, compile_mode: str) -> Optional[CodeType]:
+    compiled = _COMPILATION_CACHE.get(code, compile_mode)
+    if compiled is not None:
+        return compiled
+    bytecode_cache = get_bytecode_cache()
+    if bytecode_cache is None:
+        return None
+    compiled = bytecode_cache.get(code, compile_mode)
+    if compiled is not None:
+        _COMPILATION_CACHE.add(code, compile_mode, compiled)
+    return compiled
+
+
+def _add_to_cache(code: str, compile_mode: str, compiled: CodeType):
+    _COMPILATION_CACHE.add(code, compile_mode, compiled)
+    bytecode_cache = get_bytecode_cache()
+    if bytecode_cache is not None:
+        bytecode_cache.add(code, compile_mode, compiled)
+
+
+class ExpressionFunction(NamedTuple):
+    """Expression compiled to function that receives used names as arguments"""
+    function: Callable
+    names: Tuple[str, ...]
+
+
+_FUNCTION_MODE = 'function'
+_FUNCTION_GLOBALS = {'__builtins__': builtins}
+_NOT_COMPILED = object()
+_SCOPE_OPERATIONS = {'STORE_NAME', 'STORE_GLOBAL', 'DELETE_NAME', 'DELETE_GLOBAL', 'IMPORT_STAR'}
+_SCOPE_FUNCTIONS = {'locals', 'globals', 'vars', 'dir', 'eval', 'exec'}
+_DEFERRED_CODE = {'<lambda>', '<genexpr>'}
+
+
+class PathKey(NamedTuple):
+    """Attribute name or item key read by expression"""
+    key: Any
+    is_item: bool = False
+
+
+ExpressionPath = Tuple[PathKey, ...]
+
+
 class Expression:
     """Parses and executes expression."""
 
-    __slots__ = ('_code', '_compiled_code')
+    __slots__ = ('_code', '_compile_mode', '_compiled_code', '_function', '_paths', '_path')
 
     def __init__(self, code: str, compile_mode: str = 'eval'):
         self._code: str = code
-        self._compiled_code: CodeType
-        if not self._init_from_cache():
-            self._compiled_code = self._compile(code, compile_mode)
-            self._store_to_cache()
-
-    def _init_from_cache(self) -> bool:
-        compiled = _COMPILATION_CACHE.get(self._code)
+        self._compile_mode: str = compile_mode
+        self._function: Any = _NOT_COMPILED
+        self._paths: Any = _NOT_COMPILED
+        self._path: Any = _NOT_COMPILED
+        compiled = _get_cached(code, compile_mode)
         if compiled is None:
-            return False
-        self._compiled_code = compiled
-        return True
+            compiled = self._compile(code, compile_mode)
+            _add_to_cache(code, compile_mode, compiled)
+        self._compiled_code: CodeType = compiled
 
     @staticmethod
     def _compile(code: str, compile_mode: str) -> CodeType:
@@ -61,19 +210,158 @@ class Expression:
             error.cause_error = syntax_error
             raise error from syntax_error
 
-    def _store_to_cache(self):
-        _COMPILATION_CACHE[self._code] = self._compiled_code
-
     @property
     def code(self) -> str:
         """Expression source code"""
         return self._code
 
+    @property
+    def compile_mode(self) -> str:
+        """Mode used to compile expression"""
+        return self._compile_mode
+
     @property
     def compiled_code(self) -> CodeType:
         """Expression compiled code"""
         return self._compiled_code
 
+    @property
+    def function(self) -> Optional[ExpressionFunction]:
+        """Expression compiled to function. None if expression can't be executed as function"""
+        if self._function is _NOT_COMPILED:
+            self._function = self._compile_function()
+        return self._function
+
+    @property
+    def paths(self) -> Optional[Tuple[ExpressionPath, ...]]:
+        """
+        Attribute and item paths read by expression, starting with name read from parameters.
+        None if expression reads values dynamically: calls, lambdas, comprehensions or computed keys
+        """
+        if self._paths is _NOT_COMPILED:
+            self._paths = get_expression_paths(self._code) if self._compile_mode == 'eval' else None
+        return self._paths
+
+    @property
+    def path(self) -> Optional[ExpressionPath]:
+        """Path if whole expression is attribute and constant item path like "vm.items[0].name", otherwise None"""
+        if self._path is _NOT_COMPILED:
+            self._path = get_expression_path(self._code) if self._compile_mode == 'eval' else None
+        return self._path
+
+    def _compile_function(self) -> Optional[ExpressionFunction]:
+        if self._compile_mode != 'eval':
+            return None
+        compiled = _get_cached(self._code, _FUNCTION_MODE)
+        if compiled is None:
+            names = _get_free_names(self._compiled_code)
+            if names is None:
+                return None
+            compiled = _compile_function(self._code, names)
+            _add_to_cache(self._code, _FUNCTION_MODE, compiled)
+        function = FunctionType(compiled, _FUNCTION_GLOBALS)
+        return ExpressionFunction(function, compiled.co_varnames[:compiled.co_argcount])
+
+
+def _get_free_names(compiled: CodeType) -> Optional[Tuple[str, ...]]:
+    """Returns names loaded from globals or None if code changes, inspects or captures scope"""
+    if compiled.co_name in _DEFERRED_CODE:
+        return None
+    names = {}
+    for instruction in get_instructions(compiled):
+        if instruction.opname in _SCOPE_OPERATIONS:
+            return None
+        if instruction.opname in ('LOAD_NAME', 'LOAD_GLOBAL'):
+            if instruction.argval in _SCOPE_FUNCTIONS:
+                return None
+            names[instruction.argval] = None
+    for const in compiled.co_consts:
+        if isinstance(const, CodeType):
+            inner_names = _get_free_names(const)
+            if inner_names is None:
+                return None
+            names.update(dict.fromkeys(inner_names))
+    return tuple(names)
+
+
+def _compile_function(code: str, names: Tuple[str, ...]) -> CodeType:
+    code = code if code.strip(' ') else 'None'
+    source = f'def _expression({", ".join(names)}):\n    return (\n{code}\n)'
+    module = compile(source, '<string>', 'exec')
+    return next(const for const in module.co_consts if isinstance(const, CodeType))
+
+
+class _DynamicExpression(Exception):
+    pass
+
+
+_STATIC_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.IfExp, ast.Tuple, ast.List, ast.Set,
+    ast.Dict, ast.JoinedStr, ast.FormattedValue, ast.Starred, ast.operator, ast.unaryop, ast.boolop, ast.cmpop,
+    ast.expr_context
+) # yapf: disable
+
+
+@lru_cache(maxsize = 2048)
+def get_expression_paths(code: str) -> Optional[Tuple[ExpressionPath, ...]]:
+    """Returns attribute and item paths read by expression or None if expression reads values dynamically"""
+    try:
+        tree = ast.parse(code if code.strip(' ') else 'None', mode = 'eval')
+        paths = {}
+        _collect_paths(tree, paths)
+        return tuple(paths)
+    except (SyntaxError, _DynamicExpression):
+        return None
+
+
+@lru_cache(maxsize = 2048)
+def get_expression_path(code: str) -> Optional[ExpressionPath]:
+    """Returns path if whole expression is attribute and constant item path, otherwise None"""
+    try:
+        tree = ast.parse(code, mode = 'eval')
+        return _get_path(tree.body)
+    except (SyntaxError, _DynamicExpression):
+        return None
+
+
+def _collect_paths(node: ast.AST, paths: dict):
+    if isinstance(node, (ast.Name, ast.Attribute, ast.Subscript)):
+        paths[_get_path(node)] = None
+        return
+    if _is_constant(node):
+        return
+    if not isinstance(node, _STATIC_NODES):
+        raise _DynamicExpression()
+    for child in ast.iter_child_nodes(node):
+        _collect_paths(child, paths)
+
+
+def _get_path(node: ast.AST) -> ExpressionPath:
+    if isinstance(node, ast.Name):
+        return (PathKey(node.id, True), )
+    if isinstance(node, ast.Attribute):
+        return _get_path(node.value) + (PathKey(node.attr), )
+    if isinstance(node, ast.Subscript):
+        return _get_path(node.value) + (PathKey(_get_key(node.slice), True), )
+    raise _DynamicExpression()
+
+
+def _get_key(node: ast.AST) -> Any:
+    if version_info < (3, 9) and isinstance(node, ast.Index):
+        node = node.value
+    try:
+        key = ast.literal_eval(node)
+        hash(key)
+        return key
+    except (ValueError, TypeError) as error:
+        raise _DynamicExpression() from error
+
+
+def _is_constant(node: ast.AST) -> bool:
+    if version_info < (3, 8):
+        return isinstance(node, (ast.Num, ast.Str, ast.Bytes, ast.NameConstant, ast.Ellipsis))
+    return isinstance(node, ast.Constant)
+
 
 @dependency
 def execute(expression: Union[Expression, str], parameters: Optional[dict] = None) -> Any:
@@ -85,6 +373,60 @@ def execute(expression: Union[Expression, str], parameters: Optional[dict] = Non
         return eval(expression.compiled_code, parameters, parameters)
 
 
+def execute_many(
+    expressions: Sequence[Expression],
+    parameters: Optional[dict] = None,
+    before_each: Optional[Callable[[Expression], None]] = None
+) -> List[Any]:
+    """Executes expressions with same parameters and returns results. before_each is called before every execution"""
+    parameters = {} if parameters is None else parameters
+    results = []
+    expression = None
+    try:
+        for expression in expressions:
+            if before_each is not None:
+                before_each(expression)
+            results.append(eval(expression.compiled_code, parameters, parameters))
+    except PyViewsError:
+        raise
+    except BaseException as exc:
+        error = ExpressionError('Error occurred in expression execution', expression.code if expression else None)
+        error.cause_error = exc
+        raise error from exc
+    return results
+
+
+_MISSING = object()
+
+
+def evaluate(expression: Expression, parameters: Optional[dict] = None) -> Any:
+    """
+    Executes expression and returns result.
+    Uses expression function and passes only used names instead of evaluating code with whole parameters dict.
+    Values are read from parameters dict directly and are not recorded
+    """
+    parameters = {} if parameters is None else parameters
+    try:
+        expression_function = expression.function
+        if expression_function is None:
+            return eval(expression.compiled_code, parameters, parameters)
+        args = []
+        for name in expression_function.names:
+            value = dict.get(parameters, name, _MISSING)
+            if value is _MISSING:
+                value = builtins.__dict__.get(name, _MISSING)
+            if value is _MISSING:
+                return eval(expression.compiled_code, parameters, parameters)
+            args.append(value)
+        return expression_function.function(*args)
+    except PyViewsError:
+        raise
+    except BaseException as exc:
+        error = ExpressionError('Error occurred in expression execution', expression.code)
+        error.cause_error = exc
+        raise error from exc
+
+
 EXPRESSION_REGEX = compile_regex(r'([a-zA-Z_]{1,}\:){0,1}\{.*\}')
 
 
@@ -107,3 +449,25 @@ def parse_expression(source: str) -> ParsedExpression:
     else:
         binding_type = 'oneway'
     return ParsedExpression(binding_type, source[1:-1])
+
+
+class AttrBinding(NamedTuple):
+    """Classified xml attribute value. Binding type is None for plain values"""
+    binding_type: Optional[str] = None
+    body: Optional[str] = None
+    expression: Optional[Expression] = None
+
+
+def parse_attr_value(value: Optional[str], compile_expression: bool = False) -> AttrBinding:
+    """Returns binding type and expression body for expression value, empty AttrBinding for plain value"""
+    stripped_value = value.strip() if value else ''
+    if not is_expression(stripped_value):
+        return AttrBinding()
+    binding_type, body = parse_expression(stripped_value)
+    expression = None
+    if compile_expression:
+        try:
+            expression = Expression(body)
+        except ExpressionError:
+            pass
+    return AttrBinding(binding_type, body, expression)
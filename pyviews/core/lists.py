@@ -0,0 +1,173 @@
+"""Bindable list"""
+
+from enum import Enum
+from typing import Any, Callable, Iterable, NamedTuple, Optional, Union
+
+from pyviews.core.binding import Bindable, Subscription
+
+
+class ListAction(Enum):
+    """Kind of BindableList change"""
+    INSERT = 'insert'
+    REMOVE = 'remove'
+    REPLACE = 'replace'
+    MOVE = 'move'
+    SLICE = 'slice'
+
+
+class ListChange(NamedTuple):
+    """
+    Change of BindableList items range.
+    Items from index are replaced: old_items are removed and items are inserted.
+    Moved item is removed from index and inserted to new_index
+    """
+    action: ListAction
+    index: int
+    items: tuple = ()
+    old_items: tuple = ()
+    new_index: Optional[int] = None
+
+
+class BindableList(list, Bindable):
+    """List that notifies about changed ranges of items. Reads are not recorded"""
+
+    def __init__(self, items: Iterable = ()):
+        list.__init__(self, items)
+
+    def __getattribute__(self, name: str):
+        return object.__getattribute__(self, name)
+
+    def observe_changes(self, callback: Callable[[ListChange], None], weak: bool = False) -> Subscription:
+        """Subscribes to items changes. Weak subscription is removed after callback is garbage collected"""
+        return self._add_all_callback(callback, weak)
+
+    def release_changes(self, callback: Callable[[ListChange], None]):
+        """Releases callback from items changes"""
+        self._release_all_callback(callback)
+
+    def __setitem__(self, index: Union[int, slice], value: Any):
+        if not isinstance(index, slice):
+            index = self._get_index(index)
+            old_value = list.__getitem__(self, index)
+            list.__setitem__(self, index, value)
+            self._notify_changed(index, (value,), (old_value,))
+        elif index.step in (None, 1):
+            start, stop, _ = index.indices(len(self))
+            stop = max(start, stop)
+            old_items, items = tuple(list.__getitem__(self, slice(start, stop))), tuple(value)
+            list.__setitem__(self, slice(start, stop), items)
+            self._notify_changed(start, items, old_items)
+        else:
+            old_items = tuple(self)
+            list.__setitem__(self, index, value)
+            self._notify_changed(0, tuple(self), old_items)
+
+    def __delitem__(self, index: Union[int, slice]):
+        if not isinstance(index, slice):
+            index = self._get_index(index)
+            old_value = list.__getitem__(self, index)
+            list.__delitem__(self, index)
+            self._notify_changed(index, (), (old_value,))
+        elif index.step in (None, 1):
+            start, stop, _ = index.indices(len(self))
+            old_items = tuple(list.__getitem__(self, slice(start, max(start, stop))))
+            list.__delitem__(self, index)
+            self._notify_changed(start, (), old_items)
+        else:
+            old_items = tuple(self)
+            list.__delitem__(self, index)
+            self._notify_changed(0, tuple(self), old_items)
+
+    def __iadd__(self, items: Iterable):
+        self.extend(items)
+        return self
+
+    def __imul__(self, count: int):
+        if count <= 0:
+            self.clear()
+        else:
+            self.extend(tuple(self) * (count - 1))
+        return self
+
+    def append(self, value: Any):
+        index = len(self)
+        list.append(self, value)
+        self._notify_changed(index, (value,), ())
+
+    def extend(self, items: Iterable):
+        index, items = len(self), tuple(items)
+        list.extend(self, items)
+        self._notify_changed(index, items, ())
+
+    def insert(self, index: int, value: Any):
+        index = min(max(index + len(self) if index < 0 else index, 0), len(self))
+        list.insert(self, index, value)
+        self._notify_changed(index, (value,), ())
+
+    def pop(self, index: int = -1) -> Any:
+        index = self._get_index(index)
+        value = list.pop(self, index)
+        self._notify_changed(index, (), (value,))
+        return value
+
+    def remove(self, value: Any):
+        del self[self.index(value)]
+
+    def clear(self):
+        old_items = tuple(self)
+        list.clear(self)
+        self._notify_changed(0, (), old_items)
+
+    def sort(self, *, key: Optional[Callable] = None, reverse: bool = False):
+        old_items = tuple(self)
+        list.sort(self, key = key, reverse = reverse)
+        self._notify_changed(0, tuple(self), old_items)
+
+    def reverse(self):
+        old_items = tuple(self)
+        list.reverse(self)
+        self._notify_changed(0, tuple(self), old_items)
+
+    def move(self, index: int, new_index: int):
+        """Moves item from index to new index"""
+        index, new_index = self._get_index(index), self._get_index(new_index)
+        if index == new_index:
+            return
+        value = list.pop(self, index)
+        list.insert(self, new_index, value)
+        self._notify_change(ListChange(ListAction.MOVE, index, (value,), (), new_index))
+
+    def _get_index(self, index: int) -> int:
+        length = len(self)
+        if not -length <= index < length:
+            raise IndexError('list index out of range')
+        return index + length if index < 0 else index
+
+    def _notify_changed(self, index: int, items: tuple, old_items: tuple):
+        if not old_items:
+            action = ListAction.INSERT
+        elif not items:
+            action = ListAction.REMOVE
+        elif len(items) == len(old_items):
+            if all(item is old_item for item, old_item in zip(items, old_items)):
+                return
+            action = ListAction.REPLACE
+        else:
+            action = ListAction.SLICE
+        if items or old_items:
+            self._notify_change(ListChange(action, index, items, old_items))
+
+    def _notify_change(self, change: ListChange):
+        self._deliver(_ListChangeKey(), change, None)
+
+    def _dispatch(self, key: Any, value: Any, old_value: Any):
+        if isinstance(key, _ListChangeKey):
+            self._notify_all_callbacks(value)
+        else:
+            super()._dispatch(key, value, old_value)
+
+
+class _ListChangeKey:
+    """Unique key of list change. Batch and dispatcher deliver every list change instead of merging them"""
+
+    __slots__ = ()
@@ -0,0 +1,115 @@
+"""Mirroring of bindable fields written in other process"""
+
+from contextlib import contextmanager
+from multiprocessing import SimpleQueue
+from typing import Any, Dict, Generator, NamedTuple, Optional, Tuple, Union
+
+from pyviews.core.binding import BindableEntity, BindingError, batch
+from pyviews.core.buffer import BindableBuffer
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError: # python < 3.8
+    SharedMemory = None
+
+_VALUE = 0
+_BUFFER = 1
+
+
+class BufferField(NamedTuple):
+    """Buffer field placed in shared memory"""
+    name: str
+    offset: int
+    size: int
+
+
+class MirrorHandle(NamedTuple):
+    """Handle that is passed to other process as Process argument to create MirrorWriter"""
+    memory_name: str
+    buffers: Tuple[BufferField, ...]
+    queue: SimpleQueue
+
+
+class SharedMirror(BindableEntity):
+    """
+    Bindable that applies field changes written by MirrorWriter in other process.
+    Buffer fields are BindableBuffer views of shared memory, values are passed by queue
+    """
+
+    def __init__(self, values: Optional[Dict[str, Any]] = None, buffers: Optional[Dict[str, int]] = None):
+        super().__init__()
+        if SharedMemory is None:
+            raise BindingError('Shared memory mirroring requires python 3.8 or later')
+        offset, fields = 0, []
+        for name, size in (buffers or {}).items():
+            fields.append(BufferField(name, offset, size))
+            offset += size
+        self._memory = SharedMemory(create = True, size = max(offset, 1))
+        self._queue = SimpleQueue()
+        self._handle = MirrorHandle(self._memory.name, tuple(fields), self._queue)
+        for name, value in (values or {}).items():
+            setattr(self, name, value)
+        for field in fields:
+            setattr(self, field.name, BindableBuffer(self._memory.buf[field.offset:field.offset + field.size]))
+
+    @property
+    def handle(self) -> MirrorHandle:
+        """Handle that is passed to other process to create MirrorWriter"""
+        return self._handle
+
+    def apply_changes(self, limit: Optional[int] = None) -> int:
+        """Applies changes written by MirrorWriter. Changes are notified in batch. Returns count of applied changes"""
+        count = 0
+        with batch():
+            while (limit is None or count < limit) and not self._queue.empty():
+                change = self._queue.get()
+                if change[0] == _VALUE:
+                    setattr(self, change[1], change[2])
+                else:
+                    getattr(self, change[1]).notify_written(change[2], change[3])
+                count += 1
+        return count
+
+    def close(self):
+        """Detaches buffer fields and releases shared memory"""
+        for field in self._handle.buffers:
+            getattr(self, field.name).detach()
+        self._memory.close()
+        self._memory.unlink()
+
+
+class MirrorWriter:
+    """Writes fields of SharedMirror from other process"""
+
+    def __init__(self, handle: MirrorHandle):
+        self._memory = SharedMemory(name = handle.memory_name)
+        self._queue: SimpleQueue = handle.queue
+        self._buffers: Dict[str, BufferField] = {field.name: field for field in handle.buffers}
+
+    def set(self, name: str, value: Any):
+        """Passes field value. Value is pickled"""
+        self._queue.put((_VALUE, name, value))
+
+    def write(self, name: str, data: Union[bytes, bytearray, memoryview], offset: int = 0):
+        """Copies data to buffer field from offset"""
+        field = self._buffers[name]
+        stop = offset + len(data)
+        if offset < 0 or stop > field.size:
+            raise ValueError(f'Data is out of "{name}" buffer range')
+        self._memory.buf[field.offset + offset:field.offset + stop] = data
+        self._queue.put((_BUFFER, name, offset, stop))
+
+    @contextmanager
+    def writable(self, name: str, start: int = 0, stop: Optional[int] = None) -> Generator[memoryview, None, None]:
+        """Returns writable view of buffer field range. Range is passed as written at the end of with block"""
+        field = self._buffers[name]
+        start, stop, _ = slice(start, stop).indices(field.size)
+        try:
+            with self._memory.buf[field.offset + start:field.offset + stop] as view:
+                yield view
+        finally:
+            self._queue.put((_BUFFER, name, start, stop))
+
+    def close(self):
+        """Releases shared memory"""
+        self._memory.close()
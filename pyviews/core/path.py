@@ -0,0 +1,173 @@
+"""Observing and statical reading of bindable paths"""
+
+from functools import partial
+from operator import attrgetter, itemgetter
+from types import GetSetDescriptorType, MemberDescriptorType, WrapperDescriptorType
+from typing import Any, Callable, Iterable, List, Optional, Set, Tuple, Union
+
+from pyviews.core.binding import (Bindable, BindableDict, BindableField, BindableProperty, BindableRecord, BindingError,
+                                  ComputedProperty, Subscription)
+from pyviews.core.expression import ExpressionPath, PathKey, get_expression_path
+
+
+KeySubscription = Tuple[Bindable, Any, Subscription]
+PathCallback = Callable[[Any, Any], None]
+_NOT_FOUND = object()
+
+
+class PathObserver:
+    """
+    Observes value of attribute and item path like "selection.owner.name".
+    Subscribes to every observable path key. Path keys after changed one are resubscribed on change
+    """
+
+    def __init__(self, root: Any, path: ExpressionPath, callback: PathCallback):
+        self._root: Any = root
+        self._path: ExpressionPath = path
+        self._callback: PathCallback = callback
+        self._getters = [itemgetter(key.key) if key.is_item else attrgetter(key.key) for key in path]
+        self._instances: List[Any] = []
+        self._subscriptions: List[Optional[KeySubscription]] = []
+        self._versions: Optional[Tuple[int, ...]] = None
+        self._value: Any = None
+
+    @property
+    def value(self) -> Any:
+        """Current path value. None if path can't be read"""
+        return self._value
+
+    def observe(self) -> Any:
+        """Subscribes to path keys and returns path value"""
+        self.release()
+        self._value = self._subscribe_from(0, self._root)
+        self._versions = self._get_versions()
+        return self._value
+
+    def release(self):
+        """Releases all path keys"""
+        self._release_from(0)
+        self._versions = None
+
+    def _subscribe_from(self, start: int, inst: Any) -> Any:
+        for index in range(start, len(self._path)):
+            self._instances.append(inst)
+            self._subscriptions.append(self._subscribe_key(index, inst))
+            inst = self._read(index, inst)
+            if inst is _NOT_FOUND:
+                return None
+        return inst
+
+    def _subscribe_key(self, index: int, inst: Any) -> Optional[KeySubscription]:
+        path_key = self._path[index]
+        if not is_observable_key(inst, path_key):
+            return None
+        try:
+            return inst, path_key.key, inst.observe(path_key.key, partial(self._key_changed, index))
+        except KeyError:
+            return None
+
+    def _read(self, index: int, inst: Any) -> Any:
+        try:
+            return self._getters[index](inst)
+        except (LookupError, AttributeError, TypeError):
+            return _NOT_FOUND
+
+    def _key_changed(self, index: int, *_):
+        if index >= len(self._instances) or self._versions == self._get_versions():
+            return
+        self._release_from(index + 1)
+        inst = self._read(index, self._instances[index])
+        value = None if inst is _NOT_FOUND else self._subscribe_from(index + 1, inst)
+        self._versions = self._get_versions()
+        old_value, self._value = self._value, value
+        if index == len(self._path) - 1 or value is not old_value:
+            self._callback(value, old_value)
+
+    def _get_versions(self) -> Tuple[int, ...]:
+        return tuple(sub[0].get_version(sub[1]) for sub in self._subscriptions if sub is not None)
+
+    def _release_from(self, start: int):
+        for subscription in self._subscriptions[start:]:
+            if subscription is not None:
+                subscription[2].release()
+        del self._instances[start:]
+        del self._subscriptions[start:]
+
+
+def observe_path(root: Any, path: Union[str, ExpressionPath], callback: PathCallback) -> PathObserver:
+    """
+    Calls callback with new and old values when value of path from root is changed.
+    Returned observer is used to read current value and to release subscriptions
+    """
+    observer = PathObserver(root, parse_path(path) if isinstance(path, str) else path, callback)
+    observer.observe()
+    return observer
+
+
+def parse_path(path: str) -> ExpressionPath:
+    """Parses attribute and item path relative to root like "selection.owner.name" or "[0].name" """
+    expression_path = get_expression_path(f'_root{path}' if path.startswith('[') else f'_root.{path}')
+    if expression_path is None:
+        raise BindingError(f'"{path}" is not attribute or item path')
+    return expression_path[1:]
+
+
+_PLAIN_GETATTRIBUTE = {Bindable.__getattribute__, BindableDict.__getattribute__}
+_PLAIN_CONTAINERS = (dict, list, tuple, str)
+_PLAIN_VALUES = (str, int, float, bool, type(None))
+_PLAIN_DESCRIPTORS = (GetSetDescriptorType, MemberDescriptorType, BindableProperty, BindableField,
+                      ComputedProperty)
+
+
+def get_path_records(root: Any, paths: Iterable[ExpressionPath]) -> Optional[Set[BindableRecord]]:
+    """
+    Returns records for bindable keys read by paths.
+    None if some read can't be resolved statically: properties, custom attribute or item access
+    or path value that can run custom code in expression like __str__ or __bool__
+    """
+    records = set()
+    for path in paths:
+        inst = root
+        try:
+            for path_key in path:
+                if not is_plain_read(inst, path_key):
+                    return None
+                if is_observable_key(inst, path_key):
+                    records.add(BindableRecord(inst, path_key.key))
+                inst = inst[path_key.key] if path_key.is_item else getattr(inst, path_key.key)
+        except (LookupError, TypeError, AttributeError):
+            continue
+        if type(inst) not in _PLAIN_VALUES:
+            return None
+    return records
+
+
+def is_plain_read(inst: Any, path_key: PathKey) -> bool:
+    """Returns true if reading path key from instance doesn't run custom code like properties"""
+    if path_key.is_item:
+        return _is_plain_item(inst)
+    return _is_plain_attribute(inst, path_key.key)
+
+
+def is_observable_key(inst: Any, path_key: PathKey) -> bool:
+    """Returns true if instance notifies about path key changes"""
+    if path_key.is_item:
+        return isinstance(inst, BindableDict)
+    return isinstance(inst, Bindable) and not isinstance(inst, BindableDict)
+
+
+def _is_plain_item(inst: Any) -> bool:
+    if isinstance(inst, BindableDict):
+        return type(inst).__getitem__ is BindableDict.__getitem__
+    return type(inst) in _PLAIN_CONTAINERS
+
+
+def _is_plain_attribute(inst: Any, key: str) -> bool:
+    inst_type = type(inst)
+    get_attribute = inst_type.__getattribute__
+    if not isinstance(get_attribute, WrapperDescriptorType) and get_attribute not in _PLAIN_GETATTRIBUTE:
+        return False
+    if hasattr(inst_type, '__getattr__'):
+        return False
+    descriptor = getattr(inst_type, key, None)
+    return not hasattr(descriptor, '__set__') or isinstance(descriptor, _PLAIN_DESCRIPTORS)
@@ -1,19 +1,27 @@
 """Core classes for creation from xml nodes"""
 
 from functools import partial
-from typing import Any, Callable, List, Optional, Set, Union
+from typing import Any, Callable, List, Optional, Set, Tuple, Union
 
 from pyviews.core.binding import BindableDict, Binding
 from pyviews.core.error import PyViewsError, ViewInfo
 from pyviews.core.xml import XmlNode
 
 
+_OWN_KEYS_TUPLE_SIZE = 8
+
+
+def _do_nothing(_):
+    pass
+
+
 class NodeGlobals(BindableDict):
 
+    _own_keys: Union[Tuple[Any, ...], Set[Any]] = ()
+    _parent: Optional[BindableDict] = None
+
     def __init__(self, parent: Optional[Union[dict, 'BindableDict']] = None):
         super().__init__(parent)
-        self._own_keys: Set[str] = set()
-        self._parent: Optional[BindableDict] = None
         if isinstance(parent, BindableDict):
             self._use_parent(parent)
 
@@ -30,13 +38,12 @@ class NodeGlobals(BindableDict):
     def __delitem__(self, key: str):
         if self._parent and key in self._parent:
             super().__setitem__(key, self._parent[key])
-            self._own_keys.remove(key)
         else:
             super().__delitem__(key)
-            self._own_keys.remove(key)
+        self._remove_own_key(key)
 
     def __setitem__(self, key: Any, value: Any):
-        self._own_keys.add(key)
+        self._add_own_key(key)
         super().__setitem__(key, value)
 
     def pop(self, key: Any, default: Any = None) -> Any:
@@ -46,9 +53,26 @@ class NodeGlobals(BindableDict):
         else:
             value = super().pop(key, default)
         if key in self._own_keys:
-            self._own_keys.remove(key)
+            self._remove_own_key(key)
         return value
 
+    def _add_own_key(self, key: Any):
+        own_keys = self._own_keys
+        if isinstance(own_keys, set):
+            own_keys.add(key)
+        elif key not in own_keys:
+            own_keys = (*own_keys, key)
+            self._own_keys = set(own_keys) if len(own_keys) > _OWN_KEYS_TUPLE_SIZE else own_keys
+
+    def _remove_own_key(self, key: Any):
+        own_keys = self._own_keys
+        if isinstance(own_keys, set):
+            own_keys.remove(key)
+        elif key in own_keys:
+            self._own_keys = tuple(own_key for own_key in own_keys if own_key != key)
+        else:
+            raise KeyError(key)
+
 
 class Node:
     """Represents node with properties and bindings created from xml node"""
@@ -60,7 +84,7 @@ class Node:
         self._globals: NodeGlobals = NodeGlobals() if node_globals is None else node_globals
         self._globals['node'] = self
         self.set_attr: Callable[[str, Any], None] = partial(setattr, self)
-        self.on_destroy: Callable[[Node], None] = lambda _: None
+        self.on_destroy: Callable[[Node], None] = _do_nothing
 
     @property
     def xml_node(self) -> XmlNode:
@@ -1,8 +1,19 @@
-from unittest.mock import Mock, call
+import gc
+from threading import Thread
+from typing import ClassVar
+from unittest.mock import Mock, call, patch
 
 from pytest import fixture, mark, raises
 
-from pyviews.core.binding import BindableDict, BindableEntity, BindableRecord, recording
+from pyviews.core import binding
+from pyviews.core.binding import (ALL_KEYS, Bindable, BindableDict, BindableEntity, BindableRecord, Dispatcher, Records,
+                                  Subscribers, SubscribersStats, batch, batch_recording, bindable, computed,
+                                  get_dispatcher, get_subscribers_stats, get_versions, observable, recording,
+                                  reset_dispatcher, use_comparator, use_dispatcher)
+from pyviews.core.comparators import always_changed, identical
+from pyviews.core.expression import Expression, execute
+from pyviews.core.lists import BindableList, ListAction, ListChange
+from pyviews.core.path import get_path_records, observe_path, parse_path
 
 
 class TestBindable(BindableEntity):
@@ -82,6 +93,18 @@ class BindableEntityTests:
         self.observable.name = 'another name'
         assert self.callback.call_count == 1
 
+    def test_get_version(self):
+        """get_version() should return count of property changes"""
+        initial = self.observable.get_version('name')
+
+        self.observable.name = 'new name'
+        self.observable.name = 'new name'
+        self.observable.name = 'some name'
+
+        assert initial == 0
+        assert self.observable.get_version('name') == 2
+        assert self.observable.get_version('value') == 0
+
     def test_recording(self):
         one = TestBindable('one', 'one', 'one')
         one.value = 'value'
@@ -101,6 +124,75 @@ class BindableEntityTests:
         assert records == {BindableRecord(self.observable, 'name'), BindableRecord(two, 'value')}
 
 
+def test_batch_recording():
+    """batch_recording() should record reads to separate sets"""
+    one, two = TestBindable('one', 'one', 'one'), TestBindable('two', 'two', 'two')
+    with batch_recording() as batch:
+        _ = one.name
+        batch.next()
+        _ = one.value
+        batch.next()
+        _ = two.name
+    _ = two.value
+
+    assert batch.records == [{BindableRecord(one, 'value')}, {BindableRecord(two, 'name')}]
+
+
+class RecordsTests:
+    """Records tests"""
+
+    @staticmethod
+    def test_deduplicates_reads():
+        """should store repeated reads of key once"""
+        one, two = BindableDict({'key': 1}), BindableDict({'key': 1})
+        records = Records()
+
+        for _ in range(3):
+            records.add(one, 'key')
+            records.add(two, 'key')
+            records.add(one, 'other')
+
+        assert len(records) == 3
+        assert records == {BindableRecord(one, 'key'), BindableRecord(two, 'key'), BindableRecord(one, 'other')}
+
+    @staticmethod
+    def test_contains():
+        """should check bindable identity and key"""
+        one, two = BindableDict({'key': 1}), BindableDict({'key': 1})
+        records = Records()
+        records.add(one, 'key')
+
+        assert BindableRecord(one, 'key') in records
+        assert BindableRecord(two, 'key') not in records
+        assert BindableRecord(one, 'other') not in records
+        assert (one, 'key') not in records
+
+    @staticmethod
+    def test_set_operations():
+        """set operations should return sets of records"""
+        one, two = BindableDict({'key': 1}), BindableDict({'key': 1})
+        records = Records()
+        records.add(one, 'key')
+        records.add(two, 'key')
+        other = {BindableRecord(two, 'key'), BindableRecord(one, 'other')}
+
+        assert records | other == {BindableRecord(one, 'key'), BindableRecord(two, 'key'), BindableRecord(one, 'other')}
+        assert records & other == {BindableRecord(two, 'key')}
+        assert records - other == {BindableRecord(one, 'key')}
+
+    @staticmethod
+    def test_recording_loop():
+        """recording() should record key read in loop once"""
+        bindable_dict = BindableDict({'key': 1})
+
+        with recording() as records:
+            value = execute(Expression('sum(bindable_dict["key"] for _ in range(100))'),
+                            {'bindable_dict': bindable_dict})
+
+        assert value == 100
+        assert list(records) == [BindableRecord(bindable_dict, 'key')]
+
+
 class BindableDictTests:
 
     @staticmethod
@@ -162,6 +254,20 @@ class BindableDictTests:
         assert callback.call_args == call(None, value)
         assert all_callback.call_args == call(key, None, value)
 
+    @staticmethod
+    def test_get_version():
+        """get_version() should return count of key changes"""
+        bindable_dict = BindableDict({'key': 1})
+
+        bindable_dict['key'] = 2
+        bindable_dict['key'] = 2
+        del bindable_dict['key']
+        bindable_dict['other'] = 1
+
+        assert bindable_dict.get_version('key') == 2
+        assert bindable_dict.get_version('other') == 1
+        assert bindable_dict.get_version('missing') == 0
+
     @staticmethod
     def test_observe_all():
         """observe_all() should subscribe callback to all existing values changes and new values adding"""
@@ -220,3 +326,791 @@ class BindableDictTests:
         _ = one['name']
 
         assert records == {BindableRecord(two, 'name'), BindableRecord(three, 'value'), BindableRecord(three, 'other')}
+
+
+class SubscriptionTests:
+    """Subscription tests"""
+
+    @staticmethod
+    def test_release():
+        """release() should remove only released subscription"""
+        entity, callback = TestBindable('private', 'name', 'value'), Mock()
+        subscription = entity.observe('name', callback)
+        entity.observe('name', callback)
+
+        subscription.release()
+        subscription.release()
+        entity.name = 'new name'
+
+        assert callback.call_count == 1
+        assert not subscription.is_active
+
+    @staticmethod
+    def test_release_all_subscription():
+        """release() should remove observe_all() subscription"""
+        bindable_dict, callback = BindableDict(), Mock()
+        subscription = bindable_dict.observe_all(callback)
+
+        subscription.release()
+        bindable_dict['key'] = 1
+
+        assert not callback.called
+
+    @staticmethod
+    def test_release_in_callback():
+        """subscription released in callback should be called during current dispatch"""
+        entity, callback = TestBindable('private', 'name', 'value'), Mock()
+        entity.observe('name', lambda *_: subscription.release())
+        subscription = entity.observe('name', callback)
+
+        entity.name = 'new name'
+        entity.name = 'another name'
+
+        assert callback.call_args_list == [call('new name', 'name')]
+
+
+class SubscribersTests:
+    """Subscribers tests"""
+
+    @staticmethod
+    def test_snapshot():
+        """snapshot should be reused until subscribers are changed"""
+        subscribers, one, two = Subscribers(), Mock(), Mock()
+        subscribers.add(one)
+        subscription = subscribers.add(two)
+
+        snapshot = subscribers.snapshot
+        same_snapshot = subscribers.snapshot
+        subscription.release()
+
+        assert snapshot == (one, two)
+        assert same_snapshot is snapshot
+        assert subscribers.snapshot == (one,)
+
+    @staticmethod
+    def test_remove_callback():
+        """remove_callback() should remove all subscriptions of callback"""
+        subscribers, one, two = Subscribers(), Mock(), Mock()
+        subscriptions = [subscribers.add(one), subscribers.add(two), subscribers.add(one)]
+
+        subscribers.remove_callback(one)
+
+        assert subscribers.snapshot == (two,)
+        assert [subscription.is_active for subscription in subscriptions] == [False, True, False]
+
+
+class Subscriber:
+
+    def __init__(self):
+        self.calls = []
+
+    def on_change(self, *args):
+        self.calls.append(args)
+
+
+@fixture
+def dispatcher_fixture(request):
+    with patch.object(binding, '_DISPATCHER', None):
+        request.cls.scheduled = []
+        request.cls.dispatcher = use_dispatcher(request.cls.scheduled.append)
+        yield
+
+
+def _run_in_thread(target):
+    thread = Thread(target = target)
+    thread.start()
+    thread.join()
+
+
+@mark.usefixtures('dispatcher_fixture')
+class DispatcherTests:
+    """Dispatcher tests"""
+
+    scheduled: list
+    dispatcher: Dispatcher
+
+    def test_notifies_on_ui_thread(self):
+        """should notify subscribers synchronously when changed on UI thread"""
+        bindable_dict, callback = BindableDict(), Mock()
+        bindable_dict.observe('key', callback)
+
+        bindable_dict['key'] = 1
+
+        assert callback.call_args_list == [call(1, None)]
+        assert not self.scheduled
+
+    def test_defers_changes_from_other_thread(self):
+        """should deliver changes made in other thread when scheduled callback is called"""
+        bindable_dict, callback = BindableDict(), Mock()
+        bindable_dict.observe('key', callback)
+
+        _run_in_thread(lambda: bindable_dict.__setitem__('key', 1))
+
+        assert not callback.called
+        assert self.dispatcher.pending == 1
+        self.scheduled[0]()
+        assert callback.call_args_list == [call(1, None)]
+        assert self.dispatcher.pending == 0
+
+    def test_coalesces_changes(self):
+        """should schedule delivery once and notify once per key with first old value and last value"""
+        entity, callback = TestBindable('private', 'name', 'value'), Mock()
+        entity.observe('name', callback)
+
+        def _update():
+            for i in range(100):
+                entity.name = i
+
+        _run_in_thread(_update)
+        self.dispatcher.drain()
+
+        assert len(self.scheduled) == 1
+        assert callback.call_args_list == [call(99, 'name')]
+
+    def test_batch_in_other_thread(self):
+        """batch() in other thread should pass changes to dispatcher"""
+        bindable_dict, callback = BindableDict(), Mock()
+        bindable_dict.observe_all(callback)
+
+        def _update():
+            with batch():
+                bindable_dict['one'] = 1
+                bindable_dict['two'] = 2
+
+        _run_in_thread(_update)
+        assert not callback.called
+        self.dispatcher.drain()
+
+        assert callback.call_args_list == [call('one', 1, None), call('two', 2, None)]
+
+    def test_defers_list_changes(self):
+        """should deliver every list change made in other thread on drain"""
+        items, callback = BindableList(), Mock()
+        items.observe_changes(callback)
+
+        def _update():
+            items.append(1)
+            items.append(2)
+
+        _run_in_thread(_update)
+        assert not callback.called
+        self.dispatcher.drain()
+
+        assert callback.call_args_list == [
+            call(ListChange(ListAction.INSERT, 0, (1,), ())),
+            call(ListChange(ListAction.INSERT, 1, (2,), ()))
+        ]
+
+    def test_schedules_again_after_drain(self):
+        """should schedule delivery for changes made after drain"""
+        bindable_dict = BindableDict()
+
+        _run_in_thread(lambda: bindable_dict.__setitem__('key', 1))
+        self.dispatcher.drain()
+        _run_in_thread(lambda: bindable_dict.__setitem__('key', 2))
+
+        assert len(self.scheduled) == 2
+
+    @staticmethod
+    def test_get_reset_dispatcher():
+        """get_dispatcher() should return used dispatcher, reset_dispatcher() should remove it"""
+        dispatcher = use_dispatcher(Mock())
+        assert get_dispatcher() is dispatcher
+
+        reset_dispatcher()
+
+        assert get_dispatcher() is None
+
+    @staticmethod
+    def test_concurrent_observe_release():
+        """observe() and release() should be safe from several threads"""
+        bindable_dict = BindableDict()
+
+        def _subscribe():
+            for _ in range(1000):
+                bindable_dict.observe('key', Mock()).release()
+
+        threads = [Thread(target = _subscribe) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for _ in range(1000):
+            bindable_dict['key'] = object()
+        for thread in threads:
+            thread.join()
+
+        assert get_subscribers_stats(bindable_dict)['key'] == SubscribersStats(0, 0)
+
+
+class WeakSubscriptionTests:
+    """Weak subscription tests"""
+
+    @staticmethod
+    def test_calls_live_subscriber():
+        """weak subscriber should be called while it is alive"""
+        entity, subscriber = TestBindable('private', 'name', 'value'), Subscriber()
+        entity.observe('name', subscriber.on_change, weak = True)
+
+        entity.name = 'new name'
+
+        assert subscriber.calls == [('new name', 'name')]
+
+    @staticmethod
+    def test_removes_collected_subscriber():
+        """weak subscriber should be removed after it is garbage collected"""
+        entity, subscriber, callback = TestBindable('private', 'name', 'value'), Subscriber(), Mock()
+        entity.observe('name', subscriber.on_change, weak = True)
+        entity.observe('name', callback)
+        del subscriber
+        gc.collect()
+
+        collected_stats = get_subscribers_stats(entity)
+        entity.name = 'new name'
+
+        assert collected_stats == {'name': SubscribersStats(1, 1)}
+        assert get_subscribers_stats(entity) == {'name': SubscribersStats(1, 1)}
+        assert len(entity._callbacks['name']) == 1
+        assert callback.called
+
+    @staticmethod
+    def test_release():
+        """release() should remove weak subscriber"""
+        entity, subscriber = TestBindable('private', 'name', 'value'), Subscriber()
+        entity.observe('name', subscriber.on_change, weak = True)
+
+        entity.release('name', subscriber.on_change)
+        entity.name = 'new name'
+
+        assert not subscriber.calls
+        assert get_subscribers_stats(entity) == {'name': SubscribersStats(0, 0)}
+
+    @staticmethod
+    def test_observe_all():
+        """weak observe_all() subscriber should be removed after it is garbage collected"""
+        bindable_dict, subscriber = BindableDict(), Subscriber()
+        bindable_dict.observe_all(subscriber.on_change, weak = True)
+        bindable_dict['key'] = 1
+        calls = subscriber.calls
+        del subscriber
+        gc.collect()
+
+        bindable_dict['key'] = 2
+
+        assert calls == [('key', 1, None)]
+        assert get_subscribers_stats(bindable_dict) == {ALL_KEYS: SubscribersStats(0, 1)}
+
+
+class BatchTests:
+    """batch() tests"""
+
+    @staticmethod
+    def test_defers_notifications():
+        """batch() should notify about changes at the end of with block"""
+        entity, callback = TestBindable('private', 'name', 'value'), Mock()
+        entity.observe('name', callback)
+        entity.observe('value', callback)
+
+        with batch():
+            entity.name = 'new name'
+            entity.value = 'new value'
+            assert not callback.called
+
+        assert callback.call_args_list == [call('new name', 'name'), call('new value', 'value')]
+
+    @staticmethod
+    def test_merges_changes():
+        """batch() should notify once with first old value and last value"""
+        entity, callback = TestBindable('private', 'name', 'value'), Mock()
+        entity.observe('name', callback)
+
+        with Bindable.batch():
+            entity.name = 'one'
+            entity.name = 'two'
+            entity.name = 'three'
+
+        assert callback.call_args_list == [call('three', 'name')]
+
+    @staticmethod
+    def test_skips_reverted_changes():
+        """batch() should not notify if key is changed back to initial value"""
+        bindable_dict, callback, all_callback = BindableDict({'key': 1}), Mock(), Mock()
+        bindable_dict.observe('key', callback)
+        bindable_dict.observe_all(all_callback)
+
+        with batch():
+            bindable_dict['key'] = 2
+            bindable_dict['key'] = 1
+
+        assert not callback.called
+        assert not all_callback.called
+
+    @staticmethod
+    def test_nested():
+        """nested batch() should be dispatched by outer batch"""
+        bindable_dict, callback = BindableDict(), Mock()
+        bindable_dict.observe_all(callback)
+
+        with batch():
+            with batch():
+                bindable_dict['key'] = 1
+            bindable_dict['key'] = 2
+            assert not callback.called
+
+        assert callback.call_args_list == [call('key', 2, None)]
+
+    @staticmethod
+    def test_scoped_to_context():
+        """batch() should not defer notifications from other threads"""
+        entity, callback = TestBindable('private', 'name', 'value'), Mock()
+        entity.observe('name', callback)
+
+        with batch():
+            thread = Thread(target = lambda: setattr(entity, 'name', 'thread name'))
+            thread.start()
+            thread.join()
+
+            assert callback.call_args_list == [call('thread name', 'name')]
+
+
+class PropertyEntity(BindableEntity):
+
+    name = observable('default')
+
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+
+class DeclaredBindable(Bindable):
+
+    name = observable('default')
+
+
+class BindablePropertyTests:
+    """observable() property tests"""
+
+    @staticmethod
+    def test_default():
+        """property should return default value if it is not set"""
+        assert PropertyEntity('value').name == 'default'
+
+    @staticmethod
+    def test_notifies():
+        """property should notify subscribers once on change"""
+        entity, callback = PropertyEntity('value'), Mock()
+        entity.observe('name', callback)
+
+        entity.name = 'new name'
+        entity.name = 'new name'
+
+        assert callback.call_args_list == [call('new name', 'default')]
+        assert entity.get_version('name') == 1
+
+    @staticmethod
+    def test_notifies_not_declared():
+        """not declared attributes of entity should notify about changes"""
+        entity, callback = PropertyEntity('value'), Mock()
+        entity.observe('value', callback)
+
+        entity.value = 'new value'
+
+        assert callback.call_args == call('new value', 'value')
+
+    @staticmethod
+    def test_bindable_names():
+        """entity class should store names of inherited declared properties that are not overridden"""
+
+        class ChildEntity(PropertyEntity):
+            label = observable('')
+
+        class OverriddenEntity(PropertyEntity):
+            name = 'plain'
+
+        assert ChildEntity._bindable_names == {'name', 'label'}
+        assert OverriddenEntity._bindable_names == frozenset()
+
+    @staticmethod
+    def test_records_only_declared():
+        """only reads of declared properties should be recorded"""
+        inst = DeclaredBindable()
+        inst.value = 'value'
+
+        with recording() as records:
+            _ = inst.name, inst.value, inst.observe
+
+        assert records == {BindableRecord(inst, 'name')}
+
+    @staticmethod
+    def test_entity_records_undeclared():
+        """entity with declared properties should record reads of undeclared attributes"""
+        entity = PropertyEntity('value')
+
+        with recording() as records:
+            _ = entity.name, entity.value
+
+        assert records == {BindableRecord(entity, 'name'), BindableRecord(entity, 'value')}
+
+    @staticmethod
+    def test_uses_default_attribute_access():
+        """class with declared properties should use default attribute access"""
+        assert DeclaredBindable.__getattribute__ is object.__getattribute__
+        assert PropertyEntity.__getattribute__ is not object.__getattribute__
+        assert TestBindable.__getattribute__ is not object.__getattribute__
+
+
+@bindable
+class Row:
+
+    name: str
+    value: int = 0
+    items: list = observable(comparator = identical)
+    kind: ClassVar[str] = 'row'
+
+
+@bindable
+class ChildRow(Row):
+
+    selected: bool = False
+
+
+@bindable
+class InitRow:
+
+    name: str = 'default'
+
+    def __init__(self, name):
+        self.title = name.title()
+
+
+@bindable
+class SuperInitRow:
+
+    a: int = 1
+
+    def __init__(self, a):
+        super().__init__()
+        self.a = a
+
+    @property
+    def defining_class(self):
+        return __class__
+
+
+class BindableDecoratorTests:
+    """bindable() tests"""
+
+    @staticmethod
+    def test_super_init():
+        """methods of created class should use it for super() and __class__"""
+        row = SuperInitRow(3)
+
+        assert row.a == 3
+        assert row.defining_class is SuperInitRow
+
+    @staticmethod
+    def test_slots():
+        """bindable() should create slotted bindable class"""
+        row = Row('name')
+
+        assert isinstance(row, Bindable)
+        assert Row.__slots__ == ('name', 'value', 'items', '_callbacks', '_versions', '_collected')
+        assert ChildRow.__slots__ == ('selected',)
+        assert Row.kind == 'row'
+
+    @staticmethod
+    @mark.parametrize('args, kwargs, expected', [
+        (('one',), {}, ('one', 0, None)),
+        (('one', 1, [1]), {}, ('one', 1, [1])),
+        ((), {'name': 'one', 'items': []}, ('one', 0, [])),
+    ]) # yapf: disable
+    def test_init(args, kwargs, expected):
+        """generated __init__ should set fields"""
+        row = Row(*args, **kwargs)
+
+        assert (row.name, row.value, row.items) == expected
+
+    @staticmethod
+    def test_inherited_fields():
+        """generated __init__ should set fields of bindable base class"""
+        row = ChildRow('one', 1, selected = True)
+
+        assert (row.name, row.value, row.selected) == ('one', 1, True)
+
+    @staticmethod
+    def test_custom_init():
+        """defined __init__ should be called after fields are set to defaults"""
+        row = InitRow('name')
+
+        assert (row.name, row.title) == ('default', 'Name')
+
+    @staticmethod
+    def test_required_after_default():
+        """bindable() should raise if field without default follows field with default"""
+        with raises(TypeError):
+
+            @bindable
+            class _Invalid:
+                value: int = 0
+                name: str
+
+    @staticmethod
+    def test_notifies():
+        """field should notify subscribers on change"""
+        row, callback = Row('name'), Mock()
+        row.observe('value', callback)
+
+        row.value = 1
+        row.value = 1
+
+        assert callback.call_args_list == [call(1, 0)]
+        assert row.get_version('value') == 1
+
+    @staticmethod
+    def test_field_comparator():
+        """field should use comparator passed to observable()"""
+        row, callback = Row('name', items = [1]), Mock()
+        row.observe('items', callback)
+
+        row.items = [1]
+
+        assert callback.call_args_list == [call([1], [1])]
+
+    @staticmethod
+    def test_batch():
+        """field changes should be merged by batch()"""
+        row, callback = Row('name'), Mock()
+        row.observe('value', callback)
+
+        with batch():
+            row.value = 1
+            row.value = 2
+
+        assert callback.call_args_list == [call(2, 0)]
+
+    @staticmethod
+    def test_records_fields():
+        """only reads of fields should be recorded"""
+        row = Row('name')
+
+        with recording() as records:
+            _ = row.name, row.value, row.observe
+
+        assert records == {BindableRecord(row, 'name'), BindableRecord(row, 'value')}
+
+    @staticmethod
+    def test_lazy_subscribers():
+        """subscribers storage should be allocated on first observe() call"""
+        rows = Row('one'), Row('two')
+
+        rows[0].observe('name', Mock())
+
+        assert get_subscribers_stats(rows[0]) == {'name': SubscribersStats(1, 0)}
+        assert get_subscribers_stats(rows[1]) == {}
+        assert object.__getattribute__(rows[1], '_callbacks') is object.__getattribute__(Row('three'), '_callbacks')
+
+    @staticmethod
+    def test_expression():
+        """field should be readable in expression and path"""
+        row = Row('name')
+        callback = Mock()
+
+        observe_path(BindableDict({'row': row}), "['row'].name", callback)
+        row.name = 'new name'
+
+        assert execute(Expression('row.name + str(row.value)'), {'row': row}) == 'new name0'
+        assert callback.call_args == call('new name', 'name')
+        assert get_path_records(row, [parse_path('name')]) == {BindableRecord(row, 'name')}
+
+
+class Invoice(BindableEntity):
+
+    def __init__(self, *amounts):
+        super().__init__()
+        self.lines = BindableDict({str(i): amount for i, amount in enumerate(amounts)})
+        self.discount = 0
+        self._computations = 0
+
+    @computed
+    def subtotal(self):
+        """sum of lines"""
+        self._computations += 1
+        return sum(self.lines[key] for key in self.lines)
+
+    @computed
+    def total(self):
+        return self.subtotal - self.discount
+
+
+class ComputedTests:
+    """computed() tests"""
+
+    @staticmethod
+    def test_caches_value():
+        """computed property should be computed once until read keys are changed"""
+        invoice = Invoice(1, 2)
+
+        assert (invoice.subtotal, invoice.subtotal, invoice.total) == (3, 3, 3)
+        assert invoice._computations == 1
+        assert Invoice.subtotal.__doc__ == 'sum of lines'
+
+    @staticmethod
+    def test_invalidates_lazily():
+        """computed property without observers should be computed on next read after change"""
+        invoice = Invoice(1, 2)
+        _ = invoice.subtotal
+
+        invoice.lines['0'] = 5
+        invoice.lines['1'] = 5
+
+        assert invoice._computations == 1
+        assert invoice.subtotal == 10
+        assert invoice._computations == 2
+
+    @staticmethod
+    def test_notifies_observers():
+        """computed property should notify observers once after change with computation per change"""
+        invoice, callbacks = Invoice(1, 2), [Mock() for _ in range(10)]
+        _ = invoice.subtotal
+        for callback in callbacks:
+            invoice.observe('subtotal', callback)
+
+        invoice.lines['0'] = 5
+
+        assert invoice._computations == 2
+        assert all(callback.call_args_list == [call(7, 3)] for callback in callbacks)
+        assert invoice.get_version('subtotal') == 1
+
+    @staticmethod
+    def test_skips_unchanged_value():
+        """computed property should not notify if computed value is not changed"""
+        invoice, callback = Invoice(1, 2), Mock()
+        _ = invoice.subtotal
+        invoice.observe('subtotal', callback)
+
+        with batch():
+            invoice.lines['0'] = 2
+            invoice.lines['1'] = 1
+
+        assert not callback.called
+        assert invoice._computations == 2
+
+    @staticmethod
+    def test_dependent_computed():
+        """computed property should be updated after computed property it reads"""
+        invoice, callback = Invoice(1, 2), Mock()
+        _ = invoice.total
+        invoice.observe('total', callback)
+
+        invoice.lines['0'] = 5
+        invoice.discount = 2
+
+        assert callback.call_args_list == [call(7, 3), call(5, 7)]
+
+    @staticmethod
+    def test_records_read():
+        """reading of computed property should be recorded without keys read by computation"""
+        invoice = Invoice(1, 2)
+
+        with recording() as records:
+            _ = invoice.subtotal
+
+        assert records == {BindableRecord(invoice, 'subtotal')}
+
+    @staticmethod
+    def test_set_raises():
+        """computed property should not be set"""
+        with raises(AttributeError):
+            Invoice().subtotal = 1
+
+    @staticmethod
+    def test_path():
+        """computed property should be observed by path"""
+        invoice, callback = Invoice(1, 2), Mock()
+        root = BindableDict({'invoice': invoice})
+
+        observer = observe_path(root, "['invoice'].total", callback)
+        invoice.discount = 1
+
+        assert observer.value == 2
+        assert callback.call_args == call(2, 3)
+        assert get_path_records(invoice, [parse_path('total')]) == {BindableRecord(invoice, 'total')}
+
+
+@use_comparator(identical)
+class IdentityEntity(BindableEntity):
+
+    def __init__(self, items):
+        super().__init__()
+        self.items = items
+
+
+@use_comparator(always_changed, 'key')
+class AlwaysChangedDict(BindableDict):
+    pass
+
+
+class ComparatorEntity(BindableEntity):
+
+    items = observable(comparator = identical)
+
+
+class ComparatorTests:
+    """Comparators configuration tests"""
+
+    @staticmethod
+    def test_class_comparator():
+        """class comparator should be used for every key"""
+        items, callback = [1], Mock()
+        entity = IdentityEntity(items)
+        entity.observe('items', callback)
+
+        entity.items = items
+        entity.items = [1]
+
+        assert callback.call_args_list == [call([1], items)]
+
+    @staticmethod
+    def test_key_comparator():
+        """key comparator should be used only for key"""
+        bindable_dict, callback = AlwaysChangedDict({'key': 1, 'other': 1}), Mock()
+        bindable_dict.observe_all(callback)
+
+        bindable_dict['key'] = 1
+        bindable_dict['other'] = 1
+
+        assert callback.call_args_list == [call('key', 1, 1)]
+        assert BindableDict._comparators == {}
+
+    @staticmethod
+    def test_property_comparator():
+        """observable() comparator should be used for property"""
+        entity, callback = ComparatorEntity(), Mock()
+        entity.observe('items', callback)
+
+        entity.items = [1]
+        entity.items = [1]
+
+        assert callback.call_count == 2
+
+    @staticmethod
+    def test_batch_uses_comparator():
+        """batch() should use comparator to check merged change"""
+        items, callback = [1], Mock()
+        entity = IdentityEntity(items)
+        entity.observe('items', callback)
+
+        with batch():
+            entity.items = [1]
+            entity.items = items
+
+        assert not callback.called
+
+
+def test_get_versions():
+    """get_versions() should return versions of recorded keys"""
+    one, two = TestBindable('one', 'one', 'one'), BindableDict({'key': 1})
+    one.name = 'new'
+    two['key'] = 2
+    two['key'] = 3
+
+    assert get_versions([BindableRecord(one, 'name'), BindableRecord(two, 'key'), BindableRecord(one, 'value')]) \
+        == (1, 2, 0)
@@ -0,0 +1,127 @@
+from unittest.mock import Mock, call, patch
+
+from pytest import mark, raises
+
+from pyviews.core import buffer as buffer_module
+from pyviews.core.binding import (ALL_KEYS, BindableRecord, BindingError, SubscribersStats, batch,
+                                  get_subscribers_stats, recording)
+from pyviews.core.buffer import BindableBuffer, BufferChange
+
+
+def test_buffer_requires_readonly_views():
+    """BindableBuffer should raise error if read-only memory views are not supported"""
+    with patch(f'{buffer_module.__name__}._READONLY_VIEWS', False), raises(BindingError):
+        BindableBuffer(3)
+
+
+@mark.skipif(not buffer_module._READONLY_VIEWS, reason = 'read-only memory views are not supported')
+class BindableBufferTests:
+    """BindableBuffer tests"""
+
+    @staticmethod
+    @mark.parametrize('source, expected', [
+        (3, b'\0\0\0'),
+        (b'abc', b'abc'),
+        (bytearray(b'abc'), b'abc'),
+        (memoryview(b'abc'), b'abc')
+    ]) # yapf: disable
+    def test_init(source, expected):
+        """should create buffer with passed data or size"""
+        buffer = BindableBuffer(source)
+
+        assert buffer.view == expected
+        assert len(buffer) == len(expected)
+
+    @staticmethod
+    def test_wraps_without_copy():
+        """should use passed bytearray and provide read-only view"""
+        data = bytearray(b'abc')
+        buffer = BindableBuffer(data)
+
+        data[0] = ord('x')
+
+        assert buffer.view == b'xbc'
+        assert buffer.view.readonly
+        with raises(TypeError):
+            buffer.view[0] = 0
+
+    @staticmethod
+    def test_write():
+        """write() should copy data and notify about written range"""
+        buffer, callback, changes_callback = BindableBuffer(6), Mock(), Mock()
+        buffer.observe('view', callback)
+        buffer.observe_changes(changes_callback)
+
+        buffer.write(b'ab', 2)
+        buffer.write(b'ab', 2)
+
+        assert buffer.view == b'\0\0ab\0\0'
+        assert callback.call_args_list == [call(buffer.view, buffer.view)] * 2
+        assert changes_callback.call_args_list == [call(BufferChange(2, 4))] * 2
+        assert buffer.version == 2
+
+    @staticmethod
+    def test_write_out_of_range():
+        """write() should not resize buffer"""
+        buffer = BindableBuffer(2)
+
+        with raises(ValueError):
+            buffer.write(b'abc', 1)
+
+    @staticmethod
+    def test_writable():
+        """writable() should notify about range at the end of with block"""
+        buffer, changes_callback = BindableBuffer(b'abcdef'), Mock()
+        buffer.observe_changes(changes_callback)
+
+        with buffer.writable(1, -1) as view:
+            view[:] = b'1234'
+            assert not changes_callback.called
+
+        assert buffer.view == b'a1234f'
+        assert changes_callback.call_args_list == [call(BufferChange(1, 5))]
+
+    @staticmethod
+    def test_replace():
+        """replace() should notify about whole buffer"""
+        buffer, callback, changes_callback = BindableBuffer(b'abc'), Mock(), Mock()
+        buffer.observe('view', callback)
+        buffer.observe_changes(changes_callback)
+
+        buffer.replace(b'de')
+
+        assert buffer.view == b'de'
+        assert callback.call_args == call(buffer.view, buffer.view)
+        assert changes_callback.call_args_list == [call(BufferChange(0, 2))]
+
+    @staticmethod
+    def test_batch():
+        """ranges written in batch should be merged"""
+        buffer, callback, changes_callback = BindableBuffer(10), Mock(), Mock()
+        buffer.observe('view', callback)
+        buffer.observe_changes(changes_callback)
+
+        with batch():
+            buffer.write(b'a', 5)
+            buffer.write(b'bc', 1)
+
+        assert callback.call_count == 1
+        assert changes_callback.call_args_list == [call(BufferChange(1, 6))]
+
+    @staticmethod
+    def test_records_view():
+        """reading view should be recorded"""
+        buffer = BindableBuffer(1)
+
+        with recording() as records:
+            _ = buffer.view, buffer.version, len(buffer)
+
+        assert records == {BindableRecord(buffer, 'view')}
+
+    @staticmethod
+    def test_subscribers_stats():
+        """get_subscribers_stats() should return changes subscribers"""
+        buffer = BindableBuffer(1)
+        buffer.observe_changes(Mock())
+
+        assert get_subscribers_stats(buffer) == {ALL_KEYS: SubscribersStats(1, 0)}
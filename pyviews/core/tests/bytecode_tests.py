@@ -0,0 +1,103 @@
+from importlib.util import MAGIC_NUMBER
+from unittest.mock import patch
+
+from pytest import fixture, mark
+
+from pyviews.core import bytecode
+from pyviews.core.bytecode import BytecodeCache, get_bytecode_cache, use_bytecode_cache
+from pyviews.core.expression import Expression, get_compilation_cache
+
+
+@fixture
+def bytecode_fixture(request, tmp_path):
+    request.cls.path = str(tmp_path / 'expressions.pyc')
+    with patch.object(bytecode, '_BYTECODE_CACHE', None):
+        yield
+
+
+@mark.usefixtures('bytecode_fixture')
+class BytecodeCacheTests:
+    """BytecodeCache tests"""
+
+    path: str
+
+    def test_save_load(self):
+        """save() should write compiled code that can be loaded from file"""
+        cache = BytecodeCache(self.path)
+        cache.add('1 + 1', 'eval', compile('1 + 1', '<string>', 'eval'))
+        cache.save()
+
+        loaded = BytecodeCache(self.path)
+
+        assert eval(loaded.get('1 + 1', 'eval')) == 2
+        assert loaded.get('1 + 1', 'exec') is None
+
+    def test_save_keeps_loaded_items(self):
+        """save() should keep previously saved items"""
+        cache = BytecodeCache(self.path)
+        cache.add('one', 'eval', compile('1', '<string>', 'eval'))
+        cache.save()
+        cache = BytecodeCache(self.path)
+        cache.add('two', 'eval', compile('2', '<string>', 'eval'))
+        cache.save()
+
+        loaded = BytecodeCache(self.path)
+
+        assert loaded.get('one', 'eval') is not None
+        assert loaded.get('two', 'eval') is not None
+
+    @mark.parametrize('content', [b'', b'invalid', MAGIC_NUMBER + b'invalid', b'\0\0\0\0' + MAGIC_NUMBER])
+    def test_ignores_invalid_file(self, content: bytes):
+        """get() should ignore file with invalid content or magic number"""
+        with open(self.path, 'wb') as cache_file:
+            cache_file.write(content)
+
+        assert BytecodeCache(self.path).get('one', 'eval') is None
+
+    def test_ignores_missing_file(self):
+        """get() should return None if file doesn't exist"""
+        assert BytecodeCache(self.path).get('one', 'eval') is None
+
+    def test_clear(self):
+        """clear() should remove stored items"""
+        cache = BytecodeCache(self.path)
+        cache.add('one', 'eval', compile('1', '<string>', 'eval'))
+        cache.save()
+
+        cache.clear()
+        cache.save()
+
+        assert BytecodeCache(self.path).get('one', 'eval') is None
+
+
+@mark.usefixtures('bytecode_fixture')
+class UseBytecodeCacheTests:
+    """use_bytecode_cache() tests"""
+
+    path: str
+
+    def test_sets_cache(self, tmp_path):
+        """use_bytecode_cache() should set cache used by expressions"""
+        cache = use_bytecode_cache(str(tmp_path), save_on_exit = False)
+
+        assert get_bytecode_cache() is cache
+        assert cache.path.startswith(str(tmp_path))
+
+    def test_expression_stores_compiled_code(self, tmp_path):
+        """Expression should add compiled code to bytecode cache"""
+        cache = use_bytecode_cache(str(tmp_path), save_on_exit = False)
+
+        expression = Expression('bytecode_store_value + 1')
+
+        assert cache.get(expression.code, 'eval') is expression.compiled_code
+
+    def test_expression_loads_compiled_code(self, tmp_path):
+        """Expression should use compiled code from bytecode cache"""
+        code = 'bytecode_load_value + 1'
+        compiled = compile(code, '<string>', 'eval')
+        use_bytecode_cache(str(tmp_path), save_on_exit = False).add(code, 'eval', compiled)
+
+        expression = Expression(code)
+
+        assert expression.compiled_code is compiled
+        assert get_compilation_cache().get(code, 'eval') is compiled
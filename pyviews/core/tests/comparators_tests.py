@@ -0,0 +1,82 @@
+from pytest import mark
+
+from pyviews.core.comparators import always_changed, compare_by, equal, identical
+
+
+class ArrayLike:
+
+    def __init__(self, items):
+        self.items = items
+
+    def __array__(self):
+        return self.items
+
+    def __eq__(self, other):
+        return ElementWise()
+
+
+class ElementWise:
+
+    def __bool__(self):
+        raise ValueError('The truth value of an array is ambiguous')
+
+
+class Matched:
+
+    def __eq__(self, other):
+        return 1
+
+
+class Versioned:
+
+    def __init__(self, version):
+        self.version = version
+
+
+_ARRAY = ArrayLike([1, 2])
+_LIST = [1, 2]
+_VERSIONED = Versioned(1)
+
+
+@mark.parametrize('value, old_value, expected', [
+    (1, 1, True),
+    (1, 2, False),
+    ([1, 2], [1, 2], True),
+    (_ARRAY, _ARRAY, True),
+    (ArrayLike([1, 2]), ArrayLike([1, 2]), False),
+    (ArrayLike([1, 2]), None, False),
+    (ElementWise(), None, False),
+    (Matched(), None, True)
+]) # yapf: disable
+def test_equal(value, old_value, expected):
+    """equal() should compare values by equality and array-like values by identity"""
+    assert equal(value, old_value) == expected
+
+
+@mark.parametrize('value, old_value, expected', [
+    (_LIST, _LIST, True),
+    ([1, 2], [1, 2], False)
+]) # yapf: disable
+def test_identical(value, old_value, expected):
+    """identical() should compare values by identity"""
+    assert identical(value, old_value) == expected
+
+
+@mark.parametrize('value, old_value', [
+    (_LIST, _LIST),
+    (1, 2)
+]) # yapf: disable
+def test_always_changed(value, old_value):
+    """always_changed() should treat every value as changed"""
+    assert not always_changed(value, old_value)
+
+
+@mark.parametrize('value, old_value, expected', [
+    (_VERSIONED, _VERSIONED, True),
+    (Versioned(1), Versioned(1), True),
+    (Versioned(2), Versioned(1), False),
+    (Versioned(1), None, False)
+]) # yapf: disable
+def test_compare_by(value, old_value, expected):
+    """compare_by() should compare keys of values"""
+    assert compare_by(lambda versioned: versioned.version)(value, old_value) == expected
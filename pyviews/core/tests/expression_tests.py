@@ -1,7 +1,13 @@
-from pytest import mark, raises
+from sys import version_info
 
-from pyviews.core.expression import (Expression, ExpressionError, ParsedExpression, execute, is_expression,
-                                     parse_expression)
+from pytest import mark, param, raises
+
+from pyviews.core.expression import (AttrBinding, CompilationCache, Expression, ExpressionError, ParsedExpression,
+                                     PathKey, evaluate, execute, execute_many, get_compilation_cache,
+                                     get_expression_paths, is_expression, parse_attr_value, parse_expression)
+
+_REQUIRES_ASSIGNMENT_EXPRESSIONS = mark.skipif(version_info < (3, 8),
+                                                reason = 'assignment expressions require python 3.8')
 
 _EXPRESSION_TEST_PARAMETERS = [
     ('', None, None),
@@ -15,6 +21,99 @@ _EXPRESSION_TEST_PARAMETERS = [
 ] # yapf: disable
 
 
+class CompilationCacheTests:
+    """CompilationCache tests"""
+
+    @staticmethod
+    def test_get():
+        """get() should return stored compiled code"""
+        cache = CompilationCache()
+        compiled = compile('1 + 1', '<string>', 'eval')
+
+        cache.add('1 + 1', 'eval', compiled)
+
+        assert cache.get('1 + 1', 'eval') is compiled
+
+    @staticmethod
+    def test_key_includes_mode():
+        """get() should use compile mode as part of key"""
+        cache = CompilationCache()
+        cache.add('value', 'eval', compile('value', '<string>', 'eval'))
+
+        assert cache.get('value', 'exec') is None
+
+    @staticmethod
+    def test_evicts_least_recently_used():
+        """add() should remove least recently used item if cache is full"""
+        cache = CompilationCache(max_size = 2)
+        for code in ['one', 'two']:
+            cache.add(code, 'eval', compile(code, '<string>', 'eval'))
+        cache.get('one', 'eval')
+
+        cache.add('three', 'eval', compile('three', '<string>', 'eval'))
+
+        assert cache.get('two', 'eval') is None
+        assert cache.get('one', 'eval') is not None
+        assert cache.get('three', 'eval') is not None
+
+    @staticmethod
+    def test_max_size_setter_evicts():
+        """max_size setter should remove items over limit"""
+        cache = CompilationCache()
+        for code in ['one', 'two', 'three']:
+            cache.add(code, 'eval', compile(code, '<string>', 'eval'))
+
+        cache.max_size = 1
+
+        assert cache.stats().size == 1
+        assert cache.stats().evictions == 2
+        assert cache.get('three', 'eval') is not None
+
+    @staticmethod
+    def test_stats():
+        """stats() should return cache counters"""
+        cache = CompilationCache(max_size = 1)
+        cache.add('one', 'eval', compile('one', '<string>', 'eval'))
+        cache.get('one', 'eval')
+        cache.get('two', 'eval')
+        cache.add('two', 'eval', compile('two', '<string>', 'eval'))
+
+        stats = cache.stats()
+
+        assert (stats.size, stats.max_size, stats.hits, stats.misses, stats.evictions) == (1, 1, 1, 1, 1)
+        assert stats.memory > 0
+
+    @staticmethod
+    def test_clear():
+        """clear() should remove all items and reset counters"""
+        cache = CompilationCache()
+        cache.add('one', 'eval', compile('one', '<string>', 'eval'))
+        cache.get('one', 'eval')
+
+        cache.clear()
+
+        assert cache.stats() == (0, cache.max_size, 0, 0, 0, 0)
+
+
+class ExpressionTests:
+    """Expression tests"""
+
+    @staticmethod
+    def test_uses_compilation_cache():
+        """Expression should reuse compiled code for same code and mode"""
+        one, two = Expression('key + 1'), Expression('key + 1')
+
+        assert one.compiled_code is two.compiled_code
+
+    @staticmethod
+    def test_cache_uses_compile_mode():
+        """Expression should not share compiled code between compile modes"""
+        evaluated, executed = Expression('key', 'eval'), Expression('key', 'exec')
+
+        assert evaluated.compiled_code is not executed.compiled_code
+        assert get_compilation_cache().get('key', 'exec') is executed.compiled_code
+
+
 class ExecuteTests:
 
     @staticmethod
@@ -55,6 +154,130 @@ class ExecuteTests:
             execute(expression)
 
 
+class ExpressionFunctionTests:
+    """Expression.function tests"""
+
+    @staticmethod
+    @mark.parametrize('code, names', [
+        ('', ()),
+        ('2 + 2', ()),
+        ('key', ('key',)),
+        ('vm.key + vm.value', ('vm',)),
+        ('str(key)', ('str', 'key')),
+        ('[item.name for item in items if item.value > limit]', ('items', 'limit'))
+    ]) # yapf: disable
+    def test_names(code, names):
+        """function should receive used names as arguments"""
+        assert Expression(code).function.names == names
+
+    @staticmethod
+    @mark.parametrize('code, compile_mode', [
+        ('key = 1', 'exec'),
+        param('(key := 1)', 'eval', marks = _REQUIRES_ASSIGNMENT_EXPRESSIONS),
+        ('lambda: key', 'eval'),
+        ('(item for item in items)', 'eval'),
+        ('locals()', 'eval'),
+        ('vars()["key"]', 'eval')
+    ]) # yapf: disable
+    def test_not_compiled(code, compile_mode):
+        """function should be None if expression changes, inspects or captures scope"""
+        assert Expression(code, compile_mode).function is None
+
+
+@mark.parametrize('code, paths', [
+    ('', ()),
+    ('1 + 1', ()),
+    ('vm', ((PathKey('vm', True),),)),
+    ('vm.user.name', ((PathKey('vm', True), PathKey('user'), PathKey('name')),)),
+    ("item['key']", ((PathKey('item', True), PathKey('key', True)),)),
+    ('vms[0].name', ((PathKey('vms', True), PathKey(0, True), PathKey('name')),)),
+    ('vm.one + vm.two', ((PathKey('vm', True), PathKey('one')), (PathKey('vm', True), PathKey('two')))),
+    ('vm.one + vm.one', ((PathKey('vm', True), PathKey('one')),)),
+    ('vm.value if vm.flag else None',
+     ((PathKey('vm', True), PathKey('flag')), (PathKey('vm', True), PathKey('value')))),
+    ('f"{vm.name}"', ((PathKey('vm', True), PathKey('name')),)),
+    ('str(vm.name)', None),
+    ('vms[index].name', None),
+    ('vms[1:2]', None),
+    ('[item for item in items]', None),
+    ('lambda: vm.name', None),
+    ('(vm := 1)', None),
+    ('vm.', None)
+]) # yapf: disable
+def test_get_expression_paths(code, paths):
+    """get_expression_paths() should return attribute and item paths read by expression"""
+    assert get_expression_paths(code) == paths
+
+
+class ExecuteManyTests:
+    """execute_many() tests"""
+
+    @staticmethod
+    def test_returns_values():
+        """execute_many() should return values of all expressions"""
+        expressions = [Expression(code) for code, _, _ in _EXPRESSION_TEST_PARAMETERS[2:6]]
+
+        actual = execute_many(expressions, {'some_key': 1})
+
+        assert actual == [4, 1, 0, '1']
+
+    @staticmethod
+    def test_calls_before_each():
+        """execute_many() should call before_each before every expression execution"""
+        expressions = [Expression('1'), Expression('2')]
+        calls = []
+
+        execute_many(expressions, {}, calls.append)
+
+        assert calls == expressions
+
+    @staticmethod
+    def test_raises():
+        """execute_many() should raise error with failed expression"""
+        with raises(ExpressionError) as error:
+            execute_many([Expression('1'), Expression('2/0')])
+
+        assert error.value.expression == '2/0'
+
+
+class EvaluateTests:
+    """evaluate() tests"""
+
+    @staticmethod
+    @mark.parametrize('code, params, expected', [
+        *_EXPRESSION_TEST_PARAMETERS,
+        ('str', {'str': 'shadowed'}, 'shadowed'),
+        ('[item * factor for item in items]', {'items': [1, 2], 'factor': 2}, [2, 4]),
+        param('(key := 2) + key', {}, 4, marks = _REQUIRES_ASSIGNMENT_EXPRESSIONS),
+        ('(lambda: key)()', {'key': 3}, 3)
+    ]) # yapf: disable
+    def test_returns_value(code, params, expected):
+        """evaluate() should return expression value"""
+        actual = evaluate(Expression(code), params)
+
+        assert actual == expected
+
+    @staticmethod
+    def test_uses_actual_parameters():
+        """evaluate() should use passed parameters values"""
+        expression = Expression('key + 1')
+
+        assert evaluate(expression, {'key': 1}) == 2
+        assert evaluate(expression, {'key': 2}) == 3
+
+    @staticmethod
+    @mark.parametrize('code, params', [
+        ('2/0', {}),
+        ('missing_key', {}),
+        ('missing_key if key else 1', {'key': True}),
+        ('key.missing_attr', {'key': 1})
+    ]) # yapf: disable
+    def test_raises(code, params):
+        """evaluate() should raise ExpressionError if expression is failed"""
+        with raises(ExpressionError):
+            evaluate(Expression(code), params)
+
+
 @mark.parametrize('expr, expected', [
     ('{asdf}', True),
     ('once:{asdf}', True),
@@ -97,3 +320,29 @@ def test_is_expression(expr: str, expected: bool):
 def test_parse_expression(expr: str, expected: ParsedExpression):
     """parse_expression() should return tuple (binding_type, expression body)"""
     assert parse_expression(expr) == expected
+
+
+@mark.parametrize('value, expected', [
+    (None, AttrBinding()),
+    ('', AttrBinding()),
+    ('value', AttrBinding()),
+    ('{asdf}', AttrBinding('oneway', 'asdf')),
+    (' once:{asdf} ', AttrBinding('once', 'asdf')),
+    ('{{asdf}}', AttrBinding('twoways', 'asdf'))
+]) # yapf: disable
+def test_parse_attr_value(value, expected):
+    """parse_attr_value() should return binding type and expression body"""
+    assert parse_attr_value(value) == expected
+
+
+@mark.parametrize('value, code', [
+    ('{asdf}', 'asdf'),
+    ('once:{1 + 1}', '1 + 1'),
+    ('inline:{one}:{two}', None),
+    ('value', None)
+]) # yapf: disable
+def test_parse_attr_value_compiles_expression(value, code):
+    """parse_attr_value() should compile expression body if it is valid expression"""
+    expression = parse_attr_value(value, True).expression
+
+    assert (expression.code if expression else None) == code
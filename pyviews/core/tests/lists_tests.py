@@ -0,0 +1,101 @@
+from unittest.mock import Mock
+
+from pytest import mark
+
+from pyviews.core.binding import batch, recording
+from pyviews.core.lists import BindableList, ListAction, ListChange
+
+
+class BindableListTests:
+    """BindableList tests"""
+
+    @staticmethod
+    @mark.parametrize('change, expected', [
+        (lambda items: items.append(4), [ListChange(ListAction.INSERT, 3, (4,))]),
+        (lambda items: items.extend([4, 5]), [ListChange(ListAction.INSERT, 3, (4, 5))]),
+        (lambda items: items.__iadd__([4]), [ListChange(ListAction.INSERT, 3, (4,))]),
+        (lambda items: items.__imul__(2), [ListChange(ListAction.INSERT, 3, (1, 2, 3))]),
+        (lambda items: items.__imul__(0), [ListChange(ListAction.REMOVE, 0, (), (1, 2, 3))]),
+        (lambda items: items.insert(1, 4), [ListChange(ListAction.INSERT, 1, (4,))]),
+        (lambda items: items.insert(-1, 4), [ListChange(ListAction.INSERT, 2, (4,))]),
+        (lambda items: items.insert(10, 4), [ListChange(ListAction.INSERT, 3, (4,))]),
+        (lambda items: items.pop(), [ListChange(ListAction.REMOVE, 2, (), (3,))]),
+        (lambda items: items.pop(0), [ListChange(ListAction.REMOVE, 0, (), (1,))]),
+        (lambda items: items.remove(2), [ListChange(ListAction.REMOVE, 1, (), (2,))]),
+        (lambda items: items.clear(), [ListChange(ListAction.REMOVE, 0, (), (1, 2, 3))]),
+        (lambda items: items.__setitem__(-1, 4), [ListChange(ListAction.REPLACE, 2, (4,), (3,))]),
+        (lambda items: items.__setitem__(slice(0, 2), [4]), [ListChange(ListAction.SLICE, 0, (4,), (1, 2))]),
+        (lambda items: items.__setitem__(slice(1, 1), [4]), [ListChange(ListAction.INSERT, 1, (4,))]),
+        (lambda items: items.__setitem__(slice(None, None, 2), [4, 5]),
+         [ListChange(ListAction.REPLACE, 0, (4, 2, 5), (1, 2, 3))]),
+        (lambda items: items.__delitem__(0), [ListChange(ListAction.REMOVE, 0, (), (1,))]),
+        (lambda items: items.__delitem__(slice(1, None)), [ListChange(ListAction.REMOVE, 1, (), (2, 3))]),
+        (lambda items: items.__delitem__(slice(None, None, 2)), [ListChange(ListAction.SLICE, 0, (2,), (1, 2, 3))]),
+        (lambda items: items.sort(reverse = True), [ListChange(ListAction.REPLACE, 0, (3, 2, 1), (1, 2, 3))]),
+        (lambda items: items.reverse(), [ListChange(ListAction.REPLACE, 0, (3, 2, 1), (1, 2, 3))]),
+        (lambda items: items.sort(), []),
+        (lambda items: items.extend([]), [])
+    ]) # yapf: disable
+    def test_notifies_changes(change, expected):
+        """BindableList should notify about changed range"""
+        items, plain_items, callback = BindableList([1, 2, 3]), [1, 2, 3], Mock()
+        items.observe_changes(callback)
+
+        change(items)
+        change(plain_items)
+
+        assert items == plain_items
+        assert [args[0] for args, _ in callback.call_args_list] == expected
+
+    @staticmethod
+    @mark.parametrize('index, new_index, expected_items, expected', [
+        (0, 2, [2, 3, 1], [ListChange(ListAction.MOVE, 0, (1,), (), 2)]),
+        (-1, 0, [3, 1, 2], [ListChange(ListAction.MOVE, 2, (3,), (), 0)]),
+        (1, 1, [1, 2, 3], [])
+    ]) # yapf: disable
+    def test_move(index, new_index, expected_items, expected):
+        """move() should move item and notify about it"""
+        items, callback = BindableList([1, 2, 3]), Mock()
+        items.observe_changes(callback)
+
+        items.move(index, new_index)
+
+        assert items == expected_items
+        assert [args[0] for args, _ in callback.call_args_list] == expected
+
+    @staticmethod
+    def test_batch():
+        """BindableList should notify every change made in batch at the end of batch"""
+        items, callback = BindableList([1]), Mock()
+        items.observe_changes(callback)
+
+        with batch():
+            items.append(2)
+            items.pop(0)
+            assert not callback.called
+
+        assert [args[0] for args, _ in callback.call_args_list] == [
+            ListChange(ListAction.INSERT, 1, (2,), ()),
+            ListChange(ListAction.REMOVE, 0, (), (1,))
+        ]
+
+    @staticmethod
+    def test_release_changes():
+        """release_changes() should release callback"""
+        items, callback = BindableList(), Mock()
+        items.observe_changes(callback)
+
+        items.release_changes(callback)
+        items.append(1)
+
+        assert not callback.called
+
+    @staticmethod
+    def test_reads_are_not_recorded():
+        """BindableList reads should not be recorded"""
+        items = BindableList([1])
+
+        with recording() as records:
+            _ = items[0], len(items), items.index(1)
+
+        assert records == set()
@@ -0,0 +1,121 @@
+from multiprocessing import Process
+from unittest.mock import Mock, call
+
+from pytest import fixture, mark, raises
+
+from pyviews.core.binding import BindableRecord, recording
+from pyviews.core.buffer import BufferChange
+from pyviews.core.mirror import MirrorHandle, MirrorWriter, SharedMemory, SharedMirror
+
+pytestmark = mark.skipif(SharedMemory is None, reason = 'shared memory is not supported')
+
+
+@fixture
+def mirror_fixture(request):
+    mirror = SharedMirror({'progress': 0, 'status': 'idle'}, {'frame': 8, 'histogram': 4})
+    writer = MirrorWriter(mirror.handle)
+    request.cls.mirror = mirror
+    request.cls.writer = writer
+    yield
+    writer.close()
+    mirror.close()
+
+
+def _write_in_worker(handle: MirrorHandle):
+    writer = MirrorWriter(handle)
+    writer.set('progress', 100)
+    writer.write('frame', b'worker', 1)
+    writer.close()
+
+
+@mark.usefixtures('mirror_fixture')
+class SharedMirrorTests:
+    """SharedMirror and MirrorWriter tests"""
+
+    mirror: SharedMirror
+    writer: MirrorWriter
+
+    def test_fields(self):
+        """should create value fields and zero-filled buffer fields"""
+        assert (self.mirror.progress, self.mirror.status) == (0, 'idle')
+        assert self.mirror.frame.view == bytes(8)
+        assert self.mirror.histogram.view == bytes(4)
+
+    def test_apply_values(self):
+        """apply_changes() should set values and notify only changed keys"""
+        progress, status = Mock(), Mock()
+        self.mirror.observe('progress', progress)
+        self.mirror.observe('status', status)
+
+        self.writer.set('progress', 10)
+        self.writer.set('progress', 20)
+        self.writer.set('status', 'idle')
+        applied = self.mirror.apply_changes()
+
+        assert applied == 3
+        assert self.mirror.progress == 20
+        assert progress.call_args_list == [call(20, 0)]
+        assert not status.called
+
+    def test_apply_buffer(self):
+        """apply_changes() should notify about buffer ranges written to shared memory"""
+        callback = Mock()
+        self.mirror.frame.observe_changes(callback)
+
+        self.writer.write('frame', b'ab', 1)
+        with self.writer.writable('frame', 5) as view:
+            view[:] = b'xyz'
+        assert self.mirror.frame.view == b'\0ab\0\0xyz'
+        self.mirror.apply_changes()
+
+        assert callback.call_args_list == [call(BufferChange(1, 8))]
+        assert self.mirror.histogram.view == bytes(4)
+
+    def test_apply_limit(self):
+        """apply_changes() should apply passed count of changes"""
+        for progress in range(3):
+            self.writer.set('progress', progress)
+
+        assert self.mirror.apply_changes(2) == 2
+        assert self.mirror.progress == 1
+        assert self.mirror.apply_changes() == 1
+
+    def test_write_out_of_range(self):
+        """write() should not write out of buffer field"""
+        with raises(ValueError):
+            self.writer.write('histogram', b'abc', 2)
+
+    def test_buffer_view_is_readonly(self):
+        """buffer fields should be recorded read-only views of shared memory"""
+        frame = self.mirror.frame
+        with recording() as records:
+            view = self.mirror.frame.view
+
+        assert view.readonly
+        assert records == {BindableRecord(self.mirror, 'frame'), BindableRecord(frame, 'view')}
+
+    def test_worker_process(self):
+        """should apply changes written in other process"""
+        process = Process(target = _write_in_worker, args = (self.mirror.handle,))
+        process.start()
+        process.join(10)
+
+        self.mirror.apply_changes()
+
+        assert process.exitcode == 0
+        assert self.mirror.progress == 100
+        assert self.mirror.frame.view == b'\0worker\0'
+
+
+def test_close():
+    """close() should detach buffer fields"""
+    mirror, callback = SharedMirror(buffers = {'frame': 4}), Mock()
+    view = mirror.frame.view
+    mirror.frame.observe('view', callback)
+
+    mirror.close()
+
+    assert len(mirror.frame) == 0
+    assert callback.called
+    with raises(ValueError):
+        _ = view[0]
@@ -0,0 +1,210 @@
+from unittest.mock import Mock, call
+
+from pytest import mark, raises
+
+from pyviews.core import buffer as buffer_module
+from pyviews.core.binding import (BindableDict, BindableEntity, BindingError, SubscribersStats, get_subscribers_stats,
+                                  observable, recording, use_comparator)
+from pyviews.core.buffer import BindableBuffer
+from pyviews.core.comparators import always_changed
+from pyviews.core.expression import Expression, PathKey, execute
+from pyviews.core.path import get_path_records, observe_path, parse_path
+
+
+class TestBindable(BindableEntity):
+
+    def __init__(self, private, name, value):
+        super().__init__()
+        self._private = private
+        self.name = name
+        self.value = value
+
+
+class PropertyEntity(BindableEntity):
+
+    name = observable('default')
+
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+
+@use_comparator(always_changed, 'key')
+class AlwaysChangedDict(BindableDict):
+    pass
+
+
+class PlainEntity:
+
+    def __init__(self, vm):
+        self.vm = vm
+
+
+class PropertyBindable(BindableEntity):
+
+    def __init__(self, inner):
+        super().__init__()
+        self.inner = inner
+
+    @property
+    def inner_name(self):
+        return self.inner.name
+
+
+@mark.parametrize('code', [
+    'vm.name',
+    'vm.name + vm.value',
+    'prop.name',
+    "entity.vm.name",
+    "items['vm'].name",
+    'vms[0].value',
+    'os.sep',
+    'str'
+]) # yapf: disable
+def test_get_path_records(code: str):
+    """get_path_records() should return same records as recording"""
+    parameters = BindableDict({
+        'vm': TestBindable('private', 'name', 'value'),
+        'entity': PlainEntity(TestBindable('private', 'inner', 'value')),
+        'items': BindableDict({'vm': TestBindable('private', 'item', 'value')}),
+        'vms': [TestBindable('private', 'first', 'value')],
+        'prop': PropertyEntity('value'),
+        'os': __import__('os')
+    })
+    expression = Expression(code)
+    with recording() as records:
+        execute(expression, parameters)
+
+    actual = get_path_records(parameters, expression.paths)
+
+    assert actual == records
+
+
+@mark.parametrize('code, parameters', [
+    ('vm.inner_name', {'vm': PropertyBindable(TestBindable('private', 'name', 'value'))}),
+    ('vm.name', {'vm': Mock()}),
+    ("items['key']", {'items': Mock()}),
+    ('vm', {'vm': TestBindable('private', 'name', 'value')}),
+    ('vm.name.upper', {'vm': TestBindable('private', 'name', 'value')})
+]) # yapf: disable
+def test_get_path_records_returns_none(code, parameters):
+    """get_path_records() should return None if read can't be resolved statically"""
+    expression = Expression(code)
+
+    assert get_path_records(BindableDict(parameters), expression.paths) is None
+
+
+class Selection(BindableEntity):
+
+    def __init__(self, owner):
+        super().__init__()
+        self.owner = owner
+
+
+class ObservePathTests:
+    """observe_path() tests"""
+
+    @staticmethod
+    @mark.parametrize('path, expected', [
+        ('name', (PathKey('name'),)),
+        ('selection.owner.name', (PathKey('selection'), PathKey('owner'), PathKey('name'))),
+        ("items['key'].name", (PathKey('items'), PathKey('key', True), PathKey('name'))),
+        ('[0].name', (PathKey(0, True), PathKey('name')))
+    ]) # yapf: disable
+    def test_parse_path(path, expected):
+        """parse_path() should return path relative to root"""
+        assert parse_path(path) == expected
+
+    @staticmethod
+    @mark.parametrize('path', ['name()', 'items[key]', 'one + two'])
+    def test_parse_path_raises(path):
+        """parse_path() should raise for not path"""
+        with raises(BindingError):
+            parse_path(path)
+
+    @staticmethod
+    def test_value():
+        """observe_path() should return observer with path value"""
+        root = Selection(Selection(TestBindable('private', 'name', 'value')))
+
+        observer = observe_path(root, 'owner.owner.name', Mock())
+
+        assert observer.value == 'name'
+
+    @staticmethod
+    @mark.parametrize('change, expected', [
+        (lambda root: setattr(root.owner.owner, 'name', 'new'), 'new'),
+        (lambda root: setattr(root.owner, 'owner', TestBindable('', 'other', '')), 'other'),
+        (lambda root: setattr(root, 'owner', Selection(TestBindable('', 'another', ''))), 'another'),
+        (lambda root: setattr(root, 'owner', None), None)
+    ]) # yapf: disable
+    def test_calls_callback(change, expected):
+        """observe_path() should call callback after path value is changed"""
+        root, callback = Selection(Selection(TestBindable('private', 'name', 'value'))), Mock()
+        observe_path(root, 'owner.owner.name', callback)
+
+        change(root)
+
+        assert callback.call_args == call(expected, 'name')
+
+    @staticmethod
+    def test_resubscribes_suffix():
+        """observe_path() should resubscribe only path keys after changed one"""
+        old_owner, new_owner = TestBindable('', 'old', ''), TestBindable('', 'new', '')
+        selection, callback = Selection(old_owner), Mock()
+        root = Selection(selection)
+        observe_path(root, 'owner.owner.name', callback)
+
+        selection.owner = new_owner
+        old_owner.name = 'old changed'
+        new_owner.name = 'new changed'
+
+        assert callback.call_args_list == [call('new', 'old'), call('new changed', 'new')]
+        assert get_subscribers_stats(root) == {'owner': SubscribersStats(1, 0)}
+        assert get_subscribers_stats(old_owner)['name'] == SubscribersStats(0, 0)
+
+    @staticmethod
+    def test_calls_callback_for_same_value():
+        """observe_path() should call callback if last path key comparator treats same value as changed"""
+        items, callback = [1], Mock()
+        root = Selection(AlwaysChangedDict({'key': items}))
+        observe_path(root, "owner['key']", callback)
+
+        root.owner['key'] = items
+
+        assert callback.call_args_list == [call(items, items)]
+
+    @staticmethod
+    @mark.skipif(not buffer_module._READONLY_VIEWS, reason = 'read-only memory views are not supported')
+    def test_calls_callback_for_written_buffer():
+        """observe_path() should call callback after buffer is written"""
+        buffer, callback = BindableBuffer(3), Mock()
+        root = Selection(buffer)
+        observe_path(root, 'owner.view', callback)
+
+        buffer.write(b'a')
+
+        assert callback.call_args_list == [call(buffer.view, buffer.view)]
+
+    @staticmethod
+    def test_observes_missing_path():
+        """observe_path() should observe readable path keys if path can't be read"""
+        root, callback = Selection(None), Mock()
+        observer = observe_path(root, 'owner.name', callback)
+
+        root.owner = TestBindable('', 'name', '')
+
+        assert observer.value == 'name'
+        assert callback.call_args == call('name', None)
+
+    @staticmethod
+    def test_release():
+        """release() should release all path keys"""
+        root, callback = Selection(Selection(TestBindable('private', 'name', 'value'))), Mock()
+        observer = observe_path(root, 'owner.owner.name', callback)
+
+        observer.release()
+        root.owner.owner.name = 'new'
+        root.owner = None
+
+        assert not callback.called
@@ -1,3 +1,7 @@
+import gc
+import tracemalloc
+from functools import partial
+from typing import Callable
 from unittest.mock import Mock, call
 
 from pytest import fixture, mark, raises
@@ -216,3 +220,65 @@ class NodeTests:
         node.destroy()
 
         assert node.on_destroy.call_args == call(node)
+
+
+def _render_tree(root: Node, count: int) -> list:
+    nodes = []
+    for _ in range(count):
+        parent = Node(root.xml_node, NodeGlobals(root.node_globals))
+        parent.node_globals['item'] = None
+        root.add_child(parent)
+        nodes.append(parent)
+        for _ in range(4):
+            child = Node(root.xml_node, NodeGlobals(parent.node_globals))
+            parent.add_child(child)
+            nodes.append(child)
+    return nodes
+
+
+class _PlainNode:
+    """Node with plain globals copied from parent, used as memory baseline"""
+
+    def __init__(self, parent_globals: dict):
+        self.children, self.bindings = [], []
+        self.node_globals = {**parent_globals, 'node': self}
+        self.set_attr = partial(setattr, self)
+
+
+def _render_plain_tree(root: _PlainNode, count: int) -> list:
+    nodes = []
+    for _ in range(count):
+        parent = _PlainNode(root.node_globals)
+        parent.node_globals['item'] = None
+        root.children.append(parent)
+        nodes.append(parent)
+        for _ in range(4):
+            child = _PlainNode(parent.node_globals)
+            parent.children.append(child)
+            nodes.append(child)
+    return nodes
+
+
+def _get_bytes_per_item(create: Callable[[], list]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        items = create()
+        return tracemalloc.get_traced_memory()[0] / len(items)
+    finally:
+        tracemalloc.stop()
+
+
+def test_node_memory(record_property):
+    """node with globals subscribed to parent should stay compact comparing to node with plain globals"""
+    root, plain_root = Node(XmlNode('pyviews.core.rendering', 'Node')), _PlainNode({})
+    _render_tree(root, 10)
+    _render_plain_tree(plain_root, 10)
+
+    bytes_per_node = _get_bytes_per_item(lambda: _render_tree(root, 1000))
+    plain_bytes_per_node = _get_bytes_per_item(lambda: _render_plain_tree(plain_root, 1000))
+    record_property('bytes_per_node', bytes_per_node)
+    record_property('plain_bytes_per_node', plain_bytes_per_node)
+
+    assert bytes_per_node < 3 * plain_bytes_per_node, \
+        f'{bytes_per_node:.0f} bytes per node, {plain_bytes_per_node:.0f} bytes per plain node'
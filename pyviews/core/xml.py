@@ -7,6 +7,7 @@ from xml.parsers.expat import ExpatError, ParserCreate, XMLParserType
 from injectool import dependency
 
 from pyviews.core.error import PyViewsError, ViewInfo
+from pyviews.core.expression import AttrBinding
 
 
 class XmlAttr(NamedTuple):
@@ -14,6 +15,7 @@ class XmlAttr(NamedTuple):
     name: str
     value: Optional[str] = None
     namespace: Optional[str] = None
+    binding: Optional[AttrBinding] = None
 
 
 class XmlNode(NamedTuple):
@@ -4,33 +4,77 @@ from typing import Any, Callable, Optional
 
 from injectool import resolve
 
-from pyviews.binding.binder import Binder, BindingContext
-from pyviews.core.expression import is_expression, parse_expression
+from pyviews.binding.binder import Binder, BindingContext, ExpressionResult
+from pyviews.core.binding import batch_recording
+from pyviews.core.expression import AttrBinding, Expression, ExpressionError, execute_many, parse_attr_value
 from pyviews.core.reflection import import_path
 from pyviews.core.rendering import Node, RenderingContext, Setter
 from pyviews.core.xml import XmlAttr, XmlNode
 from pyviews.rendering.pipeline import render
 
 
+_EXECUTED_BINDINGS = ('once', 'oneway')
+
+
 def apply_attributes(node: Node, _: RenderingContext):
-    """Rendering pipe: applies xml attributes to instance node and setups bindings"""
+    """
+    Rendering pipe: applies xml attributes to instance node and setups bindings.
+    Expressions of once and oneway bindings are executed before attribute is applied,
+    value and recorded reads are passed to binding so expression is not executed again
+    """
     for attr in node.xml_node.attrs:
-        apply_attribute(node, attr)
+        binding = _get_binding(attr)
+        expression = _get_executed_expression(binding)
+        context = None
+        if expression is not None:
+            context = BindingContext({'expression': expression, 'expression_result': _execute(node, expression)})
+        _apply_attribute(node, attr, get_setter(attr), binding, context)
 
 
 def apply_attribute(node: Node, attr: XmlAttr, setter: Optional[Setter] = None):
     """Maps xml attribute to instance node property and setups bindings"""
     setter = get_setter(attr) if setter is None else setter
-    stripped_value = attr.value.strip() if attr.value else ''
-    if is_expression(stripped_value):
-        (binding_type, expr_body) = parse_expression(stripped_value)
-        binder = resolve(Binder)
-        binder.bind(
-            binding_type,
-            BindingContext({'node': node, 'expression_body': expr_body, 'setter': setter, 'xml_attr': attr})
-        )
-    else:
+    _apply_attribute(node, attr, setter, _get_binding(attr))
+
+
+def _get_binding(attr: XmlAttr) -> AttrBinding:
+    return attr.binding if attr.binding is not None else parse_attr_value(attr.value)
+
+
+def _get_executed_expression(binding: AttrBinding) -> Optional[Expression]:
+    if binding.binding_type not in _EXECUTED_BINDINGS:
+        return None
+    expression = binding.expression
+    if expression is None:
+        try:
+            expression = Expression(binding.body)
+        except ExpressionError:
+            return None
+    return expression if binding.binding_type == 'once' or expression.path is None else None
+
+
+def _execute(node: Node, expression: Expression) -> ExpressionResult:
+    with batch_recording() as recording:
+        value = execute_many((expression,), node.node_globals, recording.next)[0]
+    return ExpressionResult(value, recording.records[0])
+
+
+def _apply_attribute(
+    node: Node,
+    attr: XmlAttr,
+    setter: Setter,
+    binding: AttrBinding,
+    context: Optional[BindingContext] = None
+):
+    if binding.binding_type is None:
         setter(node, attr.name, attr.value)
+        return
+    context = BindingContext() if context is None else context
+    context.update({'node': node, 'expression_body': binding.body, 'setter': setter, 'xml_attr': attr})
+    if binding.expression is not None:
+        context.expression = binding.expression
+    binder = resolve(Binder)
+    binder.bind(binding.binding_type, context)
 
 
 def get_setter(attr: XmlAttr) -> Setter:
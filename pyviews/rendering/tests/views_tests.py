@@ -0,0 +1,104 @@
+from unittest.mock import patch
+
+from injectool import add_singleton
+from pytest import fixture, mark, raises
+
+from pyviews.core import expression as expression_module
+from pyviews.core.expression import AttrBinding
+from pyviews.core.xml import XmlAttr, XmlNode
+from pyviews.rendering import views
+from pyviews.rendering.views import ViewError, compile_attributes, get_view_root, warm_up
+
+_VIEW = '''<Container xmlns="pyviews.containers" value="plain" one="{vm.name}" two="once:{1 + 1}">
+    <Container three="inline:{bind}:{value}" />
+</Container>'''
+
+
+@fixture
+def views_fixture(request, tmp_path):
+    add_singleton('views_folder', str(tmp_path))
+    add_singleton('view_ext', 'xml')
+    (tmp_path / 'view.xml').write_text(_VIEW)
+    with patch.object(views, '_XML_CACHE', {}):
+        yield
+
+
+@mark.usefixtures('container_fixture', 'views_fixture')
+class GetViewRootTests:
+    """get_view_root() tests"""
+
+    def test_parses_view(self):
+        """get_view_root() should return parsed view root"""
+        root = get_view_root('view')
+
+        assert (root.namespace, root.name) == ('pyviews.containers', 'Container')
+        assert [attr.name for attr in root.attrs] == ['value', 'one', 'two']
+        assert len(root.children) == 1
+
+    def test_uses_cache(self):
+        """get_view_root() should return cached root"""
+        assert get_view_root('view') is get_view_root('view')
+
+    def test_compiles_attributes(self):
+        """get_view_root() should return root with classified attributes"""
+        root = get_view_root('view')
+
+        assert [attr.binding.binding_type for attr in root.attrs] == [None, 'oneway', 'once']
+        assert root.attrs[1].binding.expression.code == 'vm.name'
+
+    def test_raises_for_missing_view(self):
+        """get_view_root() should raise ViewError if view file is not found"""
+        with raises(ViewError):
+            get_view_root('missing')
+
+
+@mark.usefixtures('container_fixture', 'views_fixture')
+class WarmUpTests:
+    """warm_up() tests"""
+
+    def test_parses_views(self, tmp_path):
+        """warm_up() should parse all views from views folder to cache"""
+        (tmp_path / 'nested').mkdir()
+        (tmp_path / 'nested' / 'inner.xml').write_text(_VIEW)
+        (tmp_path / 'other.txt').write_text('not a view')
+
+        view_names = warm_up().result(timeout = 5)
+
+        assert sorted(view_names) == ['nested/inner', 'view']
+        assert get_view_root('nested/inner') is views._XML_CACHE[str(tmp_path / 'nested' / 'inner.xml')]
+
+    def test_compiles_expressions(self):
+        """warm_up() should compile expression functions"""
+        warm_up().result(timeout = 5)
+
+        expression = get_view_root('view').attrs[1].binding.expression
+        assert expression._function is not expression_module._NOT_COMPILED
+
+    def test_uses_cached_view(self):
+        """warm_up() should not parse view again if it is cached"""
+        root = get_view_root('view')
+
+        warm_up().result(timeout = 5)
+
+        assert get_view_root('view') is root
+
+    def test_skips_invalid_views(self, tmp_path):
+        """warm_up() should skip views that can't be parsed"""
+        (tmp_path / 'invalid.xml').write_text('<Container')
+
+        view_names = warm_up().result(timeout = 5)
+
+        assert view_names == ['view']
+
+
+def test_compile_attributes():
+    """compile_attributes() should classify attributes of all nodes and compile expressions"""
+    child = XmlNode('namespace', 'child', attrs = [XmlAttr('three', 'inline:{bind}:{value}')])
+    root = XmlNode('namespace', 'root', children = [child], attrs = [XmlAttr('one', 'value'), XmlAttr('two', '{1}')])
+
+    actual = compile_attributes(root)
+
+    assert [attr.binding for attr in actual.attrs][0] == AttrBinding()
+    assert actual.attrs[1].binding[:2] == ('oneway', '1')
+    assert actual.attrs[1].binding.expression.code == '1'
+    assert actual.children[0].attrs[0].binding == AttrBinding('inline', 'bind}:{value', None)
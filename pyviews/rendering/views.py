@@ -1,10 +1,16 @@
 """View logic"""
 
-from os.path import join
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from os import walk
+from os.path import join, relpath, sep, splitext
+from threading import Lock
+from typing import Generator, List, Optional
 
 from injectool import resolve
 
 from pyviews.core.error import PyViewsError
+from pyviews.core.expression import parse_attr_value
 from pyviews.core.xml import XmlNode, parse
 
 
@@ -13,22 +19,78 @@ class ViewError(PyViewsError):
 
 
 _XML_CACHE = {}
+_XML_CACHE_LOCK = Lock()
 
 
 def get_view_root(view_name: str) -> XmlNode:
     """Parses xml file and return root XmlNode"""
     path = join(resolve('views_folder'), f'{view_name}.{resolve("view_ext")}')
-    if path not in _XML_CACHE:
-        parse_root(path, view_name)
-    return _XML_CACHE[path]
+    try:
+        return _XML_CACHE[path]
+    except KeyError:
+        return parse_root(path, view_name)
 
 
-def parse_root(path: str, view_name: str):
+def parse_root(path: str, view_name: str) -> XmlNode:
+    """Parses xml file, compiles attributes and stores result to cache"""
     try:
         with open(path, 'rb') as xml_file:
-            _XML_CACHE[path] = parse(xml_file, view_name)
+            root = compile_attributes(parse(xml_file, view_name))
+        with _XML_CACHE_LOCK:
+            return _XML_CACHE.setdefault(path, root)
     except FileNotFoundError as exc:
         error = ViewError('View is not found')
         error.add_info('View name', view_name)
         error.add_info('Path', path)
         raise error from exc
+
+
+def compile_attributes(xml_node: XmlNode) -> XmlNode:
+    """Returns xml node tree with classified attributes and compiled expressions"""
+    attrs = [attr._replace(binding = parse_attr_value(attr.value, True)) for attr in xml_node.attrs]
+    children = [compile_attributes(child) for child in xml_node.children]
+    return xml_node._replace(attrs = attrs, children = children)
+
+
+def warm_up(views_folder: Optional[str] = None, view_ext: Optional[str] = None) -> Future:
+    """
+    Parses all views from views folder and compiles their expressions in background thread.
+    Returned future is resolved with names of warmed views
+    """
+    views_folder = views_folder if views_folder else resolve('views_folder')
+    view_ext = view_ext if view_ext else resolve('view_ext')
+    executor = ThreadPoolExecutor(max_workers = 1, thread_name_prefix = 'pyviews_warm_up')
+    try:
+        return executor.submit(copy_context().run, _warm_up, views_folder, view_ext)
+    finally:
+        executor.shutdown(wait = False)
+
+
+def _warm_up(views_folder: str, view_ext: str) -> List[str]:
+    view_names = []
+    for view_name in _get_view_names(views_folder, view_ext):
+        path = join(views_folder, f'{view_name}.{view_ext}')
+        try:
+            root = _XML_CACHE[path] if path in _XML_CACHE else parse_root(path, view_name)
+        except PyViewsError:
+            continue
+        _compile_functions(root)
+        view_names.append(view_name)
+    return view_names
+
+
+def _get_view_names(views_folder: str, view_ext: str) -> Generator[str, None, None]:
+    for folder, _, files in walk(views_folder):
+        for file_name in sorted(files):
+            name, ext = splitext(file_name)
+            if ext == f'.{view_ext}':
+                yield relpath(join(folder, name), views_folder).replace(sep, '/')
+
+
+def _compile_functions(xml_node: XmlNode):
+    for attr in xml_node.attrs:
+        expression = attr.binding.expression if attr.binding else None
+        if expression is not None:
+            _ = expression.function, expression.paths, expression.path
+    for child in xml_node.children:
+        _compile_functions(child)
@@ -6,6 +6,8 @@ from pytest import fixture, mark
 from pyviews.containers import (Container, For, If, View, render_container_children, render_for_items, render_if,
                                 render_view_content, rerender_on_condition_change, rerender_on_items_change,
                                 rerender_on_view_change)
+from pyviews.core.binding import batch
+from pyviews.core.lists import BindableList
 from pyviews.core.rendering import Node, NodeGlobals, RenderingContext
 from pyviews.core.xml import XmlNode
 from pyviews.rendering import context
@@ -220,6 +222,114 @@ class RenderForItemsTests:
                 }
 
 
+@mark.usefixtures('container_fixture', 'for_fixture')
+class ForListChangesTests:
+    """For BindableList changes tests"""
+
+    for_node: For
+    render: Mock
+
+    def _render(self, items: list, xml_children: list):
+        self.for_node.items = BindableList(items)
+        self.for_node._xml_node = self.for_node._xml_node._replace(children = xml_children)
+        render_for_items(self.for_node, RenderingContext())
+        rerender_on_items_change(self.for_node, RenderingContext())
+        self.render.reset_mock()
+
+    def _assert_children(self, xml_children: list):
+        actual = iter(self.for_node.children)
+        for index, item in enumerate(self.for_node.items):
+            for xml_node in xml_children:
+                child = next(actual)
+
+                assert child.xml_node == xml_node
+                assert (child.node_globals['index'], child.node_globals['item']) == (index, item)
+        assert next(actual, None) is None
+
+    @mark.parametrize('change, rendered_count', [
+        (lambda items: items.append('new'), 1),
+        (lambda items: items.insert(0, 'new'), 1),
+        (lambda items: items.extend(['one', 'two']), 2),
+        (lambda items: items.pop(1), 0),
+        (lambda items: items.remove('item0'), 0),
+        (lambda items: items.__setitem__(1, 'new'), 0),
+        (lambda items: items.__setitem__(slice(0, 2), ['new']), 1),
+        (lambda items: items.move(0, 2), 0),
+        (lambda items: items.move(2, 0), 0),
+        (lambda items: items.reverse(), 0),
+        (lambda items: items.clear(), 0)
+    ]) # yapf: disable
+    @mark.parametrize('xml_children', [['node1'], ['node1', 'node2']])
+    def test_updates_changed_children(self, change, rendered_count, xml_children):
+        """For should render only children of new items and update indexes"""
+        self._render(['item0', 'item1', 'item2'], xml_children)
+
+        change(self.for_node.items)
+
+        assert self.render.call_count == rendered_count * len(xml_children)
+        self._assert_children(xml_children)
+
+    @mark.parametrize('xml_children', [['node1'], ['node1', 'node2']])
+    def test_updates_children_after_batch(self, xml_children):
+        """For should apply every list change made in batch"""
+        self._render(['item0', 'item1', 'item2'], xml_children)
+
+        with batch():
+            self.for_node.items.insert(0, 'new')
+            self.for_node.items.pop()
+
+        self._assert_children(xml_children)
+
+    def test_keeps_existing_children(self):
+        """For should not rerender children of not changed items"""
+        self._render(['item0', 'item1'], ['node1'])
+        children = self.for_node.children.copy()
+
+        self.for_node.items.insert(1, 'new')
+
+        assert [self.for_node.children[0], self.for_node.children[2]] == children
+
+    def test_destroys_removed_children(self):
+        """For should destroy children of removed items"""
+        self._render(['item0', 'item1'], ['node1'])
+        removed = self.for_node.children[0]
+        removed.destroy = Mock()
+
+        self.for_node.items.pop(0)
+
+        assert removed.destroy.called
+
+    def test_releases_previous_list(self):
+        """For should stop handling changes of previous items list"""
+        self._render(['item0'], ['node1'])
+        previous = self.for_node.items
+        self.for_node.items = BindableList(['item1'])
+
+        previous.append('new')
+
+        self._assert_children(['node1'])
+
+    def test_observes_equal_list(self):
+        """For should handle changes of new items list that is equal to previous one"""
+        self._render([1], ['node1'])
+        self.for_node.items = BindableList([1])
+
+        self.for_node.items.append(2)
+
+        assert len(self.for_node.children) == 2
+        self._assert_children(['node1'])
+
+    def test_releases_on_destroy(self):
+        """For should stop handling list changes after destroy"""
+        self._render(['item0'], ['node1'])
+        items = self.for_node.items
+
+        self.for_node.destroy()
+        items.append('new')
+
+        assert not self.render.called
+
+
 class IfTests:
     """If node tests"""
 
@@ -7,25 +7,125 @@ from pyviews import pipes, setters
 from pyviews.binding.binder import Binder, BindingContext
 from pyviews.binding.expression import bind_setter_to_expression
 from pyviews.binding.once import run_once
-from pyviews.core.rendering import Node
+from pyviews.binding.tests.common import InnerViewModel
+from pyviews.core.expression import AttrBinding, Expression, ExpressionError
+from pyviews.core.rendering import InstanceNode, Node, NodeGlobals
 from pyviews.core.xml import XmlAttr, XmlNode
 from pyviews.pipes import apply_attribute, apply_attributes, call_set_attr, get_setter, render_children
 from pyviews.rendering.context import RenderingContext
 from pyviews.rendering.pipeline import render
 
 
-@patch(pipes.__name__ + '.apply_attribute')
-def test_apply_attributes(apply_attribute_mock):
-    """should call apply_attribute for every attribute"""
-    xml_node = Mock()
-    xml_node.attrs = [Mock(), Mock()]
-    node = Node(xml_node)
-    context = RenderingContext()
+@fixture
+def apply_attributes_fixture(request):
+    setter_mock = Mock()
+    request.cls.setter_mock = setter_mock
+    with patch(f'{pipes.__name__}.get_setter', Mock(return_value = setter_mock)):
+        binder = Binder()
+        binder.add_rule('once', run_once)
+        binder.add_rule('oneway', bind_setter_to_expression)
+        add_singleton(Binder, binder)
+        yield
+
+
+@mark.usefixtures('container_fixture', 'apply_attributes_fixture')
+class ApplyAttributesTests:
+    """apply_attributes() tests"""
+
+    setter_mock: Mock
+
+    def test_applies_attributes(self):
+        """should apply every attribute"""
+        attrs = [XmlAttr('key', 'value'), XmlAttr('one', '{1}'), XmlAttr('two', 'once:{value + 1}')]
+        node = Node(XmlNode('', '', attrs = attrs))
+        node.node_globals['value'] = 1
+
+        apply_attributes(node, RenderingContext())
+
+        assert self.setter_mock.call_args_list == [
+            call(node, 'key', 'value'), call(node, 'one', 1), call(node, 'two', 2)
+        ]
+
+    def test_executes_expressions_once(self):
+        """should pass result of executed expression to binding"""
+        attrs = [XmlAttr('one', '{count()}'), XmlAttr('two', 'once:{count() + 1}')]
+        node = Node(XmlNode('', '', attrs = attrs))
+        node.node_globals['count'] = Mock(return_value = 1)
+
+        apply_attributes(node, RenderingContext())
+
+        assert node.node_globals['count'].call_count == 2
+        assert self.setter_mock.call_args_list == [call(node, 'one', 1), call(node, 'two', 2)]
+
+    def test_binds_recorded_dependencies(self):
+        """should subscribe oneway binding to keys read during batch execution"""
+        node = Node(XmlNode('', '', attrs = [XmlAttr('one', '{vm.int_value + 1}'), XmlAttr('two', '{value}')]))
+        node.node_globals['vm'] = InnerViewModel(1, '')
+        node.node_globals['value'] = 1
+
+        apply_attributes(node, RenderingContext())
+        self.setter_mock.reset_mock()
+        node.node_globals['vm'].int_value = 2
+
+        assert self.setter_mock.call_args_list == [call(node, 'one', 3)]
+
+    def test_raises_expression_error(self):
+        """should raise error for failed expression"""
+        node = Node(XmlNode('', '', attrs = [XmlAttr('one', '{1}'), XmlAttr('two', '{missing_value}')]))
 
-    apply_attributes(node, context)
+        with raises(ExpressionError):
+            apply_attributes(node, RenderingContext())
 
-    calls = [call(node, attr) for attr in xml_node.attrs]
-    assert apply_attribute_mock.call_args_list == calls
+        assert self.setter_mock.call_args_list == [call(node, 'one', 1)]
+
+    def test_executes_failed_expression_once(self):
+        """should raise error of failed expression without executing it again"""
+        node = Node(XmlNode('', '', attrs = [XmlAttr('one', '{fail() + 1}')]))
+        node.node_globals['fail'] = Mock(side_effect = ValueError())
+
+        with raises(ExpressionError):
+            apply_attributes(node, RenderingContext())
+
+        assert node.node_globals['fail'].call_count == 1
+
+
+@mark.usefixtures('container_fixture')
+def test_apply_attributes_executes_in_attributes_order():
+    """apply_attributes() should execute expressions after globals are changed by previous attributes"""
+    binder = Binder()
+    binder.add_rule('once', run_once)
+    binder.add_rule('oneway', bind_setter_to_expression)
+    add_singleton(Binder, binder)
+    attrs = [
+        XmlAttr('x', '{2}', f'{setters.__name__}.set_global'),
+        XmlAttr('y', 'once:{x}', f'{setters.__name__}.set_global'),
+        XmlAttr('z', '{x + 0}', f'{setters.__name__}.set_global')
+    ]
+    node = Node(XmlNode('', '', attrs = attrs), NodeGlobals(NodeGlobals({'x': 1})))
+
+    apply_attributes(node, RenderingContext())
+
+    assert (node.node_globals['y'], node.node_globals['z']) == (2, 2)
+
+
+class SizedInstance:
+
+    width = 0
+
+
+@mark.usefixtures('container_fixture')
+def test_apply_attributes_reads_applied_attributes():
+    """apply_attributes() should execute expressions after previous attributes are applied to instance"""
+    binder = Binder()
+    binder.add_rule('once', run_once)
+    binder.add_rule('oneway', bind_setter_to_expression)
+    add_singleton(Binder, binder)
+    attrs = [XmlAttr('width', '{2 * 50}'), XmlAttr('half', 'once:{node.instance.width // 2}')]
+    node = InstanceNode(SizedInstance(), XmlNode('', '', attrs = attrs))
+
+    apply_attributes(node, RenderingContext())
+
+    assert node.instance.half == 50
 
 
 @fixture
@@ -94,6 +194,20 @@ class ApplyAttributeTests:
         assert binder.bind.call_args == call(binding_type, binding_context)
 
 
+    def test_uses_compiled_expression(self):
+        """should pass compiled expression of attribute to binder"""
+        node = Node(Mock())
+        binder = Mock()
+        add_singleton(Binder, binder)
+        expression = Expression('vm.prop')
+        xml_attr = XmlAttr('key', '{vm.prop}', binding = AttrBinding('oneway', 'vm.prop', expression))
+
+        apply_attribute(node, xml_attr)
+
+        assert binder.bind.call_args[0][0] == 'oneway'
+        assert binder.bind.call_args[0][1].expression is expression
+
+
 class GetSetterTests:
     """get_setter() tests"""
 